@@ -8,17 +8,18 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import Generator, List
+from typing import Generator, List, Union
 
 from lexnlp.extract.all_locales.languages import Locale
-from lexnlp.extract.en.dict_entities import DictionaryEntry, find_dict_entities, conflicts_take_first_by_id
+from lexnlp.extract.en.dict_entities import DictionaryEntry, find_dict_entities, conflicts_take_first_by_id, \
+    DictionaryIndex
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
 
 
 def get_court_annotations(
         locale: str,
         text: str,
-        court_config_list: List[DictionaryEntry],
+        court_config_list: Union[List[DictionaryEntry], DictionaryIndex],
         priority: bool = False,
         text_locales: List[str] = (),
         simplified_normalization: bool = False) -> Generator[CourtAnnotation, None, None]:
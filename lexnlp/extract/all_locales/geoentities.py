@@ -8,10 +8,10 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import Generator, List, Optional, Tuple, Dict
+from typing import Generator, List, Optional, Tuple, Dict, Union
 
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
-from lexnlp.extract.en.dict_entities import DictionaryEntry
+from lexnlp.extract.en.dict_entities import DictionaryEntry, DictionaryIndex
 from lexnlp.extract.all_locales.languages import LANG_EN, LANG_DE, DEFAULT_LANGUAGE, Locale
 from lexnlp.extract.en.geoentities import get_geoentity_annotations as get_geoentity_annotations_en
 from lexnlp.extract.de.geoentities import get_geoentity_annotations as get_geoentity_annotations_de
@@ -26,7 +26,7 @@ ROUTINE_BY_LOCALE = {
 def get_geoentity_annotations(
         locale: str,
         text: str,
-        geo_config_list: List[DictionaryEntry],
+        geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
         conflict_resolving_field: str = 'none',
         priority_direction: str = 'asc',
         text_languages: List[str] = None,
@@ -7,14 +7,17 @@ __email__ = "support@contraxsuite.com"
 
 
 import copy
+import datetime
+import itertools
 import logging
 
 import dateparser
 import regex as re
 from dateutil import tz, parser
-from typing import Tuple, List, Dict, Optional
+from typing import Generator, Tuple, List, Dict, Optional
 
 from lexnlp.extract.all_locales.languages import Locale
+from lexnlp.utils.lru_cache import LruCache
 
 
 logger = logging.getLogger('datefinder')
@@ -189,34 +192,80 @@ class DateFinder:
         "central": "CST",
     }
 
+    ## Fragments with fewer date tokens (not counting the delimiters) are skipped
+    MIN_FRAGMENT_MATCHES = 2
+
     ## Characters that can be removed from ends of matched strings
     STRIP_CHARS = ' \n\t:-.,_'
 
+    ## Parsed date strings shared by the finders of the process, see parse_date_string
+    PARSE_CACHE = LruCache(10000)
+
+    ## Complete dates of the common shapes parsed without dateparser, see parse_common_date
+    MONTH_NUMBERS = {
+        'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6, 'july': 7,
+        'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+        'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    }
+    MONTH_NAMES_PATTERN = '|'.join(sorted(MONTH_NUMBERS, key=len, reverse=True))
+    ## English locales where dateparser reads the month before the day
+    COMMON_DATE_LOCALE_CODES = {'EN', 'US'}
+    ## Years read as they are: dateparser and dateutil move "0032" or "95" to another century
+    COMMON_YEAR_PATTERN = r'(?:1[3-9]|2\d)\d\d'
+
+    ## 12/31/2020, 12-31-2020, 12.31.2020 or 31/12/2020 (a day over 12 goes first)
+    NUMERIC_DATE_REGEX = re.compile(
+        r'(?P<first>\d{{1,2}})(?P<delimiter>[/.\-])(?P<second>\d{{1,2}})(?P=delimiter)(?P<year>{year})'.format(
+            year=COMMON_YEAR_PATTERN))
+    ## "-1200" could be read as a UTC offset (-hhmm) by dateparser
+    TIMEZONE_OFFSET_YEAR_REGEX = re.compile(r'1[0-4][0-5]\d')
+    ## 2020-12-31
+    ISO_DATE_REGEX = re.compile(r'(?P<year>{year})-(?P<month>\d{{1,2}})-(?P<day>\d{{1,2}})'.format(
+        year=COMMON_YEAR_PATTERN))
+    ## December 31, 2020 or Dec. 31st 2020
+    MONTH_DAY_YEAR_REGEX = re.compile(
+        r'(?P<month>{months})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<year>{year})'.format(
+            months=MONTH_NAMES_PATTERN, year=COMMON_YEAR_PATTERN), re.IGNORECASE)
+    ## 31 December 2020 or 5th May, 2019 ("5th day of May, 2019" as get_raw_dates cleans it up)
+    DAY_MONTH_YEAR_REGEX = re.compile(
+        r'(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<month>{months})\.?,?\s+(?P<year>{year})'.format(
+            months=MONTH_NAMES_PATTERN, year=COMMON_YEAR_PATTERN), re.IGNORECASE)
+
     def __init__(self, base_date=None):
         self.base_date = base_date
 
     def tokenize_string(self, text: str) -> List[Tuple[str, str, Dict[str, List[str]]]]:
+        """
+        Split the whole text into the DATE_REGEX matches and the text between them.
+        See iter_date_tokens for the tokens as offsets.
+        """
         last_index: int = 0
         items: List[Tuple[str, str, Dict[str, List[str]]]] = []
 
-        for match in self.DATE_REGEX.finditer(text):
-            match_str = match.group(0)
-            indices = match.span(0)
-            captures = {k: v for k, v in match.capturesdict().items() if v}
-            for capt_key in captures:
-                captures[capt_key] = [c.strip() for c in captures[capt_key]]
-            group = self.get_token_group(captures)
-
-            if indices[0] > last_index:
-                items.append((text[last_index:indices[0]], '', {}))
-            items.append((match_str, group, captures))
-            last_index = indices[1]
+        for start, end, group, captures in self.iter_date_tokens(text):
+            if start > last_index:
+                items.append((text[last_index:start], '', {}))
+            items.append((text[start:end], group, captures))
+            last_index = end
         if last_index < len(text):
             items.append((text[last_index:len(text)], '', {}))
         return items
 
+    def iter_date_tokens(self,
+                         text: str,
+                         start: int = 0,
+                         end: Optional[int] = None) -> Generator[Tuple[int, int, str, Dict[str, List[str]]], None, None]:
+        """
+        Find the DATE_REGEX matches within text[start:end] without copying the text.
+        :return: (start, end, group, captures) of each match
+        """
+        for match in self.DATE_REGEX.finditer(text, start, len(text) if end is None else end):
+            captures = {k: [c.strip() for c in v] for k, v in match.capturesdict().items() if v}
+            match_start, match_end = match.span(0)
+            yield match_start, match_end, self.get_token_group(captures), captures
+
     def merge_tokens(self, tokens: List[Tuple[str, str]]) -> List[DateFragment]:
-        MIN_MATCHES = 2
         fragments: List[DateFragment] = []
         frag = DateFragment()
 
@@ -228,7 +277,7 @@ class DateFinder:
             tok_text, group, tok_capts = token[0], token[1], token[2]
             if not group:
                 if frag.indices[1] > 0:
-                    if frag.matches_count >= MIN_MATCHES:
+                    if frag.matches_count >= self.MIN_FRAGMENT_MATCHES:
                         fragments.append(frag)
                 frag = DateFragment()
                 start_char = total_chars
@@ -251,7 +300,7 @@ class DateFinder:
 
             start_char = total_chars
 
-        if frag.matches_count >= MIN_MATCHES:  # frag.matches
+        if frag.matches_count >= self.MIN_FRAGMENT_MATCHES:  # frag.matches
             fragments.append(frag)
 
         for frag in fragments:
@@ -261,6 +310,46 @@ class DateFinder:
 
         return fragments
 
+    def iter_fragments(self,
+                       text: str,
+                       start: int = 0,
+                       end: Optional[int] = None) -> Generator[DateFragment, None, None]:
+        """
+        merge_tokens(tokenize_string(text[start:end])) yielding the fragments one by one
+        and copying only the fragments' text. The fragments' indices are text's offsets.
+        """
+        frag = None  # type: Optional[DateFragment]
+        for tok_start, tok_end, group, tok_capts in self.iter_date_tokens(text, start, end):
+            if frag is not None and (not group or tok_start > frag.indices[1]):
+                if frag.matches_count >= self.MIN_FRAGMENT_MATCHES:
+                    yield self.complete_fragment(text, frag)
+                frag = None
+            if not group:
+                continue
+
+            if frag is None:
+                frag = DateFragment()
+                frag.indices = (tok_start, tok_end)
+            else:
+                frag.indices = (frag.indices[0], tok_end)
+            if group != 'delimiters':
+                frag.matches_count += 1
+            for capt in tok_capts:
+                if capt in frag.captures:
+                    frag.captures[capt] += tok_capts[capt]
+                else:
+                    frag.captures[capt] = tok_capts[capt]
+
+        if frag is not None and frag.matches_count >= self.MIN_FRAGMENT_MATCHES:
+            yield self.complete_fragment(text, frag)
+
+    def complete_fragment(self, text: str, frag: DateFragment) -> DateFragment:
+        frag.match_str = text[frag.indices[0]:frag.indices[1]]
+        for gr in self.ALL_GROUPS:
+            if gr not in frag.captures:
+                frag.captures[gr] = []
+        return frag
+
     @staticmethod
     def get_token_group(captures: Dict[str, List[str]]) -> str:
         for gr in DateFinder.ALL_GROUPS:
@@ -273,21 +362,23 @@ class DateFinder:
         return self.extract_date_strings_inner(text, text_start=0, strict=strict)
 
     def extract_date_strings_inner(self, text: str, text_start: int = 0, strict=False):
-        rng = self.split_date_range(text)
-        if rng and len(rng) > 1:
-            range_strings = []
-            for range_str in rng:
-                range_strings.extend(self.extract_date_strings_inner(range_str[0],
-                                                                     range_str[1][0],
-                                                                     strict=strict))
-            for range_string in range_strings:
-                yield range_string
-            return
-
-        tokens = self.tokenize_string(text)
-        items = self.merge_tokens(tokens)
-
-        for match in items:
+        """
+        Yield the date strings found in the text (or in each part of a date range)
+        as (date string, (start, end) + text_start, captures).
+        The text is read through the match offsets, only the date strings are copied.
+        """
+        spans = self.iter_date_range_spans(text)
+        first_spans = list(itertools.islice(spans, 2))
+        if len(first_spans) > 1:
+            spans = itertools.chain(first_spans, spans)
+        else:
+            spans = [(0, len(text))]
+
+        for span_start, span_end in spans:
+            yield from self.extract_span_date_strings(text, span_start, span_end, text_start, strict)
+
+    def extract_span_date_strings(self, text: str, start: int, end: int, text_start: int = 0, strict=False):
+        for match in self.iter_fragments(text, start, end):
             match_str = match.match_str
             indices = (match.indices[0] + text_start, match.indices[1] + text_start)
 
@@ -344,20 +435,22 @@ class DateFinder:
 
     @staticmethod
     def split_date_range(text: str) -> List[Tuple[str, Tuple[int, int]]]:
-        st_matches = DateFinder.RANGE_SPLIT_REGEX.finditer(text)
-        start = 0
-        parts = []  # List[Tuple[str, Tuple[int, int]]]
+        return [(text[start:end], (start, end)) for start, end in DateFinder.iter_date_range_spans(text)]
 
-        for match in st_matches:
+    @staticmethod
+    def iter_date_range_spans(text: str) -> Generator[Tuple[int, int], None, None]:
+        """
+        The (start, end) offsets of the text parts "to" or "through" separate.
+        """
+        start = 0
+        for match in DateFinder.RANGE_SPLIT_REGEX.finditer(text):
             match_start = match.start()
             if match_start > start:
-                parts.append((text[start:match_start], (start, match_start)))
+                yield start, match_start
             start = match.end()
 
         if start < len(text):
-            parts.append((text[start:], (start, len(text))))
-
-        return parts
+            yield start, len(text)
 
     def find_dates(self, text, source=False, index=False, strict=False):
 
@@ -382,7 +475,76 @@ class DateFinder:
     def parse_date_string(self,
                           date_string: str,
                           captures: Dict[str, List],
-                          locale: Locale):
+                          locale: Optional[Locale] = None):
+        """
+        Parse the date string with dateparser or dateutil. The results, None included, are cached in
+        PARSE_CACHE by the date string, its timezones, the base date, the locale and the replacements
+        (DateFinder.PARSE_CACHE.set_max_size(0) turns the cache off).
+        Without base date the relative and partial dates depend on the current date and are not cached.
+        """
+        as_dt = self.parse_common_date(date_string, locale)
+        if as_dt is not None:
+            return as_dt
+        if self.base_date is None:
+            return self._parse_date_string(date_string, captures, locale)
+        key = (date_string,
+               tuple(captures.get('timezones', [])),
+               self.base_date,
+               (locale.language, locale.locale_code) if locale else None,
+               # get_raw_dates adds the extra tokens to the replacements
+               tuple(self.REPLACEMENTS.items()))
+        return self.PARSE_CACHE.get_or_compute(
+            key, lambda: self._parse_date_string(date_string, captures, locale))
+
+    def parse_common_date(self,
+                          date_string: str,
+                          locale: Optional[Locale] = None) -> Optional[datetime.datetime]:
+        """
+        Parse the complete dates of the common shapes (12/31/2020, 2020-12-31, December 31, 2020,
+        31 December 2020) the same way _parse_date_string does but without calling dateparser.
+        Only the years 1300-2999 are parsed here, "-1200" style years excluded: dateparser
+        and dateutil read the other years in their own ways.
+        :return: None if the string is of another shape, not a valid date, the locale is not
+                 the empty locale or English ordering the month before the day or there is no base date
+        """
+        if self.base_date is None:
+            return None
+        if locale is not None and locale.language and \
+                (locale.language != 'en' or locale.locale_code not in self.COMMON_DATE_LOCALE_CODES):
+            return None
+
+        match = self.NUMERIC_DATE_REGEX.fullmatch(date_string)
+        if match:
+            if match.group('delimiter') == '-' and self.TIMEZONE_OFFSET_YEAR_REGEX.fullmatch(match.group('year')):
+                return None
+            month, day = int(match.group('first')), int(match.group('second'))
+            if month > 12:
+                month, day = day, month
+        else:
+            match = self.ISO_DATE_REGEX.fullmatch(date_string)
+            if match:
+                month, day = int(match.group('month')), int(match.group('day'))
+            else:
+                match = self.MONTH_DAY_YEAR_REGEX.fullmatch(date_string) or \
+                    self.DAY_MONTH_YEAR_REGEX.fullmatch(date_string)
+                if not match:
+                    return None
+                month, day = self.MONTH_NUMBERS[match.group('month').lower()], int(match.group('day'))
+        year = int(match.group('year'))
+
+        try:
+            if locale is None or not locale.language:
+                # dateutil takes the time from the base date
+                return self.base_date.replace(year=year, month=month, day=day)
+            # dateparser returns midnight
+            return datetime.datetime(year, month, day)
+        except ValueError:
+            return None
+
+    def _parse_date_string(self,
+                           date_string: str,
+                           captures: Dict[str, List],
+                           locale: Optional[Locale]):
         # For well formatted string, we can already let dateparser parse them
         # otherwise self._find_and_replace method might corrupt them
         was_raised_error = False
@@ -407,7 +569,7 @@ class DateFinder:
                 was_raised_error = True
 
         # Try to parse date using only language
-        if was_raised_error:
+        if was_raised_error and locale:
             try:
                 as_dt = dateparser.parse(date_string,
                                          settings={'RELATIVE_BASE': self.base_date},
@@ -23,7 +23,8 @@ from typing import Generator, Any, Dict, Optional, Tuple, List, Set
 
 from lexnlp.extract.all_locales.languages import Locale
 from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
-from lexnlp.extract.common.dates_classifier_model import get_date_features
+from lexnlp.extract.common.dates_classifier_model import DateClassifier, FeatureDateClassifier
+from lexnlp.utils.iterating_helpers import chunk_sequence
 
 
 class LocaleInfoImport:
@@ -57,13 +58,16 @@ class DateParser:
                  classifier_threshold: float = 0.5,
                  alphabet_character_set: Optional[Set[str]] = None,
                  count_words=False,
-                 feature_window=5):
+                 feature_window=5,
+                 classifier_batch_size: Optional[int] = None):
         """
         :param locale: locale object with language code and locale code
         :param enable_classifier_check: bool - enable date check using classifier model
-        :param classifier_model: obj - classifier itself
+        :param classifier_model: obj - classifier itself or its LazyModel (see lexnlp.utils.model_registry),
+                                 or a DateClassifier scoring the date spans
         :param classifier_threshold: float 0<x<1 - min value to predict date
         :param dateparser_settings: dict - settings for dateparser
+        :param classifier_batch_size: int - max dates scored by one classifier call, all at once if not set
         """
         self.characters = characters
         self.count_words = count_words
@@ -76,6 +80,10 @@ class DateParser:
         self.classifier_threshold = classifier_threshold
         self.dateparser_settings = dateparser_settings or self.DEFAULT_DATEPARSER_SETTINGS
         self.feature_window = feature_window
+        self.classifier_batch_size = classifier_batch_size
+        # classifier_model as a DateClassifier, built on the first classifier call
+        self.classifier = classifier_model if isinstance(classifier_model, DateClassifier) \
+            else None  # type: Optional[DateClassifier]
 
     def get_dateparser_dates(self,
                              text: Optional[str],
@@ -111,20 +119,26 @@ class DateParser:
     def passed_classifier_check(self, location_start, location_end):
         """
         Use pre-trained classifier model to predict whether a date has right format
-        Should be pluggable as it takes 90% parsing time
         """
-        features = [get_date_features(self.text,
-                                      location_start,
-                                      location_end, self.characters,
-                                      self.alphabet_character_set,
-                                      count_words=self.count_words,
-                                      window=self.feature_window)][0]
-        # rearrange the features to self.classifier_model.columns order
-        feature_list = len(features) * [0.0]
-        for i, col in enumerate(self.classifier_model.columns):
-            feature_list[i] = features[col]
-        date_score = self.classifier_model.predict_proba([feature_list])
-        return date_score[0, 1] > self.classifier_threshold
+        date_score = self.get_classifier_scores([(location_start, location_end)])
+        return date_score[0] > self.classifier_threshold
+
+    def get_classifier_scores(self, spans: List[Tuple[int, int]]) -> List[float]:
+        """
+        Score all the (location_start, location_end) date spans with a single classifier call
+        """
+        if not spans:
+            return []
+        return self.get_classifier().score(self.text, spans)
+
+    def get_classifier(self) -> DateClassifier:
+        if self.classifier is None:
+            self.classifier = FeatureDateClassifier(self.classifier_model,
+                                                    self.characters,
+                                                    self.alphabet_character_set,
+                                                    count_words=self.count_words,
+                                                    window=self.feature_window)
+        return self.classifier
 
     def get_dates(self,
                   text: Optional[str] = None,
@@ -160,6 +174,7 @@ class DateParser:
         self.get_extra_dates(strict)
 
         positions = []
+        candidates = []
         for date_str, date in sorted(self.dates, key=lambda i: -len(i[0])):
 
             # if possible date has weird format or unwanted symbols
@@ -173,12 +188,16 @@ class DateParser:
                 if any(1 for i, j in positions if location_start >= i and location_end <= j):
                     continue
                 positions.append(match.span())
+                candidates.append((match.span(), date))
 
-                # filter out possible dates using classifier
-                if self.enable_classifier_check and \
-                        not self.passed_classifier_check(location_start, location_end):
-                    continue
+        for chunk in chunk_sequence(candidates, self.classifier_batch_size):
+            # filter out possible dates using classifier
+            if self.enable_classifier_check:
+                date_scores = self.get_classifier_scores([span for span, _date in chunk])
+                chunk = [candidate for candidate, date_score in zip(chunk, date_scores)
+                         if date_score > self.classifier_threshold]
 
+            for (location_start, location_end), date in chunk:
                 ant = DateAnnotation(coords=(location_start, location_end),
                                      date=date,
                                      text=self.text[location_start:location_end],
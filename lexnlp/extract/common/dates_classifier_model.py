@@ -8,9 +8,11 @@ __email__ = "support@contraxsuite.com"
 
 import datetime
 import itertools
+from abc import ABC, abstractmethod
 
 import joblib
-from typing import List, Tuple, Callable, Dict, Union, Set, Optional
+from typing import Any, List, Tuple, Callable, Dict, Union, Set, Optional, Iterable
+import numpy as np
 import regex as re
 
 import sklearn
@@ -209,29 +211,8 @@ def get_date_features(text,
                     char_vec[key] /= float(bigram_sum)
 
     if count_words:
-        # calculate numbers below 31, numbers above 31, words and capitalized words
-        numbers_above_31, numbers_below_31, words, cap_words = 0, 0, 0, 0
-        for wrd in split_date_words(date_text):  # type: str
-            if not wrd:
-                continue
-            if wrd[0] in alphabet_char_set:
-                is_cap = len(wrd) > 1 and wrd[0].lower() != wrd[0] and wrd[1].lower() == wrd[1]
-                if is_cap:
-                    cap_words += 1
-                else:
-                    words += 1
-                continue
-            numbers = [int(n.group(0)) for n in REG_NUMBER.finditer(wrd)]
-            if numbers:
-                if numbers[0] < 31:
-                    numbers_below_31 += 1
-                else:
-                    numbers_above_31 += 1
-        if norm:
-            sum_words = numbers_above_31 + numbers_below_31 + words + cap_words
-            if sum_words:
-                numbers_above_31, numbers_below_31, words, cap_words = \
-                    numbers_above_31 / sum_words, numbers_below_31 / sum_words, words / sum_words, cap_words / sum_words
+        numbers_below_31, numbers_above_31, words, cap_words = \
+            get_date_word_features(date_text, alphabet_char_set, norm)
         char_vec['nb31'] = numbers_below_31
         char_vec['na31'] = numbers_above_31
         char_vec['wr_l'] = words
@@ -240,5 +221,224 @@ def get_date_features(text,
     return char_vec
 
 
+def get_date_word_features(date_text: str,
+                           alphabet_char_set: Set[str],
+                           norm=True) -> Tuple[float, float, float, float]:
+    """
+    Count numbers below 31, numbers above 31, words and capitalized words in the date string.
+    :return: (numbers_below_31, numbers_above_31, words, cap_words)
+    """
+    numbers_above_31, numbers_below_31, words, cap_words = 0, 0, 0, 0
+    for wrd in split_date_words(date_text):  # type: str
+        if not wrd:
+            continue
+        if wrd[0] in alphabet_char_set:
+            is_cap = len(wrd) > 1 and wrd[0].lower() != wrd[0] and wrd[1].lower() == wrd[1]
+            if is_cap:
+                cap_words += 1
+            else:
+                words += 1
+            continue
+        numbers = [int(n.group(0)) for n in REG_NUMBER.finditer(wrd)]
+        if numbers:
+            if numbers[0] < 31:
+                numbers_below_31 += 1
+            else:
+                numbers_above_31 += 1
+    if norm:
+        sum_words = numbers_above_31 + numbers_below_31 + words + cap_words
+        if sum_words:
+            numbers_above_31, numbers_below_31, words, cap_words = \
+                numbers_above_31 / sum_words, numbers_below_31 / sum_words, words / sum_words, cap_words / sum_words
+    return numbers_below_31, numbers_above_31, words, cap_words
+
+
+class DateFeatureExtractor:
+    """
+    Precompiled version of get_date_features.
+
+    The character and bigram indexes are built once for the character set, and the
+    features are returned as a NumPy row (or matrix) in the order of the model columns,
+    e.g. DateFeatureExtractor(DATE_MODEL_CHARS, DATE_MODEL.get().columns). The values
+    are the same as the ones get_date_features returns for the same arguments.
+    """
+    WORD_FEATURES = ['nb31', 'na31', 'wr_l', 'wr_u']
+
+    def __init__(self,
+                 characters: List[str],
+                 columns: Optional[Iterable[str]] = None,
+                 alphabet_char_set: Optional[Set[str]] = False,
+                 include_bigrams=True,
+                 window=5,
+                 norm=True,
+                 count_words=False):
+        """
+        :param characters: characters to use for feature generation, e.g., digits only, alpha only
+        :param columns: feature names in the order the model expects them (model.columns),
+                        the get_date_features keys order is used by default
+        :param alphabet_char_set: alphabetic characters only for the provided locale
+        :param include_bigrams: whether to include bigram/bicharacter features
+        :param window: window around match
+        :param norm: whether to norm, i.e., transform to proportion
+        :param count_words: words count in the string
+        """
+        self.characters = characters
+        self.alphabet_char_set = alphabet_char_set
+        self.include_bigrams = include_bigrams
+        self.window = window
+        self.norm = norm
+        self.count_words = count_words
+
+        # the character list may contain duplicates: get_date_features counts and norms
+        # the duplicated keys several times, so we keep the multiplicity of each key
+        self.unique_chars = list(dict.fromkeys(characters))
+        char_index = {c: i for i, c in enumerate(self.unique_chars)}
+        char_count = len(self.unique_chars)
+        self.char_multiplicity = np.array([characters.count(c) for c in self.unique_chars], dtype=np.int64)
+
+        codes = np.array([ord(c) for c in self.unique_chars], dtype=np.uint32)
+        order = np.argsort(codes)
+        self.sorted_char_codes = codes[order]
+        self.sorted_char_indexes = order.astype(np.int64)
+
+        feature_names = [f'char_{c}' for c in self.unique_chars]
+        # bigram keys are stored as offsets in a (char_count x char_count) grid
+        self.bigram_offsets = np.zeros(0, dtype=np.int64)
+        self.bigram_multiplicity = np.zeros(0, dtype=np.int64)
+        self.repeated_bigrams = []  # type: List[Tuple[int, str]]
+        if include_bigrams:
+            bigram_multiplicity = {}  # type: Dict[str, int]
+            for a, b in itertools.permutations(characters, 2):
+                bigram_multiplicity[a + b] = bigram_multiplicity.get(a + b, 0) + 1
+            offsets = [char_index[bigram[0]] * char_count + char_index[bigram[1]]
+                       for bigram in bigram_multiplicity]
+            self.bigram_offsets = np.array(offsets, dtype=np.int64)
+            self.bigram_multiplicity = np.array(list(bigram_multiplicity.values()), dtype=np.int64)
+            # str.count() doesn't count overlapping "aa" occurrences, these are counted separately
+            self.repeated_bigrams = [(i, bigram) for i, bigram in enumerate(bigram_multiplicity)
+                                     if bigram[0] == bigram[1]]
+            feature_names += [f'bigram_{bigram}' for bigram in bigram_multiplicity]
+        if count_words:
+            feature_names += self.WORD_FEATURES
+
+        feature_positions = {name: i for i, name in enumerate(feature_names)}
+        self.columns = list(columns) if columns is not None else feature_names
+        self.column_positions = np.array([feature_positions[col] for col in self.columns], dtype=np.int64)
+
+    def get_feature_row(self,
+                        text: str,
+                        start_index: int,
+                        end_index: int) -> np.ndarray:
+        """
+        Get date features as a single row in self.columns order.
+        :param text: raw text around potential date
+        :param start_index: date start index
+        :param end_index: date end index
+        """
+        window_start = max(0, start_index - self.window)
+        window_end = min(len(text), end_index + self.window)
+        feature_text = text[window_start:window_end].strip()
+
+        char_count = len(self.unique_chars)
+        text_codes = np.frombuffer(feature_text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        positions = np.searchsorted(self.sorted_char_codes, text_codes)
+        positions[positions == char_count] = 0
+        text_indexes = np.where(self.sorted_char_codes[positions] == text_codes,
+                                self.sorted_char_indexes[positions], -1)
+
+        char_vec = np.bincount(text_indexes[text_indexes >= 0], minlength=char_count).astype(np.float64)
+        features = [self._norm_counts(char_vec, self.char_multiplicity)]
+
+        if self.include_bigrams:
+            first, second = text_indexes[:-1], text_indexes[1:]
+            known = (first >= 0) & (second >= 0)
+            bigram_grid = np.bincount(first[known] * char_count + second[known],
+                                      minlength=char_count * char_count)
+            bigram_vec = bigram_grid[self.bigram_offsets].astype(np.float64)
+            for i, bigram in self.repeated_bigrams:
+                bigram_vec[i] = feature_text.count(bigram)
+            features.append(self._norm_counts(bigram_vec, self.bigram_multiplicity))
+
+        if self.count_words:
+            features.append(np.array(get_date_word_features(
+                text[start_index:end_index], self.alphabet_char_set, self.norm), dtype=np.float64))
+
+        return np.concatenate(features)[self.column_positions]
+
+    def get_feature_matrix(self,
+                           text: str,
+                           spans: Iterable[Tuple[int, int]]) -> np.ndarray:
+        """
+        Get date features for all (start_index, end_index) spans as a matrix,
+        one row per span in self.columns order.
+        """
+        rows = [self.get_feature_row(text, start, end) for start, end in spans]
+        if not rows:
+            return np.zeros((0, len(self.columns)), dtype=np.float64)
+        return np.vstack(rows)
+
+    def _norm_counts(self, counts: np.ndarray, multiplicity: np.ndarray) -> np.ndarray:
+        if not self.norm:
+            return counts
+        total = float(np.dot(counts.astype(np.int64), multiplicity))
+        if total > 0:
+            # a key listed N times is divided N times, like get_date_features does
+            for times in range(1, int(multiplicity.max(initial=1)) + 1):
+                counts[multiplicity >= times] /= total
+        return counts
+
+
+class DateClassifier(ABC):
+    """
+    Scores the date candidates found in a text: DateParser passes all the (start, end) spans
+    of a text (or of a classifier_batch_size chunk) to a single score() call and keeps the spans
+    scored above its classifier_threshold. Implement it to plug in a cheaper model:
+
+        DateParser(chars, classifier_model=MyDateClassifier(), ...)
+    """
+    @abstractmethod
+    def score(self, text: str, spans: List[Tuple[int, int]]) -> np.ndarray:
+        """
+        :return: the probability of each span of the text to be a date, in the spans order
+        """
+        raise NotImplementedError
+
+
+class FeatureDateClassifier(DateClassifier):
+    """
+    Scores the dates with a model trained on the date features (see build_date_model):
+    the features of all the spans are built as one matrix scored by one predict_proba call.
+    """
+    def __init__(self,
+                 model: Any,
+                 characters: List[str],
+                 alphabet_char_set: Optional[Set[str]] = None,
+                 count_words=False,
+                 window=5):
+        """
+        :param model: classifier with "columns" and "predict_proba", or its LazyModel
+        :param characters: characters the model was trained with, see DateFeatureExtractor
+        """
+        self.model = model
+        self.characters = characters
+        self.alphabet_char_set = alphabet_char_set
+        self.count_words = count_words
+        self.window = window
+        # built on the first call in model.columns order
+        self.feature_extractor = None  # type: Optional[DateFeatureExtractor]
+
+    def score(self, text: str, spans: List[Tuple[int, int]]) -> np.ndarray:
+        if not spans:
+            return np.zeros(0, dtype=np.float64)
+        if self.feature_extractor is None:
+            self.feature_extractor = DateFeatureExtractor(self.characters,
+                                                          self.model.columns,
+                                                          self.alphabet_char_set,
+                                                          count_words=self.count_words,
+                                                          window=self.window)
+        feature_matrix = self.feature_extractor.get_feature_matrix(text, spans)
+        return self.model.predict_proba(feature_matrix)[:, 1]
+
+
 def split_date_words(date_str: str) -> List[str]:
     return REG_WORD_SEPARATOR.split(date_str)
@@ -6,7 +6,8 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import Callable, Dict, Set, List, Any, Tuple
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, Set, List, Any, Optional, Tuple
 from enum import Enum
 
 from lexnlp.extract.common.annotation_type import AnnotationType
@@ -65,6 +66,7 @@ from lexnlp.extract.es.definitions import get_definition_annotations as get_es_d
 from lexnlp.extract.es.definitions import get_definitions as get_es_definitions
 from lexnlp.extract.es.regulations import get_regulation_annotations as get_es_regulation_annotations
 from lexnlp.extract.es.regulations import get_regulations as get_es_regulations
+from lexnlp.utils.model_registry import MODEL_REGISTRY
 
 
 class ExtractorResultFormat(Enum):
@@ -101,6 +103,12 @@ class FactExtractor:
     Some parsers require additional arguments - for example, geolocation lists
     for EN and DE geoentities parsers. Provide these arguments in
     ensure_parser_arguments_en and ensure_parser_arguments_de.
+
+    parse_documents processes many texts, optionally running the extractors in parallel:
+
+        with ProcessPoolExecutor(32, initializer=FactExtractor.initialize_worker,
+                                 initargs=(FactExtractor.parser_extra_arguments,)) as executor:
+            facts = FactExtractor.parse_documents(texts, FactExtractor.LANGUAGE_EN, executor=executor)
     """
 
     ALL_ANT_TYPES = set(AnnotationType)
@@ -119,6 +127,54 @@ class FactExtractor:
                    extract_all: bool = True,
                    include_types: Set[AnnotationType] = None,
                    exclude_types: Set[AnnotationType] = None) -> Dict[AnnotationType, List[Any]]:
+        fact_types = FactExtractor.get_fact_types(lang, result_fmt, extract_all, include_types, exclude_types)
+        return FactExtractor.parse_text_types(text, lang, result_fmt, fact_types)
+
+    @staticmethod
+    def parse_documents(texts: Iterable[str],
+                        lang: str,
+                        result_fmt: ExtractorResultFormat = ExtractorResultFormat.fmt_class,
+                        extract_all: bool = True,
+                        include_types: Set[AnnotationType] = None,
+                        exclude_types: Set[AnnotationType] = None,
+                        executor: Optional[Executor] = None,
+                        split_types: bool = True) -> List[Dict[AnnotationType, List[Any]]]:
+        """
+        Same as parse_text called for each of the texts.
+        :param executor: concurrent.futures executor to run the extractors in, e.g. ThreadPoolExecutor or
+            ProcessPoolExecutor initialized with FactExtractor.initialize_worker. The texts are processed
+            one by one in the current thread if not specified.
+        :param split_types: run each annotation type's extractor as a separate task, otherwise
+            the task extracts all the annotation types from one text
+        :return: facts of each text in the order of the texts
+        """
+        texts = list(texts)
+        fact_types = FactExtractor.get_fact_types(lang, result_fmt, extract_all, include_types, exclude_types)
+        if executor is None or not fact_types:
+            return [FactExtractor.parse_text_types(text, lang, result_fmt, fact_types) for text in texts]
+
+        type_groups = [[fact_type] for fact_type in fact_types] if split_types else [fact_types]
+        text_futures = [[executor.submit(FactExtractor.parse_text_types, text, lang, result_fmt, fact_type_group)
+                         for fact_type_group in type_groups]
+                        for text in texts]
+        documents_facts = []  # type: List[Dict[AnnotationType, List[Any]]]
+        for futures in text_futures:
+            facts = {}  # type: Dict[AnnotationType, List[Any]]
+            for future in futures:
+                facts.update(future.result())
+            documents_facts.append(facts)
+        return documents_facts
+
+    @staticmethod
+    def get_fact_types(lang: str,
+                       result_fmt: ExtractorResultFormat = ExtractorResultFormat.fmt_class,
+                       extract_all: bool = True,
+                       include_types: Set[AnnotationType] = None,
+                       exclude_types: Set[AnnotationType] = None) -> List[AnnotationType]:
+        """
+        Get the annotation types to extract that have extractors for the language and the format,
+        in the AnnotationType order.
+        """
         if lang not in FactExtractor.func_by_lang:
             langs = ', '.join(FactExtractor.func_by_lang)
             raise Exception(f'Language "{lang}" was not found among {langs}')
@@ -133,18 +189,27 @@ class FactExtractor:
         target_types = set()  # type:  Set[AnnotationType]
 
         if not extract_all and not include_types:
-            return {}
+            return []
         if not extract_all and include_types:
             target_types = include_types
         elif extract_all:
             target_types = FactExtractor.ALL_ANT_TYPES
             if exclude_types:
-                target_types -= exclude_types
+                target_types = target_types - exclude_types
 
-        if not target_types:
-            return {}
-        extractors = [extractors.get(t) for t in target_types]
-        extractors = [e for e in extractors if e]  # type: List[ExtractingFunction]
+        return [t for t in AnnotationType if t in target_types and extractors.get(t)]
+
+    @staticmethod
+    def parse_text_types(text: str,
+                         lang: str,
+                         result_fmt: ExtractorResultFormat,
+                         fact_types: Iterable[AnnotationType]) -> Dict[AnnotationType, List[Any]]:
+        """
+        Extract the facts of the types returned by get_fact_types.
+        """
+        result_fmt_key = ExtractorResultFormat.fmt_class \
+            if result_fmt == ExtractorResultFormat.fmt_dict else result_fmt
+        extractors = FactExtractor.func_by_lang[lang][result_fmt_key]
 
         extra_args = FactExtractor.parser_extra_arguments.get(lang)
         if extra_args:
@@ -152,7 +217,8 @@ class FactExtractor:
         extra_args = extra_args or {}  # type: Dict[AnnotationType, Tuple]
 
         facts = {}  # type: Dict[AnnotationType, List[Any]]
-        for extractor in extractors:
+        for fact_type in fact_types:
+            extractor = extractors[fact_type]
             extras = extra_args.get(extractor.fact_type)
             func_args = (text,) + extras if extras else (text,)
             typed_facts = list(extractor.method(*func_args))
@@ -182,6 +248,21 @@ class FactExtractor:
                                                   AnnotationType.geoentity,
                                                   (geo_config,))
 
+    @staticmethod
+    def initialize_worker(
+            parser_extra_arguments: Dict[str, Dict[ExtractorResultFormat, Dict[AnnotationType, Tuple]]] = None,
+            preload_models: bool = True) -> None:
+        """
+        Initialize a worker process of the executor passed to parse_documents.
+        :param parser_extra_arguments: FactExtractor.parser_extra_arguments of the parent process,
+            not inherited by the workers that are spawned rather than forked
+        :param preload_models: load the models of the extractors before the first task
+        """
+        if parser_extra_arguments is not None:
+            FactExtractor.parser_extra_arguments = parser_extra_arguments
+        if preload_models:
+            MODEL_REGISTRY.preload()
+
     @staticmethod
     def initialize():
         FactExtractor.initialize_en()
@@ -8,11 +8,11 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import List, Union, Dict, Tuple, Generator, Any
+from typing import List, Union, Dict, Tuple, Generator, Any, Optional
 
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
 from lexnlp.extract.en.dict_entities import DictionaryEntry, find_dict_entities, DictionaryEntryAlias, \
-    conflicts_take_first_by_id, conflicts_top_by_priority
+    conflicts_take_first_by_id, conflicts_top_by_priority, DictionaryIndex
 
 
 class GeoEntityLocator:
@@ -24,7 +24,7 @@ class GeoEntityLocator:
     def __init__(
             self,
             language: str,
-            geo_config_list: List[DictionaryEntry],
+            geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
             prepared_alias_ban_list: Union[None, Dict[str, Tuple[List[str], List[str]]]],
             conflict_resolving_field: str = 'none',
             priority_direction: str = 'asc',
@@ -34,7 +34,7 @@ class GeoEntityLocator:
         """
         :param language: default language for annotations found
         :param geo_config_list: List of all possible known geo entities in the form of tuples
-        (id, name, [(alias, lang, is_abbrev, alias_id), ...]).
+        (id, name, [(alias, lang, is_abbrev, alias_id), ...]) or DictionaryIndex prebuilt for them.
         :param conflict_resolving_field: If two entities found with the totally equal matching aliases -
         then use the one with the greatest priority field ("priority") / the one with the lowest id ("id") /
          leave all entries found ("none", default).
@@ -57,6 +57,19 @@ class GeoEntityLocator:
         self.text_languages = text_languages
         self.min_alias_len = min_alias_len
         self.simplified_normalization = simplified_normalization
+        self._alias_index = geo_config_list if isinstance(geo_config_list, DictionaryIndex) \
+            else None  # type: Optional[DictionaryIndex]
+
+    @property
+    def alias_index(self) -> DictionaryIndex:
+        """
+        Search index for geo_config_list, built on first use and reused for the next texts
+        """
+        if self._alias_index is None or (self._alias_index is not self.geo_config_list and
+                                         self._alias_index.entities is not self.geo_config_list):
+            self._alias_index = DictionaryIndex(self.geo_config_list,
+                                                simplified_normalization=self.simplified_normalization)
+        return self._alias_index
 
     def get_geoentity_entries(
             self,
@@ -67,7 +80,7 @@ class GeoEntityLocator:
         entity_alias(), add_aliases_to_entity().
         """
         for ent in find_dict_entities(text,
-                                      self.geo_config_list,
+                                      self.alias_index,
                                       conflict_resolving_func=self.conflict_resolving_func,
                                       priority_direction=self.priority_direction,
                                       default_language=self.language,
@@ -86,7 +99,7 @@ class GeoEntityLocator:
         entity_alias(), add_aliases_to_entity().
         """
         dic_entries = find_dict_entities(text,
-                                         self.geo_config_list,
+                                         self.alias_index,
                                          self.language,
                                          conflict_resolving_func=self.conflict_resolving_func,
                                          priority_direction=self.priority_direction,
@@ -9,16 +9,26 @@ __email__ = "support@contraxsuite.com"
 
 
 import codecs
+import collections
+import inspect
 import os
-import string
-from typing import Dict, Optional, List, Callable
+import re
+from typing import Dict, Iterable, Optional, List, Callable, Tuple
 
 import numpy
 import pandas
 
+from lexnlp.nlp.en.tokens import get_token_list
 from lexnlp.nlp.en.transforms.characters import get_character_ngram_distribution
 
 
+# the characters not in string.printable
+NOT_PRINTABLE_RE = re.compile(r'[^\t\n\x0b\x0c\r -~]')
+
+# bigrams of ASCII characters are indexed as ord(first) * 128 + ord(second)
+ASCII_BIGRAM_COUNT = 128 * 128
+
+
 class BaseOcrRatingCalculator:
     def __init__(self):
         self.distribution_by_lang = {}  # type: Dict[str, pandas.DataFrame]
@@ -27,6 +37,12 @@ class BaseOcrRatingCalculator:
     def get_rating(self, text: str, language: str) -> float:
         raise NotImplementedError()
 
+    def get_ratings(self, texts: Iterable[str], language: str) -> List[float]:
+        """
+        Rate the texts (e.g. the pages of a document) in one call.
+        """
+        return [self.get_rating(text, language) for text in texts]
+
     def get_file_rating(self, file_path: str, language: str) -> float:
         with codecs.open(file_path, 'r', encoding='utf-8') as fr:
             text = fr.read()
@@ -38,11 +54,32 @@ class BaseOcrRatingCalculator:
         return file_prob_vector
 
     def get_text_ngram_series(self, text: str):
-        file_buffer_ascii = ''.join([c for c in text if c in string.printable])
-        file_buffer_ascii = ''.join([self.good_chars(c) for c in file_buffer_ascii])
+        file_buffer_ascii = self.get_printable_text(text)
         file_vector = get_character_ngram_distribution(file_buffer_ascii, 2, lowercase=False, stopword=False)
         return pandas.Series(list(file_vector.values()), index=[''.join(k) for k in file_vector.keys()])
 
+    def get_printable_text(self, text: str) -> str:
+        text = NOT_PRINTABLE_RE.sub('', text)
+        # good_chars returns the character as is unless overridden (as a method of any kind)
+        if inspect.getattr_static(self, 'good_chars') is not BaseOcrRatingCalculator.__dict__['good_chars']:
+            text = ''.join([self.good_chars(c) for c in text])
+        return text
+
+    def get_text_bigram_counts(self, text: str) -> Tuple[numpy.ndarray, numpy.ndarray, Dict[str, int]]:
+        """
+        Count the same character bigrams as get_text_ngram_series.
+        :return: ASCII bigram indices (see ASCII_BIGRAM_COUNT), their counts and the counts of the other bigrams
+        """
+        tokens = get_token_list(self.get_printable_text(text), lowercase=False, stopword=False)
+        joined = '\0'.join(tokens)
+        codes = numpy.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32).astype(numpy.int64)
+        first, second = codes[:-1], codes[1:]
+        in_token = (first != 0) & (second != 0)
+        is_ascii = in_token & (first < 128) & (second < 128)
+        indices, counts = numpy.unique(first[is_ascii] * 128 + second[is_ascii], return_counts=True)
+        other_counts = collections.Counter(joined[i:i + 2] for i in numpy.flatnonzero(in_token & ~is_ascii))
+        return indices, counts, other_counts
+
     def init_language_data(self,
                            data_folders: List[str],
                            language_file_paths: Optional[List[str]] = None) -> None:
@@ -86,30 +123,79 @@ class BaseOcrRatingCalculator:
         return x
 
 
+class ReferenceVector:
+    """
+    Language's bigram distribution as a vector over the ASCII bigrams and its precomputed norm.
+    """
+    def __init__(self, distribution: pandas.Series):
+        if isinstance(distribution, pandas.DataFrame):
+            distribution = distribution.iloc[:, 0]
+        values = numpy.nan_to_num(distribution.values.astype(numpy.float64))
+        self.norm = numpy.linalg.norm(values)
+        self.vector = numpy.zeros(ASCII_BIGRAM_COUNT)
+        self.other_bigrams = {}  # type: Dict[str, float]
+        for bigram, value in zip(distribution.index, values):
+            if len(bigram) == 2 and ord(bigram[0]) < 128 and ord(bigram[1]) < 128:
+                self.vector[ord(bigram[0]) * 128 + ord(bigram[1])] = value
+            else:
+                self.other_bigrams[bigram] = value
+
+
 class CosineSimilarityOcrRatingCalculator(BaseOcrRatingCalculator):
+    def __init__(self):
+        super().__init__()
+        # language: (distribution, its ReferenceVector)
+        self.reference_vectors = {}  # type: Dict[str, Tuple[pandas.Series, ReferenceVector]]
+
+    def get_reference_vector(self, language: str) -> ReferenceVector:
+        distribution = self.distribution_by_lang.get(language)
+        if distribution is None:
+            language = self.default_language
+            distribution = self.distribution_by_lang.get(language)
+        source, reference = self.reference_vectors.get(language, (None, None))
+        # the distribution may be replaced in distribution_by_lang
+        if source is not distribution:
+            reference = ReferenceVector(distribution)
+            self.reference_vectors[language] = (distribution, reference)
+        return reference
+
     def get_cs(self, text: str, language: str) -> float:
-        if not text:
-            return 0
-        text_prob_vector = self.vectorize_text(text)
-        ngram_prob_norm_df = self.distribution_by_lang.get(language)
-        if ngram_prob_norm_df is None:
-            ngram_prob_norm_df = self.distribution_by_lang.get(self.default_language)
-        merge_df = pandas.concat([ngram_prob_norm_df, text_prob_vector], axis=1, sort=True).fillna(0)
-        similarity_score = numpy.dot(merge_df.loc[:, 0],
-                                     merge_df.loc[:, 1]) / \
-                           numpy.linalg.norm(merge_df.loc[:, 0]) / \
-                           numpy.linalg.norm(merge_df.loc[:, 1])
-        return similarity_score
+        return self.get_cs_values([text], language)[0]
+
+    def get_cs_values(self, texts: Iterable[str], language: str) -> List[float]:
+        """
+        Get cosine similarity of the texts' bigram distributions to the language's reference distribution,
+        0 for the texts having no bigrams.
+        """
+        reference = None
+        cs_values = []
+        for text in texts:
+            if not text:
+                cs_values.append(0)
+                continue
+            indices, counts, other_counts = self.get_text_bigram_counts(text)
+            text_norm = numpy.sqrt(numpy.dot(counts, counts) + sum(c * c for c in other_counts.values()))
+            if not text_norm:
+                cs_values.append(0)
+                continue
+            reference = reference or self.get_reference_vector(language)
+            dot = numpy.dot(reference.vector[indices], counts) + \
+                sum(reference.other_bigrams.get(bigram, 0) * c for bigram, c in other_counts.items())
+            cs_values.append(dot / reference.norm / text_norm)
+        return cs_values
+
+    def get_grade(self, cs: float) -> float:
+        return numpy.round(int(cs * 100) / 10.)
 
     def get_rating(self, text: str, language: str) -> float:
-        cs = self.get_cs(text, language)
-        ocr_grade = numpy.round(int(cs * 100) / 10.)
-        return ocr_grade
+        return self.get_grade(self.get_cs(text, language))
+
+    def get_ratings(self, texts: Iterable[str], language: str) -> List[float]:
+        return [self.get_grade(cs) for cs in self.get_cs_values(texts, language)]
 
 
 class QuadraticCosineSimilarityOcrRatingCalculator(CosineSimilarityOcrRatingCalculator):
-    def get_rating(self, text: str, language: str) -> float:
-        cs = super().get_cs(text, language)
+    def get_grade(self, cs: float) -> float:
         x = cs * 100  # 0.0 ... 100.0
         ocr_grade = 0 if x < 50 else \
             numpy.round(0.00219033 * (x ** 2) - 0.1239173 * x + 1.1268522)
@@ -7,7 +7,7 @@ __email__ = "support@contraxsuite.com"
 
 
 from unittest import TestCase
-from lexnlp.extract.common.dates_classifier_model import get_date_features
+from lexnlp.extract.common.dates_classifier_model import get_date_features, DateFeatureExtractor
 from lexnlp.extract.de.date_model import DE_ALPHA_CHAR_SET, DATE_MODEL_CHARS
 
 
@@ -23,3 +23,25 @@ class TestDateClassifierModel(TestCase):
         self.assertEqual(3, features['na31'])
         self.assertEqual(1, features['wr_l'])
         self.assertEqual(4, features['wr_u'])
+
+    def test_feature_extractor_matches_dict_features(self):
+        text = 'Leasing mit 2.500€ Anzahlung am 1. Juni 2017, Straẞe ẞẞẞ: Rate 230,55€'
+        extractor = DateFeatureExtractor(DATE_MODEL_CHARS,
+                                         alphabet_char_set=DE_ALPHA_CHAR_SET,
+                                         count_words=True)
+        for start, end in [(0, len(text)), (32, 44), (46, 60), (5, 5)]:
+            features = get_date_features(text, start, end,
+                                         characters=DATE_MODEL_CHARS,
+                                         count_words=True,
+                                         alphabet_char_set=DE_ALPHA_CHAR_SET)
+            row = extractor.get_feature_row(text, start, end)
+            self.assertEqual([features[col] for col in extractor.columns], row.tolist())
+
+    def test_feature_extractor_columns_order(self):
+        columns = ['char_1', 'bigram_20', 'char_0', 'bigram_02']
+        extractor = DateFeatureExtractor(list('0123456789-'), columns)
+        matrix = extractor.get_feature_matrix('on 2000-02-02 or 2010', [(3, 13), (17, 21)])
+        self.assertEqual((2, 4), matrix.shape)
+        features = get_date_features('on 2000-02-02 or 2010', 17, 21, list('0123456789-'))
+        self.assertEqual([features[col] for col in columns], matrix[1].tolist())
+        self.assertEqual((0, 4), extractor.get_feature_matrix('no dates', []).shape)
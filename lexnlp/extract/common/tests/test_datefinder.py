@@ -11,6 +11,7 @@ import datetime
 import os
 import time
 from unittest import TestCase
+from lexnlp.extract.all_locales.languages import Locale
 from lexnlp.extract.common.date_parsing.datefinder import DateFinder
 
 
@@ -42,3 +43,50 @@ class TestDateFinder(TestCase):
         _ = list(date_finder.extract_date_strings(text, strict=False))
         d1 = time.time() - t1
         self.assertLess(d1, 15)
+
+    def test_parse_cache(self):
+        base_date = datetime.datetime(2021, 1, 1)
+        date_finder = DateFinder(base_date=base_date)
+        cache = DateFinder.PARSE_CACHE
+        hits, misses = cache.hits, cache.misses
+        captures = {'timezones': []}
+        date = date_finder.parse_date_string('June 2020', captures)
+        self.assertEqual(datetime.datetime(2020, 6, 1), date)
+        self.assertIsNone(date_finder.parse_date_string('the Closing', captures))
+
+        other_finder = DateFinder(base_date=base_date)
+        self.assertEqual(date, other_finder.parse_date_string('June 2020', captures))
+        self.assertIsNone(other_finder.parse_date_string('the Closing', captures))
+        self.assertEqual((hits + 2, misses + 2), (cache.hits, cache.misses))
+
+        # the base date is a part of the key
+        other_finder = DateFinder(base_date=datetime.datetime(2019, 1, 1))
+        self.assertEqual(datetime.datetime(2019, 6, 1), other_finder.parse_date_string('June', captures))
+
+    def test_parse_common_date(self):
+        date_finder = DateFinder(base_date=datetime.datetime(2021, 1, 1, 12, 30))
+        captures = {'timezones': []}
+        for date_string in ('12/31/2020', '31/12/2020', '2020-12-31', 'December 31, 2020',
+                            'Dec. 31st 2020', '31 December 2020'):
+            expected = date_finder._parse_date_string(date_string, captures, None)
+            self.assertEqual(expected, date_finder.parse_common_date(date_string))
+            self.assertEqual(datetime.datetime(2020, 12, 31, 12, 30), expected)
+
+        # not the common shapes or not valid dates are left to dateparser
+        self.assertIsNone(date_finder.parse_common_date('June 2020'))
+        self.assertIsNone(date_finder.parse_common_date('February 30, 2020'))
+        self.assertIsNone(DateFinder().parse_common_date('12/31/2020'))
+
+        # dateparser returns midnight for the English locales and reads other locales' orders
+        self.assertEqual(datetime.datetime(2020, 12, 31),
+                         date_finder.parse_common_date('December 31, 2020', Locale('en-US')))
+        self.assertIsNone(date_finder.parse_common_date('12/31/2020', Locale('de')))
+
+        # the years dateparser and dateutil read in their own ways are left to them
+        for date_string, locale in (('21st Jul 0032', None), ('19 APRIL., 0095', None),
+                                    ('11-23-1200', Locale('en')), ('11-23-1200', Locale('en-US'))):
+            self.assertIsNone(date_finder.parse_common_date(date_string, locale))
+            self.assertNotEqual(date_finder.parse_date_string(date_string, captures, locale).year,
+                                int(date_string[-4:]))
+        self.assertEqual(datetime.datetime(1460, 11, 23),
+                         date_finder.parse_common_date('11-23-1460', Locale('en-US')))
@@ -36,6 +36,21 @@ class TestDateTokenizer(TestCase):
         self.assertEqual((0, 16), merged[0].indices)
         self.assertEqual('At', merged[0].captures['extra_tokens'][0].strip())
 
+    def test_iter_fragments(self):
+        text = "Signed At 1997, 20 FEB here, in"
+        dtok = DateFinder()
+        fragments = dtok.iter_fragments(text, 7)
+        frag = next(fragments)
+        self.assertEqual('At 1997, 20 FEB ', frag.match_str)
+        self.assertEqual((7, 23), frag.indices)
+        self.assertEqual([], frag.captures['time'])
+        self.assertEqual([], list(fragments))
+
+        tokens = list(dtok.iter_date_tokens(text, 7, 15))
+        self.assertEqual((7, 9, 'extra_tokens'), tokens[0][:3])
+        self.assertEqual((10, 14, 'digits', {'digits': ['1997']}), tokens[2])
+        self.assertEqual(15, tokens[-1][1])
+
     def test_get_date_strings(self):
         text = """
                 2. Amendment to Interest Rate. Beginning on February 1, 1998, and
@@ -7,6 +7,7 @@ __email__ = "support@contraxsuite.com"
 
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from lexnlp.extract.en.dict_entities import DictionaryEntry
@@ -91,3 +92,35 @@ class TestFactExtractor(TestCase):
                                          ExtractorResultFormat.fmt_class,
                                          extract_all=True)
         self.assertTrue(AnnotationType.money in facts)
+
+    def test_parse_documents(self):
+        texts = ['This Agreement is dated as of June 1, 2017 and expires on 12/31/2020.',
+                 'Nothing to extract.',
+                 'See https://www.sec.gov and http://lexpredict.com before January 15, 2018.']
+        include_types = {AnnotationType.date, AnnotationType.url, AnnotationType.cusip}
+        expected = [FactExtractor.parse_text(text, FactExtractor.LANGUAGE_EN, ExtractorResultFormat.fmt_dict,
+                                             extract_all=False, include_types=include_types)
+                    for text in texts]
+        self.assertEqual(2, len(expected[0][AnnotationType.date]))
+        self.assertEqual([AnnotationType.date, AnnotationType.url], list(expected[2]))
+
+        facts = FactExtractor.parse_documents(texts, FactExtractor.LANGUAGE_EN, ExtractorResultFormat.fmt_dict,
+                                              extract_all=False, include_types=include_types)
+        self.assertEqual(expected, facts)
+        for split_types in (True, False):
+            with ThreadPoolExecutor(4) as executor:
+                facts = FactExtractor.parse_documents(texts, FactExtractor.LANGUAGE_EN,
+                                                      ExtractorResultFormat.fmt_dict,
+                                                      extract_all=False, include_types=include_types,
+                                                      executor=executor, split_types=split_types)
+            self.assertEqual(expected, facts)
+            self.assertEqual([list(f) for f in expected], [list(f) for f in facts])
+
+    def test_exclude_types(self):
+        all_types = set(FactExtractor.ALL_ANT_TYPES)
+        fact_types = FactExtractor.get_fact_types(FactExtractor.LANGUAGE_DE,
+                                                  exclude_types={AnnotationType.percent})
+        self.assertNotIn(AnnotationType.percent, fact_types)
+        self.assertIn(AnnotationType.date, fact_types)
+        self.assertEqual(all_types, FactExtractor.ALL_ANT_TYPES)
+        self.assertEqual([t for t in AnnotationType if t in fact_types], fact_types)
@@ -9,8 +9,22 @@ __email__ = "support@contraxsuite.com"
 import os
 from unittest import TestCase
 
+import pandas as pd
+
 from lexnlp.extract.common.base_path import lexnlp_test_path
-from lexnlp.extract.common.ocr_rating.ocr_rating_calculator import build_cs_quad_rating_calculator
+from lexnlp.extract.common.ocr_rating.ocr_rating_calculator import build_cs_quad_rating_calculator, \
+    build_rating_calculator, QuadraticCosineSimilarityOcrRatingCalculator
+
+
+class UpperCaseRatingCalculator(QuadraticCosineSimilarityOcrRatingCalculator):
+    def good_chars(self, x):
+        return x.upper()
+
+
+class StaticUpperCaseRatingCalculator(QuadraticCosineSimilarityOcrRatingCalculator):
+    @staticmethod
+    def good_chars(x):
+        return x.upper()
 
 
 class TestOcrGrade(TestCase):
@@ -44,3 +58,33 @@ class TestOcrGrade(TestCase):
         rating_de = calc.get_file_rating(file_path, 'de')
         self.assertGreater(rating_de, rating_en)
         self.assertGreater(rating_de, 6)
+
+    def test_ratings(self):
+        file_path = os.path.join(
+            lexnlp_test_path, 'lexnlp/extract/common/ocr_grade/pretty_en_file.txt')
+        with open(file_path, 'r', encoding='utf-8') as fr:
+            text = fr.read()
+        pages = [text[i:i + 2000] for i in range(0, len(text), 2000)] + ['', 'a']
+        calc = build_cs_quad_rating_calculator()
+        ratings = calc.get_ratings(pages, 'en')
+        self.assertEqual([calc.get_rating(page, 'en') for page in pages], ratings)
+        # no character bigrams
+        self.assertEqual([0, 0], ratings[-2:])
+        self.assertGreater(ratings[0], 5)
+
+    def test_replaced_distribution(self):
+        calc = build_cs_quad_rating_calculator()
+        text = 'Lo Lo'
+        self.assertLess(calc.get_cs(text, 'en'), 0.1)
+        calc.distribution_by_lang['en'] = pd.Series([1.0], index=['Lo'])
+        self.assertAlmostEqual(1, calc.get_cs(text, 'en'))
+
+    def test_good_chars_override(self):
+        text = 'Lorem ipsum dolor sit amet'
+        calc = build_cs_quad_rating_calculator()
+        self.assertEqual(text, calc.get_printable_text(text))
+        expected = calc.get_rating(text.upper(), 'en')
+        for calc_class in (UpperCaseRatingCalculator, StaticUpperCaseRatingCalculator):
+            calc = build_rating_calculator(calc_class)
+            self.assertEqual(text.upper(), calc.get_printable_text(text))
+            self.assertEqual(expected, calc.get_rating(text, 'en'))
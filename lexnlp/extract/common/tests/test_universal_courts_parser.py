@@ -6,7 +6,9 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+import os
 import re
+import tempfile
 import time
 import pandas
 
@@ -36,6 +38,33 @@ class TestUniversalCourtsParser(TestCase):
             _ = text[rv["attrs"]["start"]:rv["attrs"]["end"]]
             # self.assertEqual(len(rf), len(rf.strip(' \t')))
 
+    def test_court_table_indexes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'courts.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('Court Type,Court Name,Jurisdiction,Alias\n'
+                        'District Court,Southern Georgia District Court,Federal,S.D. Ga.\n'
+                        'District Court,Northern Georgia District Court,Federal,\n'
+                        'Supreme Court,Supreme Court of Georgia,Georgia,\n'
+                        'Supreme Court,Supreme Court of Ohio,Ohio,\n')
+            ptrs = ParserInitParams()
+            ptrs.court_pattern_checker = re.compile('court', re.IGNORECASE)
+            ptrs.dataframe_paths = [path]
+            ptrs.split_ptrs = LineSplitParams()
+            ptrs.split_ptrs.line_breaks = {'\n', '.', ';', ','}
+            parser = UniversalCourtsParser(ptrs)
+
+        self.assertEqual(['Southern Georgia District Court', 'Northern Georgia District Court'],
+                         [r.name for r in parser.rows_by_type_and_jurisdiction[('District Court', 'Federal')]])
+        text = 'Filed in S.D. Ga. and appealed to the Northern Georgia District Court; ' \
+               'then to the Supreme Court of Ohio; some District Court'
+        ants = list(parser.parse(text, 'en'))
+        self.assertEqual([('Southern Georgia District Court', 'District Court', 'Federal', (8, 18)),
+                          ('Northern Georgia District Court', 'District Court', 'Federal', (37, 69)),
+                          ('Supreme Court of Ohio', 'Supreme Court', 'Ohio', (82, 104)),
+                          ('District Court', 'District Court', 'Federal', (105, 125))],
+                         [(a.name, a.court_type, a.jurisdiction, a.coords) for a in ants])
+
     def test_compare_to_legacy_parser(self):
         parser = self.make_en_parser()
         text = load_resource_document('lexnlp/extract/en/courts/courts_sample_01.txt', 'utf-8')
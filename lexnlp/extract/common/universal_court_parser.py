@@ -10,13 +10,18 @@ __email__ = "support@contraxsuite.com"
 
 import re
 import pandas
-from typing import Callable, Generator, List, Optional, Tuple
+from typing import Callable, Dict, Generator, List, NamedTuple, Optional, Tuple
 
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
+from lexnlp.utils.lines_processing import line_processor, phrase_finder
 from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams, LineOrPhrase
 from lexnlp.utils.lines_processing.phrase_finder import PhraseFinder, PhraseMatch
 
 
+# the code the parsers are built with: the parsers kept by DictionaryCache are rebuilt when it changes
+PARSER_SOURCE_PATHS = [__file__, line_processor.__file__, phrase_finder.__file__]
+
+
 class ParserInitParams:
     """
     UniversalCourtsParser initialization parameters
@@ -34,8 +39,17 @@ class ParserInitParams:
         self.key_word_preproc_func: Optional[Callable[[str], str]] = None
 
 
+class CourtRow(NamedTuple):
+    """
+    The court table row values the annotations are made of
+    """
+    name: str
+    court_type: str
+    jurisdiction: str
+
+
 class MatchFound:
-    def __init__(self, subset, entry_start: int, entry_end: int, text: str):
+    def __init__(self, subset: List[CourtRow], entry_start: int, entry_end: int, text: str):
         self.subset = subset
         self.is_exact: bool = len(subset) == 1
         self.court_name = None
@@ -124,6 +138,19 @@ class UniversalCourtsParser:
         self.courts: pandas.DataFrame = self.load_courts(ptrs.dataframe_paths)
         self.locale: Optional[str] = None
 
+        # the court table rows by the values of the columns searched in the text
+        self.court_rows: List[CourtRow] = [CourtRow(*values) for values in zip(
+            self.courts[self.court_name_column],
+            self.courts[self.court_type_column],
+            self.courts[self.jurisdiction_column])]
+        self.rows_by_column: Dict[str, Dict[str, List[CourtRow]]] = {}
+        for column in (self.court_alias_column, self.court_name_column, self.court_type_column):
+            if column:
+                self.get_rows_by_column(column)
+        self.rows_by_type_and_jurisdiction: Dict[Tuple[str, str], List[CourtRow]] = {}
+        for row in self.court_rows:
+            self.rows_by_type_and_jurisdiction.setdefault((row.court_type, row.jurisdiction), []).append(row)
+
         # unique columns
         self.finder_court_alias = (
             None
@@ -202,11 +229,24 @@ class UniversalCourtsParser:
             return pandas.concat(frames)
         return pandas.DataFrame()
 
+    def get_rows_by_column(self, column: str) -> Dict[str, List[CourtRow]]:
+        """
+        Index the court table rows by the column's values, keeping the table's order of the rows.
+        """
+        rows_by_value = self.rows_by_column.get(column)
+        if rows_by_value is None:
+            rows_by_value = {}
+            for value, row in zip(self.courts[column], self.court_rows):
+                rows_by_value.setdefault(value, []).append(row)
+            self.rows_by_column[column] = rows_by_value
+        return rows_by_value
+
     def find_courts_by_alias_in_whole_text(self, text: str) -> Generator[CourtAnnotation, None, None]:
         if self.finder_court_alias:
+            rows_by_alias = self.get_rows_by_column(self.court_alias_column)
             for m in self.finder_court_alias.find_word(text):
                 alias = m[0]
-                rows = self.courts.loc[self.courts[self.court_alias_column] == alias]
+                rows = rows_by_alias.get(alias, [])
                 match_found = MatchFound(rows, m[1], m[2], text[m[1]:m[2]])
                 yield self.create_annotation(match_found)
 
@@ -239,7 +279,7 @@ class UniversalCourtsParser:
         found_substrings = phrase_finder.find_word(phrase.text, True)
         if len(found_substrings) == 0:
             return None
-        subset = self.courts.loc[self.courts[column] == found_substrings[0][0]]
+        subset = self.get_rows_by_column(column).get(found_substrings[0][0], [])
         if len(subset) == 0:
             return None
 
@@ -272,10 +312,9 @@ class UniversalCourtsParser:
             return matches
 
         if len(court_jurs) == 0:
-            subset = self.courts.loc[self.courts[self.court_type_column] == court_types[0][0]]
+            subset = self.get_rows_by_column(self.court_type_column).get(court_types[0][0], [])
         else:
-            subset = self.courts.loc[(self.courts[self.court_type_column] == court_types[0][0]) &
-                                     (self.courts[self.jurisdiction_column] == court_jurs[0][0])]
+            subset = self.rows_by_type_and_jurisdiction.get((court_types[0][0], court_jurs[0][0]), [])
 
         match = MatchFound(subset,
                            phrase.start,
@@ -290,31 +329,31 @@ class UniversalCourtsParser:
         len_match = len(match.subset)
 
         name = (
-            match.subset[self.court_name_column].values[0]
+            match.subset[0].name
             if match.is_exact
             else match.court_name
             if match.court_name is not None
-            else match.subset[self.court_name_column].values[0]
+            else match.subset[0].name
             if len_match > 0
             else ""
         )
 
         court_type = (
-            match.subset[self.court_type_column].values[0]
+            match.subset[0].court_type
             if match.is_exact
             else match.court_type
             if match.court_type is not None
-            else match.subset[self.court_type_column].values[0]
+            else match.subset[0].court_type
             if len_match > 0
             else ""
         )
 
         jurisdiction = (
-            match.subset[self.jurisdiction_column].values[0]
+            match.subset[0].jurisdiction
             if match.is_exact
             else match.jurisdiction
             if match.jurisdiction is not None
-            else match.subset[self.jurisdiction_column].values[0]
+            else match.subset[0].jurisdiction
             if len_match > 0
             else ""
         )
@@ -56,6 +56,8 @@ class DeCitationParser:
     CITATION_PTN_RE = re.compile(CITATION_PTN, re_flags)
     SECOND_CITATION_PTN_RE = re.compile(SECOND_CITATION_PTN, re_flags)
     CITATION_RANGE_PTN_RE = re.compile(CITATION_RANGE_PTN, re_flags)
+    # all the patterns contain "BGBl": the texts without it are not scanned
+    PREFILTER_RE = re.compile(r'BGBl', re.IGNORECASE)
 
     @classmethod
     def get_citation_annotations(cls, text: str) -> \
@@ -65,6 +67,8 @@ class DeCitationParser:
         :param text: str
         :return: yields dict
         """
+        if not cls.PREFILTER_RE.search(text):
+            return
 
         for ptn in [cls.CITATION_PTN_RE, cls.SECOND_CITATION_PTN_RE, cls.CITATION_RANGE_PTN_RE]:
             for match in ptn.finditer(text):
@@ -12,15 +12,24 @@ import os
 import re
 from typing import Generator, List
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    PARSER_SOURCE_PATHS
+from lexnlp.extract.de import language_tokens
 from lexnlp.extract.de.language_tokens import DeLanguageTokens
+from lexnlp.utils.dictionary_cache import DICTIONARY_CACHE
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
+from lexnlp.utils.model_registry import get_module_getattr
 
 
-def setup_de_parser():
-    def preproc_func(text):
-        return re.sub('e$', '[e]?', text)
+COURT_DATAFRAME_PATH = os.path.join(os.path.dirname(__file__), "../../config/de/de_courts.csv")
+
+
+def preproc_func(text):
+    # module-level for the parser to be picklable
+    return re.sub('e$', '[e]?', text)
 
+
+def setup_de_parser():
     ptrs = ParserInitParams()
     ptrs.key_word_preproc_func = preproc_func
     ptrs.court_pattern_checker = re.compile('gericht')
@@ -34,16 +43,24 @@ def setup_de_parser():
                          'jurisdiction': 'Jurisdiction',
                          'alias': 'Alias (de-DE)'}
 
-    path = os.path.join(os.path.dirname(__file__), "../../config/de/de_courts.csv")
-    ptrs.dataframe_paths = [path]
+    ptrs.dataframe_paths = [COURT_DATAFRAME_PATH]
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_de_parser()
+# the parser is read from the dictionary cache or built on first use
+PARSER = DICTIONARY_CACHE.register(
+    'de.court_parser',
+    setup_de_parser,
+    [COURT_DATAFRAME_PATH] + PARSER_SOURCE_PATHS + [
+        __file__,
+        language_tokens.__file__,
+        os.path.join(os.path.dirname(language_tokens.__file__), 'data/abbreviations.txt')])
+
+__getattr__ = get_module_getattr(__name__, {'parser': PARSER})
 
 
 def get_court_annotations(text: str, language: str = 'de') -> Generator[CourtAnnotation, None, None]:
-    yield from parser.parse(text, language)
+    yield from PARSER.get().parse(text, language)
 
 
 def get_court_annotation_list(text: str, language: str = 'de') -> List[CourtAnnotation]:
@@ -51,7 +68,7 @@ def get_court_annotation_list(text: str, language: str = 'de') -> List[CourtAnno
 
 
 def get_courts(text: str, language: str = 'de') -> Generator[dict, None, None]:
-    for court_annotation in parser.parse(text, language):
+    for court_annotation in PARSER.get().parse(text, language):
         yield court_annotation.to_dictionary()
 
 
@@ -18,12 +18,16 @@ from lexnlp.extract.de.date_model import DATE_MODEL_CHARS, DE_ALPHA_CHAR_SET
 
 # Setup path
 from lexnlp.extract.de.de_date_parser import DeDateParser
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
 
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load model
-MODEL_DATE = joblib.load(os.path.join(MODULE_PATH, "./date_model.pickle"))
+# Model is loaded on first use
+DATE_MODEL_PATH = os.path.join(MODULE_PATH, "./date_model.pickle")
+DATE_MODEL = MODEL_REGISTRY.register('de.date_model', lambda: joblib.load(DATE_MODEL_PATH), path=DATE_MODEL_PATH)
+
+__getattr__ = get_module_getattr(__name__, {'MODEL_DATE': DATE_MODEL})
 
 
 parser = DeDateParser(DATE_MODEL_CHARS,
@@ -32,7 +36,7 @@ parser = DeDateParser(DATE_MODEL_CHARS,
                       dateparser_settings={'PREFER_DAY_OF_MONTH': 'first',
                                            'STRICT_PARSING': False,
                                            'DATE_ORDER': 'DMY'},
-                      classifier_model=MODEL_DATE,
+                      classifier_model=DATE_MODEL,
                       alphabet_character_set=DE_ALPHA_CHAR_SET,
                       count_words=True,
                       feature_window=0)
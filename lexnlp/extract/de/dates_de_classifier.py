@@ -15,7 +15,7 @@ from lexnlp.extract.all_locales.languages import Locale
 from lexnlp.extract.common.dates import DateParser
 from lexnlp.extract.common.dates_classifier_model import build_date_model
 from lexnlp.extract.de.date_model import DATE_MODEL_CHARS, MONTH_NAMES, DE_ALPHA_CHAR_SET
-from lexnlp.extract.de.dates import MODEL_DATE
+from lexnlp.extract.de.dates import DATE_MODEL
 from lexnlp.extract.de.de_date_parser import DeDateParser
 
 
@@ -35,7 +35,7 @@ def setup_date_parser(check_date_string: bool) -> DateParser:
                         dateparser_settings={'PREFER_DAY_OF_MONTH': 'first',
                                              'STRICT_PARSING': False,
                                              'DATE_ORDER': 'DMY'},
-                        classifier_model=MODEL_DATE,
+                        classifier_model=DATE_MODEL,
                         alphabet_character_set=DE_ALPHA_CHAR_SET,
                         count_words=True)
 
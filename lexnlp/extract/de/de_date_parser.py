@@ -17,6 +17,7 @@ from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
 from lexnlp.extract.common.dates import DateParser
 from lexnlp.extract.common.dates_classifier_model import split_date_words, REG_NUMBER
 from lexnlp.extract.de.date_model import MONTH_NAMES, DE_ALPHA_CHAR_SET
+from lexnlp.utils.iterating_helpers import chunk_sequence
 
 
 MONTH_NAMES_LOWER = set([m.lower() for m in MONTH_NAMES])
@@ -132,6 +133,7 @@ class DeDateParser(DateParser):
         self.text = text.replace('\n', ' ') or self.text
         self.text = re.sub(CUSTOM_DATES_SEPARATOR, '\n', self.text)
         text_parts = self.text.split('\n')
+        candidates = []
         for text_part in text_parts:
             self.locale.language = (locale.language if locale else "") or self.locale.language
 
@@ -161,14 +163,18 @@ class DeDateParser(DateParser):
                     if any(1 for i, j in positions if location_start >= i and location_end <= j):
                         continue
                     positions.append(match.span())
-
-                    # filter out possible dates using classifier
-                    if self.enable_classifier_check and \
-                            not self.passed_classifier_check(location_start, location_end):
-                        continue
-
-                    ant = DateAnnotation(coords=(location_start, location_end),
-                                         date=date,
-                                         text=text_part[location_start:location_end],
-                                         locale=self.locale.language)
-                    yield ant
+                    candidates.append((match.span(), date, text_part))
+
+        for chunk in chunk_sequence(candidates, self.classifier_batch_size):
+            # filter out possible dates using classifier
+            if self.enable_classifier_check:
+                date_scores = self.get_classifier_scores([span for span, _date, _part in chunk])
+                chunk = [candidate for candidate, date_score in zip(chunk, date_scores)
+                         if date_score > self.classifier_threshold]
+
+            for (location_start, location_end), date, text_part in chunk:
+                ant = DateAnnotation(coords=(location_start, location_end),
+                                     date=date,
+                                     text=text_part[location_start:location_end],
+                                     locale=self.locale.language)
+                yield ant
@@ -6,13 +6,13 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import List, Tuple, Generator, Optional, Dict, Any
+from typing import List, Tuple, Generator, Optional, Dict, Any, Union
 
 import pandas as pd
 
 from lexnlp.extract.all_locales.languages import LANG_DE
 from lexnlp.extract.common.geoentity_detector import GeoEntityLocator
-from lexnlp.extract.en.dict_entities import DictionaryEntry, DictionaryEntryAlias
+from lexnlp.extract.en.dict_entities import DictionaryEntry, DictionaryEntryAlias, DictionaryIndex
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
 
 
@@ -51,7 +51,7 @@ def get_geoentity_annotations_custom_settings(
 
 def get_geoentity_annotations(
         text: str,
-        geo_config_list: List[DictionaryEntry],
+        geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
         conflict_resolving_field: str = 'none',
         priority_direction: str = 'asc',
         text_languages: List[str] = None,
@@ -107,7 +107,7 @@ def get_geoentities_custom_settings(
 
 def get_geoentities(
         text: str,
-        geo_config_list: List[DictionaryEntry],
+        geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
         conflict_resolving_field: str = 'none',
         priority_direction: str = 'asc',
         text_languages: List[str] = None,
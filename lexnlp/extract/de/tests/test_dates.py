@@ -22,6 +22,9 @@ import pytest
 
 from lexnlp.extract.all_locales.languages import Locale
 from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
+from lexnlp.extract.common.dates_classifier_model import DateClassifier
+from lexnlp.extract.de.date_model import DATE_MODEL_CHARS
+from lexnlp.extract.de.de_date_parser import DeDateParser
 from lexnlp.extract.de.dates import get_date_list, get_date_annotations, parser
 from lexnlp.extract.de.dates_de_classifier import train_default_model
 from lexnlp.tests.typed_annotations_tests import TypedAnnotationsTester
@@ -100,6 +103,27 @@ class TestDeDatesPlain(TestCase):
             self.assertEqual((exp[0], exp[1]), act.coords)
             self.assertEqual(exp[2], act.date)
 
+    def test_custom_classifier(self):
+        class YearClassifier(DateClassifier):
+            def __init__(self):
+                self.calls = []
+
+            def score(self, text, spans):
+                self.calls.append(spans)
+                return [1.0 if '2017' in text[start:end] else 0.0 for start, end in spans]
+
+        text = 'Bekanntmachung vom 16. Mai 2002, geändert durch Gesetz vom 29. März 2017'
+        classifier = YearClassifier()
+        date_parser = DeDateParser(DATE_MODEL_CHARS,
+                                   locale=Locale('de-DE'),
+                                   dateparser_settings=dict(parser.dateparser_settings),
+                                   classifier_model=classifier)
+        dates = date_parser.get_date_annotation_list(text)
+        self.assertEqual(['29. März 2017'], [d.text for d in dates])
+        # all the candidates are scored in one call
+        self.assertEqual(1, len(classifier.calls))
+        self.assertEqual(2, len(classifier.calls[0]))
+
     def test_numeral(self):
         text = 'der vierte Juli'
         dates = list(get_date_annotations(text))
@@ -12,7 +12,10 @@ __email__ = "support@contraxsuite.com"
 
 import os
 import re
-from typing import Generator, Tuple, List
+from typing import Generator, Iterable, Tuple, List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from lexnlp.extract.en.addresses import address_features
 from lexnlp.extract.en.preprocessing.span_tokenizer import SpanTokenizer
@@ -104,6 +107,20 @@ def load_classifier():
 NGRAM_CLASSIFIER = load_classifier()
 NGRAM_WINDOW_HALF_WIDTH = 10
 NGRAM_WINDOW_STEP = 1
+# windows classified by one predict() call: bounds the memory of the window matrix
+NGRAM_BATCH_SIZE = 10000
+
+
+def get_words_with_features(text: str) -> List[Tuple[str, str, int, int, List[int]]]:
+    """
+    (word, POS tag, start, end, word features) of the text's words
+    """
+    words = []
+    for word, pos_token, word_start_pos, word_end_pos in TOKENIZER.get_token_spans(text):
+        features = address_features.get_word_features(word, pos_token)
+        # our tokenizer returns exact word_end_pos and we need it so that text[word_start_pos:word_end_pos] == word
+        words.append((word, pos_token, word_start_pos, word_end_pos + 1, features))
+    return words
 
 
 def prepare_ngrams_in_text(
@@ -111,12 +128,7 @@ def prepare_ngrams_in_text(
     window_half_width: int,
     window_step: int
 ) -> Generator[Tuple[List[int], str, int, int], None, None]:
-    words2 = []
-
-    for word, pos_token, word_start_pos, word_end_pos in TOKENIZER.get_token_spans(text):
-        features = address_features.get_word_features(word, pos_token)
-        # our tokenizer returns exact word_end_pos and we need it so that text[word_start_pos:word_end_pos] == word
-        words2.append((word, pos_token, word_start_pos, word_end_pos + 1, features))
+    words2 = get_words_with_features(text)
 
     i = 0
     len_words2 = len(words2)
@@ -156,13 +168,72 @@ def get_addresses(text: str) -> Generator[str, None, None]:
         yield addr
 
 
-def get_address_spans(text: str) -> Generator[Tuple[str, int, int], None, None]:
+def get_ngram_feature_matrix(
+    word_features: np.ndarray,
+    window_half_width: int,
+    window_step: int
+) -> np.ndarray:
+    """
+    Features of the word windows prepare_ngrams_in_text builds, one row per window:
+    the features of the words [i - window_half_width, i + window_half_width) of every window_step-th word i,
+    zeros outside the text. The rows are strided views of the words' feature matrix, nothing is copied.
+    :param word_features: (words, features) matrix
+    """
+    words_count, features_count = word_features.shape
+    padding = np.zeros((window_half_width, features_count), dtype=word_features.dtype)
+    flat_features = np.concatenate([padding, word_features, padding]).ravel()
+    windows = sliding_window_view(flat_features, 2 * window_half_width * features_count)
+    return windows[:words_count * features_count:window_step * features_count]
+
+
+def classify_ngrams_in_text(
+    text: str,
+    window_half_width: int,
+    window_step: int,
+    batch_size: int = NGRAM_BATCH_SIZE
+) -> Generator[Tuple[int, str, int, int], None, None]:
+    """
+    Classify the windows of the text's words with one predict() call per batch_size windows.
+    :return: (NGramType, word, start, end) for each window (see prepare_ngrams_in_text)
+    """
+    words = get_words_with_features(text)
+    if not words:
+        return
+    word_features = np.array([w[4] for w in words], dtype=np.float32)
+    ngram_features = get_ngram_feature_matrix(word_features, window_half_width, window_step)
+    for batch_start in range(0, len(ngram_features), batch_size):
+        ngram_types = NGRAM_CLASSIFIER.predict(ngram_features[batch_start:batch_start + batch_size])
+        for i, ngram_type in enumerate(ngram_types.tolist(), batch_start):
+            word, _pos_token, word_start_pos, word_end_pos, _features = words[i * window_step]
+            yield ngram_type, word, word_start_pos, word_end_pos
+
+
+def get_address_spans(text: str, batched: bool = True) -> Generator[Tuple[str, int, int], None, None]:
+    """
+    :param batched: classify the word windows in batches (see classify_ngrams_in_text)
+        rather than one by one, the results are the same
+    """
+    if batched:
+        ngram_types = ((ngram_type, start, end) for ngram_type, _word, start, end
+                       in classify_ngrams_in_text(text, NGRAM_WINDOW_HALF_WIDTH, NGRAM_WINDOW_STEP))
+    else:
+        ngram_types = ((NGRAM_CLASSIFIER.predict([ngram_features]), start, end) for ngram_features, _word, start, end
+                       in prepare_ngrams_in_text(text, NGRAM_WINDOW_HALF_WIDTH, NGRAM_WINDOW_STEP))
+    yield from get_spans_by_ngram_types(text, ngram_types)
+
+
+def get_spans_by_ngram_types(
+    text: str,
+    ngram_types: Iterable[Tuple[int, int, int]]
+) -> Generator[Tuple[str, int, int], None, None]:
+    """
+    Join the classified words into addresses.
+    :param ngram_types: (NGramType, word start, word end) of the words
+    """
     possible_address_start = None
     possible_address_end = None
     margin = 0
-    for ngram_features, _word, word_start_pos, word_end_pos \
-            in prepare_ngrams_in_text(text, NGRAM_WINDOW_HALF_WIDTH, NGRAM_WINDOW_STEP):
-        ngram_type = NGRAM_CLASSIFIER.predict([ngram_features])
+    for ngram_type, word_start_pos, word_end_pos in ngram_types:
 
         if possible_address_start is None:
             if ngram_type in (NGramType.ADDR_START, NGramType.ADDR_MIDDLE):
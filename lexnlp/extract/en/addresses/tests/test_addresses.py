@@ -6,7 +6,9 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from lexnlp.extract.en.addresses.addresses import get_address_spans, _safe_index
+import numpy as np
+
+from lexnlp.extract.en.addresses.addresses import get_address_spans, get_ngram_feature_matrix, _safe_index
 from lexnlp.tests import lexnlp_tests
 from nose.tools import assert_true, assert_equal
 
@@ -16,6 +18,24 @@ def test_get_address():
                                                    actual_data_converter=lambda l: [t[0] for t in l])
 
 
+def test_get_address_batched():
+    text = 'The Company is located at 1600 Pennsylvania Avenue NW, Washington, DC 20500, ' \
+           'the Bank at 350 Fifth Avenue, New York, NY 10118.'
+    assert_equal(list(get_address_spans(text, batched=False)), list(get_address_spans(text)))
+
+
+def test_ngram_feature_matrix():
+    word_features = np.arange(1, 22).reshape(7, 3)
+    for window_step in (1, 2):
+        expected = []
+        for i in range(0, 7, window_step):
+            features = []
+            for j in range(i - 2, i + 2):
+                features.extend(word_features[j] if 0 <= j < 7 else [0, 0, 0])
+            expected.append(features)
+        assert_equal(expected, get_ngram_feature_matrix(word_features, 2, window_step).tolist())
+
+
 def test_safe_index():
     actual = _safe_index('hello world', 'world', 1)
     assert_equal(actual, 6)
@@ -45,6 +45,7 @@ from num2words import num2words
 
 from lexnlp.utils.amount_delimiting import infer_delimiters
 from lexnlp.extract.common.annotations.amount_annotation import AmountAnnotation
+from lexnlp.nlp.en.pos_tagging import pos_tag
 
 
 # Define small numbers
@@ -301,7 +302,7 @@ def text2num(
 
 def get_np(text) -> Generator[str, None, None]:
     tokens: List[str] = nltk.word_tokenize(text)
-    pos_tokens: nltk.tree.Tree = nltk.tag.pos_tag(tokens)
+    pos_tokens: List[Tuple[str, str]] = pos_tag(tokens)
     chunks: nltk.tree.Tree = chunker.parse(pos_tokens)
     for subtree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
         yield ' '.join(i[0] for i in subtree.leaves())
@@ -341,6 +342,10 @@ def get_amounts(
     :param float_digits: round float to N digits, don't round if None
     :return: list of amounts
     """
+    if not return_sources:
+        # the values don't depend on the extended sources
+        yield from parse_amounts(text, float_digits)
+        return
     ant: AmountAnnotation
     for ant in get_amount_annotations(text, extended_sources, float_digits):
         if return_sources:
@@ -373,6 +378,13 @@ def get_amount_list(
     )
 
 
+def parse_amounts(text: str, float_digits: int = 4) -> List[Decimal]:
+    """
+    Values of the amounts found in the text (get_amounts without the sources).
+    """
+    return [ant.value for ant in get_amount_annotations(text, False, float_digits)]
+
+
 def get_amount_annotations(
     text: str,
     extended_sources: bool = True,
@@ -22,6 +22,7 @@ import regex as re
 from reporters_db import EDITIONS, REPORTERS
 
 from lexnlp.extract.common.annotations.citation_annotation import CitationAnnotation
+from lexnlp.utils.phrase_trie import get_alternation_pattern
 
 
 CITATION_PTN = r"""
@@ -34,7 +35,7 @@ CITATION_PTN = r"""
 (?:\s+\((.+?)?(\d{{4}})\))?
 )
 (?:\W|$)
-""".format(reporters='|'.join([re.escape(i) for i in EDITIONS]))
+""".format(reporters=get_alternation_pattern(list(EDITIONS), ignore_case=True))
 CITATION_PTN_RE = re.compile(CITATION_PTN, re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
 
 
@@ -27,9 +27,13 @@ from lexnlp.extract.common.base_path import lexnlp_base_path
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
 from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id, DictionaryEntry, \
     DictionaryEntryAlias
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    PARSER_SOURCE_PATHS
+from lexnlp.extract.en import en_language_tokens
 from lexnlp.extract.en.en_language_tokens import EnLanguageTokens
+from lexnlp.utils.dictionary_cache import DICTIONARY_CACHE
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
+from lexnlp.utils.model_registry import get_module_getattr
 
 
 def _get_courts(
@@ -68,15 +72,16 @@ def _get_courts(
         yield ent.entity
 
 
+COURT_DATAFRAME_PATHS = [os.path.join(lexnlp_base_path, 'lexnlp/config/en', p)
+                         for p in ['us_state_courts.csv',
+                                   'us_courts.csv',
+                                   'ca_courts.csv',
+                                   'au_courts.csv']]
+
+
 def setup_en_parser():
     ptrs = ParserInitParams()
-    file_path = os.path.join(lexnlp_base_path, 'lexnlp/config/en')
-    ptrs.dataframe_paths = ['us_state_courts.csv',
-                            'us_courts.csv',
-                            'ca_courts.csv',
-                            'au_courts.csv']
-    ptrs.dataframe_paths = [os.path.join(file_path, p)
-                            for p in ptrs.dataframe_paths]
+    ptrs.dataframe_paths = list(COURT_DATAFRAME_PATHS)
 
     ptrs.split_ptrs = LineSplitParams()
     ptrs.split_ptrs.line_breaks = {'\n', '.', ';', ','}.union(set(EnLanguageTokens.conjunctions))
@@ -86,21 +91,30 @@ def setup_en_parser():
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_en_parser()
+# the parser is read from the dictionary cache or built on first use
+PARSER = DICTIONARY_CACHE.register(
+    'en.court_parser',
+    setup_en_parser,
+    COURT_DATAFRAME_PATHS + PARSER_SOURCE_PATHS + [
+        __file__,
+        en_language_tokens.__file__,
+        os.path.join(os.path.dirname(en_language_tokens.__file__), 'data/abbreviations.txt')])
+
+__getattr__ = get_module_getattr(__name__, {'parser': PARSER})
 
 
 def get_court_annotations(text: str, language: str = 'en') -> Generator[CourtAnnotation, None, None]:
-    yield from parser.parse(text, language)
+    yield from PARSER.get().parse(text, language)
 
 
 def get_court_annotation_list(text: str, language: str = 'en') -> List[CourtAnnotation]:
-    return list(parser.parse(text, language))
+    return list(PARSER.get().parse(text, language))
 
 
 def get_courts(text: str, language: str = 'en') -> Generator[dict, None, None]:
-    for court_annotation in parser.parse(text, language):
+    for court_annotation in PARSER.get().parse(text, language):
         yield court_annotation.to_dictionary()
 
 
 def get_court_list(text: str, language: str = 'en') -> List[CourtAnnotation]:
-    return list(parser.parse(text, language))
+    return list(PARSER.get().parse(text, language))
@@ -18,14 +18,19 @@ import os
 import string
 import joblib
 
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
+
 
 # Setup path
 
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load model
-MODEL_DATE = joblib.load(os.path.join(MODULE_PATH, "./date_model.pickle"))
+# Model is loaded on first use
+DATE_MODEL_PATH = os.path.join(MODULE_PATH, "./date_model.pickle")
+DATE_MODEL = MODEL_REGISTRY.register('en.date_model', lambda: joblib.load(DATE_MODEL_PATH), path=DATE_MODEL_PATH)
+
+__getattr__ = get_module_getattr(__name__, {'MODEL_DATE': DATE_MODEL})
 
 ALPHA_CHAR_SET = set(string.ascii_letters)
 DATE_MODEL_CHARS = []
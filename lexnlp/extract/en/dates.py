@@ -28,8 +28,10 @@ from lexnlp.extract.all_locales.languages import Locale
 from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
 from lexnlp.extract.common.date_parsing.datefinder import DateFinder
 from lexnlp.extract.common.dates import DateParser
-from lexnlp.extract.common.dates_classifier_model import build_date_model, get_date_features
-from lexnlp.extract.en.date_model import MODEL_DATE, MODULE_PATH, DATE_MODEL_CHARS
+from lexnlp.extract.common.dates_classifier_model import build_date_model, get_date_features, DateFeatureExtractor
+from lexnlp.extract.en.date_model import DATE_MODEL, MODULE_PATH, DATE_MODEL_CHARS
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
+from lexnlp.utils.iterating_helpers import chunk_sequence, with_previous
 
 
 # Distance in characters to use to merge two date strings
@@ -67,6 +69,12 @@ MONTH_BY_NAME = get_month_by_name()
 
 MONTH_FULLS = {v.lower(): k for k, v in enumerate(calendar.month_name)}
 
+# Features for the false positive classifier in DATE_MODEL.columns order, built on first use
+DATE_FEATURES = MODEL_REGISTRY.register(
+    'en.date_feature_extractor', lambda: DateFeatureExtractor(DATE_MODEL_CHARS, DATE_MODEL.get().columns))
+
+__getattr__ = get_module_getattr(__name__, {'MODEL_DATE': DATE_MODEL, 'DATE_FEATURE_EXTRACTOR': DATE_FEATURES})
+
 
 def get_raw_date_list(text, strict=False, base_date=None, return_source=False, locale=None) -> List:
     return list(get_raw_dates(
@@ -100,11 +108,11 @@ def get_raw_dates(text, strict=False, base_date=None,
         if extra_token != 't':
             date_finder.REPLACEMENTS[extra_token] = ' '
 
-    # Iterate through possible matches
-    possible_dates = list(date_finder.extract_date_strings(text, strict=strict))
+    # Iterate through possible matches as they are found, "day of" strings look at the previous one
     possible_matched = []
 
-    for i, possible_date in enumerate(possible_dates):
+    for i, (previous_date, possible_date) in enumerate(
+            with_previous(date_finder.extract_date_strings(text, strict=strict))):
         # Get
         date_string = possible_date[0]
         index = possible_date[1]
@@ -112,10 +120,10 @@ def get_raw_dates(text, strict=False, base_date=None,
 
         # Cleanup "day of" strings
         if "of" in date_props["extra_tokens"] or "OF" in date_props["extra_tokens"]:
-            num_dig_mod = len(possible_dates[i - 1][2]["digits_modifier"])
+            num_dig_mod = len(previous_date[2]["digits_modifier"]) if i > 0 else 0
             if i > 0 and not possible_matched[i - 1] and num_dig_mod == 1:
-                date_props["digits_modifier"].extend(possible_dates[i - 1][2]["digits_modifier"])
-                date_string = possible_dates[i - 1][2]["digits_modifier"].pop() \
+                date_props["digits_modifier"].extend(previous_date[2]["digits_modifier"])
+                date_string = previous_date[2]["digits_modifier"].pop() \
                                   .replace("st", "") \
                                   .replace("nd", "") \
                                   .replace("rd", "") \
@@ -351,7 +359,8 @@ def get_dates(text: str,
               base_date=None,
               return_source=False,
               threshold=0.50,
-              locale='') -> Generator:
+              locale='',
+              batch_size: Optional[int] = None) -> Generator:
     """
     Find dates after cleaning false positives.
     :param text: raw text to search
@@ -360,10 +369,11 @@ def get_dates(text: str,
     :param return_source: whether to return raw text around date
     :param threshold: probability threshold to use for false positive classifier
     :param locale: locale string
+    :param batch_size: max number of raw dates scored by one classifier call, see get_date_annotations
     :return:
     """
     # Get raw dates
-    for ant in get_date_annotations(text, strict, locale, base_date, threshold):
+    for ant in get_date_annotations(text, strict, locale, base_date, threshold, batch_size=batch_size):
         if return_source:
             yield ant.date, ant.coords
         else:
@@ -374,7 +384,8 @@ def get_date_annotations(text: str,
                          strict: Optional[bool] = None,
                          locale: Optional[str] = '',
                          base_date: Optional[datetime.datetime] = None,
-                         threshold: float = 0.50) \
+                         threshold: float = 0.50,
+                         batch_size: Optional[int] = None) \
         -> Generator[DateAnnotation, None, None]:
     """
     Find dates after cleaning false positives.
@@ -383,6 +394,9 @@ def get_date_annotations(text: str,
     :param locale: locale string
     :param base_date: base date to use for implied or partial matches
     :param threshold: probability threshold to use for false positive classifier
+    :param batch_size: max number of raw dates scored by one classifier call. By default
+                       all raw dates of the text are collected and scored at once; set
+                       the batch size to stream the annotations chunk by chunk.
     :return:
     """
 
@@ -391,21 +405,20 @@ def get_date_annotations(text: str,
     raw_date_results = get_raw_dates(
         text, strict=strict, base_date=base_date, return_source=True, locale=Locale(locale))
 
-    for raw_date in raw_date_results:
-        feature_row = get_date_features(text, raw_date[1][0], raw_date[1][1], characters=DATE_MODEL_CHARS)
-        feature_list = len(feature_row) * [0.0]
-        for i, col in enumerate(MODEL_DATE.columns):
-            feature_list[i] = feature_row[col]
-        date_score = MODEL_DATE.predict_proba([feature_list])
-        if date_score[0, 1] >= threshold:
-            date, coordinates = raw_date
-            annotation = DateAnnotation(
-                coords=coordinates,
-                text=text[slice(*coordinates)],
-                date=date,
-                score=date_score[0, 1]
-            )
-            yield annotation
+    for raw_dates in chunk_sequence(raw_date_results, batch_size):
+        feature_matrix = DATE_FEATURES.get().get_feature_matrix(
+            text, [coordinates for _date, coordinates in raw_dates])
+        date_scores = DATE_MODEL.get().predict_proba(feature_matrix)
+
+        for (date, coordinates), date_score in zip(raw_dates, date_scores[:, 1]):
+            if date_score >= threshold:
+                annotation = DateAnnotation(
+                    coords=coordinates,
+                    text=text[slice(*coordinates)],
+                    date=date,
+                    score=date_score
+                )
+                yield annotation
 
 
 def train_default_model(save=True):
@@ -755,6 +768,6 @@ def train_default_model(save=True):
         os.unlink("test_date_model.pickle")
 
 
-parser = DateParser(DATE_MODEL_CHARS, enable_classifier_check=True, locale=Locale('en-US'), classifier_model=MODEL_DATE)
+parser = DateParser(DATE_MODEL_CHARS, enable_classifier_check=True, locale=Locale('en-US'), classifier_model=DATE_MODEL)
 _get_dates = parser.get_dates
 _get_date_list = parser.get_date_list
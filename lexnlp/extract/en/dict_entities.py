@@ -26,6 +26,7 @@ __email__ = "support@contraxsuite.com"
 
 
 import csv
+import pickle
 import re
 from typing import Union, List, Dict, Set, Tuple, Callable, Generator, Any, Optional
 
@@ -34,6 +35,7 @@ import pandas as pd
 from lexnlp.extract.all_locales.languages import DEFAULT_LANGUAGE
 from lexnlp.extract.common.annotations.phrase_position_finder import PhrasePositionFinder
 from lexnlp.nlp.en.tokens import get_token_list, get_stem_list
+from lexnlp.utils.phrase_trie import PhraseTrie
 
 
 reg_space = re.compile(r'\s+')
@@ -155,13 +157,20 @@ class DictionaryEntry:
         local_name_column = local_name_column or name_column
         extra_columns = extra_columns if extra_columns is not None else \
             {'ISO-3166-2': 'iso_3166_2', 'ISO-3166-3': 'iso_3166_3'}
-        for _, row in config.iterrows():
+        # read the rows as value arrays: DataFrame.iterrows builds a Series per row
+        positions = {column: i for i, column in enumerate(config.columns)}
+
+        def get(values, column):
+            return values[positions[column]] if column in positions else None
+
+        for row in config.values:
             r = DictionaryEntry(
-                id=int(row[entity_id_column]),
-                name=row[local_name_column],
-                priority=int(row[priority_column]) if priority_column and row[priority_column] else 0,
-                entity_name=row[name_column] if name_column else row[local_name_column],
-                category=row.get(entity_category_column) or '')
+                id=int(row[positions[entity_id_column]]),
+                name=row[positions[local_name_column]],
+                priority=int(row[positions[priority_column]])
+                if priority_column and row[positions[priority_column]] else 0,
+                entity_name=row[positions[name_column]] if name_column else row[positions[local_name_column]],
+                category=get(row, entity_category_column) or '')
             if not alias_columns:
                 alias_columns = [DictionaryEntryAlias(name_column, DEFAULT_LANGUAGE.code, False),
                                  DictionaryEntryAlias(local_name_column, language, False),
@@ -170,7 +179,7 @@ class DictionaryEntry:
                                  DictionaryEntryAlias('ISO-3166-3', language, True)]
             r.aliases = []
             for a in alias_columns:
-                aliases = row.get(a.alias)
+                aliases = get(row, a.alias)
                 if not aliases or not isinstance(aliases, str):
                     continue
                 for alias in aliases.split(';'):
@@ -179,7 +188,7 @@ class DictionaryEntry:
             if extra_columns:
                 r.extra_columns = {}
                 for ec in extra_columns:
-                    r.extra_columns[extra_columns[ec]] = row[ec]
+                    r.extra_columns[extra_columns[ec]] = row[positions[ec]]
 
             records.append(r)
         return records
@@ -377,90 +386,183 @@ def alias_is_banlisted(alias_ban_list: Optional[Dict[str, AliasBanList]],
     return False
 
 
-def _find_entity_positions(normalized_text: str,
-                           normalized_text_lowercase: str,
-                           entity: DictionaryEntry,
-                           text_languages: Union[List[str], Tuple[str], Set[str]],
-                           alias_language_order: Optional[List[str]],
-                           context: Dict[int, SearchResultPosition] = None,
-                           use_stemmer: bool = False,
-                           abbrev_uppercase_check_range: int = 20,
-                           min_alias_len: int = None,
-                           alias_ban_list: Union[None, Dict[str, AliasBanList]] = None,
-                           simplified_normalization: bool = False):
-    """
-    Searches for all occurrences of name/alias of the specified entity in the specified text and fills the
-    provided context dict with them.
-    Operates on the provided search context - a map of alias/name positions to the SearchResultPosition entries.
-    If there is a previously found name/alias at the same position in the text - the longest name/alias is
-    stored in the context and the shorter one is dropped.
-    So after the series of execution of this method on the shared context it will be filled with the best matching
-    search results for each starting position in the text. Next these results should be ordered by start index and
-    checked for intersections - to drop entries having shorter names/aliases.
-    Alias languages are taken into account in this method - if a language of the source text is specified then
-    only aliases of this language are being searched for.
-
-    :param normalized_text Non-lowercase version of the normalized source text - to search for abbreviations.
-    :param normalized_text_lowercase: Lowercase version of the normalized source text - to search for non-abbrevs.
-    :param text_languages: If set - then only aliases of these languages will be searched for.
-    :param alias_language_order: pick the alias with the default language among the others
-    :param entity:
-    :param context: Map of alias/name positions in the source text to SearchResultPosition entries.
-    This context can be shared between multiple executions of this functions to reach the results of the overall search
-    of multiple DictEntities with the longest matching DictEntity on each position.
-    Can be None - for the case of single DictEntity search.
-    :param alias_ban_list: Prepared ban list of aliases to exclude from search.
-    Should be: dict of language -> tuple (list of normalized non-abbreviations, list of normalized abbreviations)
-    "None" is a key for "any" language.
-    :param abbrev_uppercase_check_range: To avoid false-positives in detecting abbreviations similar to AND, OR, IN
-    we need to ensure that it is not english words appeared in a piece of text written in uppercase.
-    For this for each abbrev we ignore it if text[position - range : position + range] == uppercase(text[...]).
-    :return:
-    """
-
-    def abbrev_in_uppercase_block(text: str, position: int, check_range: int):
-        block = text[max(0, position - check_range): min(len(text), position + check_range)]
-        block_upper = block.upper()
-        return block == block_upper
-
-    if context is None:
-        context = {}
-
-    if not entity.aliases:
-        return
+def abbrev_in_uppercase_block(text: str, position: int, check_range: int) -> bool:
+    block = text[max(0, position - check_range): min(len(text), position + check_range)]
+    block_upper = block.upper()
+    return block == block_upper
 
-    for ea in entity.aliases:
-        alias_text = ea.alias
-        alias_lang = ea.language
-        alias_is_abbreviation = ea.is_abbreviation
 
-        # get or create normalized alias
-        normalized_alias = ea.normalized_alias if ea.normalized_alias \
-            else normalize_text(alias_text,
-                                lowercase=not alias_is_abbreviation,
-                                use_stemmer=use_stemmer,
-                                simple_tokenization=simplified_normalization)
-
-        if not alias_text or (
-                        text_languages and alias_lang and alias_lang not in text_languages):
-            continue
-        if min_alias_len and len(alias_text) < min_alias_len:
-            continue
+class DictionaryIndex:
+    """
+    Prebuilt index of the normalized names / aliases of the DictionaryEntry list for searching all of them
+    in one pass over the text.
+
+    The normalized aliases are grouped by language. Each language bucket stores two tries:
+    abbreviations are searched for case-sensitive in the normalized text, other aliases - in the lowercase
+    version of the normalized text. Aliases dropped by the ban list or by the min. alias length passed
+    to the constructor are not indexed at all.
+
+    Build the index once and pass it to find_dict_entities() (GeoEntityLocator, get_geoentity_annotations, ...)
+    instead of the entity list, e.g.:
+    index = DictionaryIndex(geo_config_list, alias_ban_list=prepare_alias_banlist_dict(ALIAS_BLACK_LIST))
+    index.save('geo_index.pickle')
+    ...
+    index = DictionaryIndex.load('geo_index.pickle')
+    find_dict_entities(text, index, default_language='en')
+
+    The pickled index contains the entities and the normalized aliases only, the tries are rebuilt
+    on loading, that takes much less time than normalizing the aliases.
+    The index references the entities - rebuild it if the entities or their aliases are changed.
+    """
 
-        normalized_text_for_alias = normalized_text if alias_is_abbreviation else normalized_text_lowercase
+    def __init__(self,
+                 entities: List[DictionaryEntry],
+                 alias_ban_list: Optional[Dict[str, AliasBanList]] = None,
+                 min_alias_len: Optional[int] = None,
+                 use_stemmer: bool = False,
+                 simplified_normalization: bool = False):
+        """
+        :param entities: all possible entities to search for
+        :param alias_ban_list: prepared ban list (see prepare_alias_banlist_dict()) of aliases to exclude from index
+        :param min_alias_len: minimal length of the aliases to index
+        :param use_stemmer: normalize aliases (having no normalized_alias) using stemmer
+        :param simplified_normalization: normalize aliases (having no normalized_alias) without NLTK
+        """
+        self.entities = entities
+        self.use_stemmer = use_stemmer
+        self.simplified_normalization = simplified_normalization
+        # [(normalized alias, entity index, alias index), ...]
+        self.alias_rows = []  # type: List[Tuple[str, int, int]]
+
+        for entity_index, entity in enumerate(entities):
+            for alias_index, ea in enumerate(entity.aliases):
+                if not ea.alias:
+                    continue
+                if min_alias_len and len(ea.alias) < min_alias_len:
+                    continue
+                normalized_alias = ea.normalized_alias if ea.normalized_alias \
+                    else normalize_text(ea.alias,
+                                        lowercase=not ea.is_abbreviation,
+                                        use_stemmer=use_stemmer,
+                                        simple_tokenization=simplified_normalization)
+                if alias_is_banlisted(alias_ban_list, normalized_alias, ea.language, ea.is_abbreviation):
+                    continue
+                self.alias_rows.append((normalized_alias, entity_index, alias_index))
+        self._build_tries()
+
+    def _build_tries(self) -> None:
+        # alias language -> (abbreviations trie, other aliases trie)
+        # normalized alias -> [(entity index, alias index), ...]
+        self.language_tries = {}  # type: Dict[str, Tuple[PhraseTrie, PhraseTrie]]
+        for normalized_alias, entity_index, alias_index in self.alias_rows:
+            ea = self.entities[entity_index].aliases[alias_index]
+            tries = self.language_tries.get(ea.language or '')
+            if tries is None:
+                tries = (PhraseTrie(), PhraseTrie())
+                self.language_tries[ea.language or ''] = tries
+            trie = tries[0] if ea.is_abbreviation else tries[1]
+            trie.add(normalized_alias, (entity_index, alias_index))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['language_tries']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build_tries()
+
+    def save(self, file_path: str) -> None:
+        with open(file_path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-        if alias_is_banlisted(alias_ban_list, normalized_alias, alias_lang, alias_is_abbreviation):
-            continue
+    @classmethod
+    def load(cls, file_path: str) -> 'DictionaryIndex':
+        with open(file_path, 'rb') as f:
+            index = pickle.load(f)
+        if not isinstance(index, cls):
+            raise TypeError(f'"{file_path}" does not contain {cls.__name__}')
+        return index
+
+    def matches_settings(self,
+                         use_stemmer: bool = False,
+                         simplified_normalization: bool = False) -> bool:
+        return self.use_stemmer == use_stemmer and self.simplified_normalization == simplified_normalization
+
+    def find_entity_positions(self,
+                              normalized_text: str,
+                              normalized_text_lowercase: str,
+                              text_languages: Union[List[str], Tuple[str], Set[str]],
+                              alias_language_order: Optional[List[str]],
+                              context: Dict[int, SearchResultPosition] = None,
+                              abbrev_uppercase_check_range: int = 20,
+                              min_alias_len: int = None,
+                              alias_ban_list: Union[None, Dict[str, AliasBanList]] = None) \
+            -> Dict[int, SearchResultPosition]:
+        """
+        Searches for all occurrences of names/aliases of the indexed entities in the specified text and fills
+        the provided context dict with them.
+        The context is a map of alias/name positions to the SearchResultPosition entries.
+        If there is a previously found name/alias at the same position in the text - the longest name/alias is
+        stored in the context and the shorter one is dropped.
+        So after the search the context is filled with the best matching search results for each starting
+        position in the text. Next these results should be ordered by start index and checked for
+        intersections - to drop entries having shorter names/aliases.
+        Alias languages are taken into account in this method - if a language of the source text is specified
+        then only aliases of this language are being searched for.
+
+        The found occurrences are processed in the same order as if each alias of each entity were searched
+        for separately: entity by entity, alias by alias, left to right. An alias occurrence overlapping the
+        previous occurrence of the same alias (except for the boundary space) is skipped.
+
+        :param normalized_text Non-lowercase version of the normalized source text - to search for abbreviations.
+        :param normalized_text_lowercase: Lowercase version of the normalized source text - to search for
+        non-abbrevs.
+        :param text_languages: If set - then only aliases of these languages will be searched for.
+        :param alias_language_order: pick the alias with the default language among the others
+        :param context: Map of alias/name positions in the source text to SearchResultPosition entries.
+        Can be None - then a new dict is returned.
+        :param alias_ban_list: Prepared ban list of aliases to exclude from search.
+        Should be: dict of language -> tuple (list of normalized non-abbreviations, list of normalized abbreviations)
+        "None" is a key for "any" language.
+        :param abbrev_uppercase_check_range: To avoid false-positives in detecting abbreviations similar to AND, OR, IN
+        we need to ensure that it is not english words appeared in a piece of text written in uppercase.
+        For this for each abbrev we ignore it if text[position - range : position + range] == uppercase(text[...]).
+        :param min_alias_len: minimal length of the alias text
+        :return: the context
+        """
+        if context is None:
+            context = {}
 
-        start = None
-        while True:
-            start = normalized_text_for_alias.find(
-                normalized_alias, start + len(normalized_alias) - 1 if start is not None else 0)
-            if start < 0:
-                break
+        # (entity index, alias index, start, normalized alias)
+        occurrences = []  # type: List[Tuple[int, int, int, str]]
+        for alias_lang, (abbreviation_trie, alias_trie) in self.language_tries.items():
+            if text_languages and alias_lang and alias_lang not in text_languages:
+                continue
+            for trie, text in ((abbreviation_trie, normalized_text),
+                               (alias_trie, normalized_text_lowercase)):
+                for start, end, entity_aliases in trie.find_all(text):
+                    for entity_index, alias_index in entity_aliases:
+                        occurrences.append((entity_index, alias_index, start, text[start:end]))
+        occurrences.sort()
+
+        last_alias, next_start, skip_alias = None, 0, False
+        for entity_index, alias_index, start, normalized_alias in occurrences:
+            if last_alias != (entity_index, alias_index):
+                last_alias, next_start = (entity_index, alias_index), 0
+                entity = self.entities[entity_index]
+                ea = entity.aliases[alias_index]
+                alias_text = ea.alias
+                alias_lang = ea.language
+                alias_is_abbreviation = ea.is_abbreviation
+                skip_alias = bool(min_alias_len and len(alias_text) < min_alias_len) \
+                    or alias_is_banlisted(alias_ban_list, normalized_alias, alias_lang, alias_is_abbreviation)
+            if skip_alias or start < next_start:
+                continue
+            next_start = start + len(normalized_alias) - 1
 
             if alias_is_abbreviation and \
-                    abbrev_in_uppercase_block(normalized_text_for_alias, start, abbrev_uppercase_check_range):
+                    abbrev_in_uppercase_block(normalized_text, start, abbrev_uppercase_check_range):
                 continue
             end = start + len(normalized_alias) - 1
 
@@ -470,6 +572,7 @@ def _find_entity_positions(normalized_text: str,
             else:
                 context[start] = SearchResultPosition(
                     entity, ea, start, end, normalized_text[start: end])
+        return context
 
 
 class DictionaryEntity:
@@ -490,7 +593,7 @@ class DictionaryEntity:
 
 
 def find_dict_entities(text: str,
-                       all_possible_entities: List[DictionaryEntry],
+                       all_possible_entities: Union[List[DictionaryEntry], DictionaryIndex],
                        default_language: str,
                        text_languages: Union[List[str], Tuple[str], Set[str]] = None,
                        conflict_resolving_func: Callable[[List[Tuple[DictionaryEntry, DictionaryEntryAlias]], str],
@@ -517,9 +620,10 @@ def find_dict_entities(text: str,
     Algorithm of this method:
     1. Normalize the source text (we need lowercase and non-lowercase versions for abbrev searches).
     2. Create a shared search context - a map of position -> (alias text + list of matching entities)
-    3. For each possible entity do search using the shared context:
+    3. Find all occurrences of all aliases in one pass using the tries of DictionaryIndex.
+       For each possible entity fill the shared context with the occurrences found:
         3.1. For each alias of the entity:
-            3.1.1. Iteratively search for all occurrences of the alias taking into account its language, abbrev status.
+            3.1.1. Take all occurrences of the alias taking into account its language, abbrev status.
                     For each found occurrence of the alias - check if there is already found another alias and entity
                     at this position and leave only the one having the longest alias ("Something" vs "Something Bigger")
                     If there is already a found different entity on this position having totally equal alias with
@@ -535,14 +639,10 @@ def find_dict_entities(text: str,
     while the longer match can start at the earlier position then the shorter match and there can be multiple aliases
     of different entities matching the same piece of text.
 
-    Another algorithm for this function can be based on the idea that or-kind regexp returns the longest matching group.
-    We could form regexps containing the possible aliases and apply them to the source text:
-    r'alias1|alias2|longer alias2|...'
-
-    TODO Compare to other algorithms for time and memory complexity
-
     :param text:
-    :param all_possible_entities: list of dict or list of DictEntity - all possible entities to search for
+    :param all_possible_entities: list of DictionaryEntry - all possible entities to search for, or
+    DictionaryIndex built for them. Pass the index when searching in multiple texts: building the index
+    (normalizing all aliases) is the most expensive part of the search.
     :param default_language: the language that's preferred among several aliases
     :param min_alias_len: Minimal length of alias/name to search for. Can be used to ignore too short aliases like "M."
     while searching.
@@ -576,22 +676,22 @@ def find_dict_entities(text: str,
                                                         simple_tokenization=False)
     normalized_text_lowercase = normalized_text.lower()
 
-    search_context = {}
-    # Search for each DictEntity occurrence adding them into the shared search context.
-    # while searching for entities from the dictionary by their attributes / aliases
-    # we may
+    alias_index = all_possible_entities
+    if not isinstance(alias_index, DictionaryIndex):
+        alias_index = DictionaryIndex(alias_index,
+                                      use_stemmer=use_stemmer,
+                                      simplified_normalization=simplified_normalization)
+    elif not alias_index.matches_settings(use_stemmer, simplified_normalization):
+        raise ValueError('DictionaryIndex was built with different use_stemmer / simplified_normalization settings')
+
+    # Search for all DictEntity occurrences adding them into the shared search context.
     alias_lang_order = [default_language] + (text_languages or [])
-    for dict_entity in all_possible_entities:
-        _find_entity_positions(normalized_text,
-                               normalized_text_lowercase,
-                               dict_entity,
-                               text_languages,
-                               alias_lang_order,
-                               search_context,
-                               use_stemmer=use_stemmer,
-                               min_alias_len=min_alias_len,
-                               alias_ban_list=prepared_alias_ban_list,
-                               simplified_normalization=simplified_normalization)
+    search_context = alias_index.find_entity_positions(normalized_text,
+                                                       normalized_text_lowercase,
+                                                       text_languages,
+                                                       alias_lang_order,
+                                                       min_alias_len=min_alias_len,
+                                                       alias_ban_list=prepared_alias_ban_list)
 
     # At this moment we have a map of positions in the text
     # to SearchResultPosition entries (position + appeared name/alias + DictEntity).
@@ -22,6 +22,8 @@ from lexnlp.extract.en.utils import strip_unicode_punctuation, replace_upper_wor
 from lexnlp.extract.en.entities import nltk_re
 from lexnlp.extract.common.entities.entity_banlist import BanListUsage, default_banlist_usage, EntityBanListItem
 from lexnlp.extract.common.annotations.phrase_position_finder import PhrasePositionFinder
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.pos_tagging import pos_tag
 from lexnlp.nlp.en.segments.sentences import get_sentence_span_list, get_sentence_list
 from lexnlp.nlp.en.tokens import get_token_list
 from lexnlp.utils.pos_adjustments import TokenPosTagAdjustment
@@ -152,7 +154,8 @@ class CompanyDetector:
         use_gnp: bool = False,
         count_unique: bool = False,
         name_upper: bool = False,
-        banlist_usage: Optional[BanListUsage] = None
+        banlist_usage: Optional[BanListUsage] = None,
+        document_context: Optional[DocumentContext] = None
     ) -> Generator[CompanyAnnotation, None, None]:
         """
         Find company names in text, optionally using the stricter article/prefix expression.
@@ -162,13 +165,21 @@ class CompanyDetector:
         :param name_upper: return company name in upper case.
         :param count_unique: return only unique companies - case insensitive.
         :param banlist_usage: a banlist or hints on using the default BL
+        :param document_context: cached analysis of the text shared with other get_* functions
         :return:
         """
+        if document_context is not None:
+            document_context.check_text(text)
         # skip if all text is in uppercase
         if text == text.upper():
             return
         # replace new lines with spaces
-        text = text.replace('\n', ' ')
+        if document_context is not None:
+            document_context = document_context.get_text_variant(
+                'newlines_replaced', lambda t: t.replace('\n', ' '))
+            text = document_context.text
+        else:
+            text = text.replace('\n', ' ')
         banlist = self.get_company_banlist(banlist_usage)
         valid_punctuation = VALID_PUNCTUATION + ["(", ")"]
         unique_companies: Dict[Tuple[str, str], CompanyAnnotation] = {}
@@ -176,14 +187,14 @@ class CompanyDetector:
         if not self.company_types_re.search(text):
             return
         # iterate through sentences
-        for s_start, _s_end, sentence in get_sentence_span_list(text):
+        for s_start, _s_end, sentence in get_sentence_span_list(text, document_context=document_context):
             # skip if whole phrase is in uppercase
             if sentence == sentence.upper():
                 continue
             if use_gnp:
                 phrases = list(get_noun_phrases(sentence, strict=strict, valid_punctuation=valid_punctuation))
             else:
-                phrases = list(self.np_extractor.get_np(sentence))
+                phrases = list(self.np_extractor.get_np(sentence, document_context=document_context))
             phrase_spans = PhrasePositionFinder.find_phrase_in_source_text(sentence, phrases)
 
             for phrase, p_start, _p_end in phrase_spans:
@@ -228,7 +239,8 @@ class CompanyDetector:
                       name_upper: bool = False,
                       parse_name_abbr: bool = False,
                       return_source: bool = False,
-                      banlist_usage: BanListUsage = default_banlist_usage):
+                      banlist_usage: BanListUsage = default_banlist_usage,
+                      document_context: Optional[DocumentContext] = None):
         """
         Find company names in text, optionally using the stricter article/prefix expression.
         :param text:
@@ -240,6 +252,7 @@ class CompanyDetector:
         :param parse_name_abbr: return company abbreviated name if exists.
         :param return_source:
         :param banlist_usage: a banlist or hints on using the default BL
+        :param document_context: cached analysis of the text shared with other get_* functions
         :return:
         """
         # skip if all text is in uppercase
@@ -250,7 +263,8 @@ class CompanyDetector:
                 use_gnp,
                 count_unique,
                 name_upper,
-                banlist_usage):  # type:CompanyAnnotation
+                banlist_usage,
+                document_context=document_context):  # type:CompanyAnnotation
             result = (ant.name, ant.company_type)
             if detail_type:
                 result += (ant.company_type_abbr, ant.company_type_label, ant.description)
@@ -278,17 +292,18 @@ class CompanyDetector:
 
         return self.default_company_banlist
 
-    def get_persons(self, text: str, strict=False, return_source=False, window=2) -> Generator:
+    def get_persons(self, text: str, strict=False, return_source=False, window=2,
+                    document_context: Optional[DocumentContext] = None) -> Generator:
         """
         Get names from text.
         """
-        companies = list(self.get_company_annotations(text))
+        companies = list(self.get_company_annotations(text, document_context=document_context))
         # Iterate through sentences
-        for sentence in get_sentence_list(text):
+        for sentence in get_sentence_list(text, document_context=document_context):
             # Tag sentence
             original_sentence = copy.copy(sentence)
             sentence = replace_upper_words_with_titled(sentence)
-            sentence_pos = nltk.pos_tag(get_token_list(sentence))
+            sentence_pos = pos_tag(get_token_list(sentence), document_context)
 
             # Iterate through chunks
             persons = []
@@ -351,7 +366,9 @@ class CompanyDetector:
     def get_companies_re(self,
                          text: str,
                          use_article: bool = False,
-                         use_sentence_splitter: bool = True) -> Generator[CompanyAnnotation, None, None]:
+                         use_sentence_splitter: bool = True,
+                         document_context: Optional[DocumentContext] = None) \
+            -> Generator[CompanyAnnotation, None, None]:
         """
         Find company names in text, optionally using the stricter article/prefix expression.
         """
@@ -359,7 +376,8 @@ class CompanyDetector:
         re_c = self.re_article_company if use_article else self.re_company
 
         # Iterate through sentences
-        sent_list = get_sentence_span_list(text) if use_sentence_splitter else [(0, len(text), text)]
+        sent_list = get_sentence_span_list(text, document_context=document_context) \
+            if use_sentence_splitter else [(0, len(text), text)]
         for start, _, sentence in sent_list:
             if self.check_backtrack_catastrophy(sentence):
                 continue
@@ -452,15 +470,19 @@ class CompanyDetector:
         return cls.BACKTRACK_CATASTROPHY_COMPANY_RE.search(text)
 
 
-def get_noun_phrases(text, strict=False, return_source=False, window=3, valid_punctuation=None) -> Generator:
+def get_noun_phrases(text, strict=False, return_source=False, window=3, valid_punctuation=None,
+                     document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get NNP phrases from text
     """
     valid_punctuation = valid_punctuation or VALID_PUNCTUATION
+    if document_context is not None:
+        document_context.check_text(text)
+        sentences_pos = zip(document_context.sentences, document_context.get_sentence_pos_tags())
+    else:
+        sentences_pos = ((sentence, pos_tag(get_token_list(sentence))) for sentence in get_sentence_list(text))
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+    for sentence, sentence_pos in sentences_pos:
 
         # Iterate through chunks
         nnps = []
@@ -27,6 +27,8 @@ from lexnlp.extract.common.annotations.company_annotation import CompanyAnnotati
 from lexnlp.extract.common.entities.entity_banlist import BanListUsage
 from lexnlp.config.en.company_types import COMPANY_TYPES, COMPANY_DESCRIPTIONS
 from lexnlp.extract.en.utils import strip_unicode_punctuation
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.pos_tagging import pos_tag
 from lexnlp.nlp.en.segments.sentences import get_sentence_list
 from lexnlp.nlp.en.tokens import get_token_list
 from lexnlp.extract.en.entities.company_detector import CompanyDetector, VALID_PUNCTUATION
@@ -41,19 +43,24 @@ def get_company_annotations(
         use_gnp: bool = False,
         count_unique: bool = False,
         name_upper: bool = False,
-        banlist_usage: Optional[BanListUsage] = None) -> Generator[CompanyAnnotation, None, None]:
+        banlist_usage: Optional[BanListUsage] = None,
+        document_context: Optional[DocumentContext] = None) -> Generator[CompanyAnnotation, None, None]:
     yield from default_company_detector.get_company_annotations(
-        text, strict, use_gnp, count_unique, name_upper, banlist_usage)
+        text, strict, use_gnp, count_unique, name_upper, banlist_usage, document_context=document_context)
 
 
-def get_geopolitical(text, strict=False, return_source=False, window=2) -> Generator:
+def get_geopolitical(text, strict=False, return_source=False, window=2,
+                     document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get GPEs from text
     """
+    if document_context is not None:
+        document_context.check_text(text)
+        sentences_pos = zip(document_context.sentences, document_context.get_sentence_pos_tags())
+    else:
+        sentences_pos = ((sentence, pos_tag(get_token_list(sentence))) for sentence in get_sentence_list(text))
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+    for sentence, sentence_pos in sentences_pos:
 
         # Iterate through chunks
         gpes = []
@@ -106,14 +113,17 @@ def get_companies(text: str,
                   name_upper: bool = False,
                   parse_name_abbr: bool = False,
                   return_source: bool = False,
-                  banlist_usage: Optional[BanListUsage] = None):
+                  banlist_usage: Optional[BanListUsage] = None,
+                  document_context: Optional[DocumentContext] = None):
     return default_company_detector.get_companies(
         text, strict, use_gnp, detail_type, count_unique, name_upper,
-        parse_name_abbr, return_source, banlist_usage)
+        parse_name_abbr, return_source, banlist_usage, document_context=document_context)
 
 
-def get_persons(text: str, strict=False, return_source=False, window=2) -> Generator:
-    return default_company_detector.get_persons(text, strict, return_source, window)
+def get_persons(text: str, strict=False, return_source=False, window=2,
+                document_context: Optional[DocumentContext] = None) -> Generator:
+    return default_company_detector.get_persons(text, strict, return_source, window,
+                                                document_context=document_context)
 
 
 # pylint: disable=unused-argument
@@ -13,13 +13,14 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import List, Tuple, Dict, Generator, Any, Optional
+from typing import List, Tuple, Dict, Generator, Any, Optional, Union
 
 from lexnlp.extract.all_locales.languages import LANG_EN
 from lexnlp.extract.common.geoentity_detector import GeoEntityLocator
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
 from lexnlp.config.en import geoentities_config
-from lexnlp.extract.en.dict_entities import prepare_alias_banlist_dict, DictionaryEntry, DictionaryEntryAlias
+from lexnlp.extract.en.dict_entities import prepare_alias_banlist_dict, DictionaryEntry, DictionaryEntryAlias, \
+    DictionaryIndex
 
 
 _ALIAS_BAN_LIST_PREPARED = prepare_alias_banlist_dict(geoentities_config.ALIAS_BLACK_LIST)
@@ -27,7 +28,7 @@ _ALIAS_BAN_LIST_PREPARED = prepare_alias_banlist_dict(geoentities_config.ALIAS_B
 
 def get_geoentities(
     text: str,
-    geo_config_list: List[DictionaryEntry],
+    geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
     conflict_resolving_field: str = 'none',
     priority_direction: str = 'asc',
     text_languages: List[str] = None,
@@ -61,7 +62,7 @@ def get_geoentities(
 
 def get_geoentity_list(
     text: str,
-    geo_config_list: List[DictionaryEntry],
+    geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
     conflict_resolving_field: str = 'none',
     priority_direction: str = 'asc',
     text_languages: List[str] = None,
@@ -87,7 +88,7 @@ def get_geoentity_list(
 
 def get_geoentity_annotations(
     text: str,
-    geo_config_list: List[DictionaryEntry],
+    geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
     conflict_resolving_field: str = 'none',
     priority_direction: str = 'asc',
     text_languages: List[str] = None,
@@ -120,7 +121,7 @@ def get_geoentity_annotations(
 
 def get_geoentity_annotation_list(
     text: str,
-    geo_config_list: List[DictionaryEntry],
+    geo_config_list: Union[List[DictionaryEntry], DictionaryIndex],
     conflict_resolving_field: str = 'none',
     priority_direction: str = 'asc',
     text_languages: List[str] = None,
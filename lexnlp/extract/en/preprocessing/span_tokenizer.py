@@ -6,10 +6,11 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from nltk import word_tokenize, pos_tag
+from nltk import word_tokenize
 from typing import Tuple, Generator
 
 from lexnlp.extract.common.text_beautifier import TextBeautifier
+from lexnlp.nlp.en.pos_tagging import pos_tag
 
 
 class SpanTokenizer:
@@ -22,7 +22,7 @@ from decimal import Decimal
 
 # LexNLP imports
 from lexnlp.tests import lexnlp_tests
-from lexnlp.extract.en.amounts import get_amounts
+from lexnlp.extract.en.amounts import get_amounts, get_amount_annotations, parse_amounts
 
 
 def test_get_amount():
@@ -89,3 +89,10 @@ outstanding under this Agreement have been declared or have automatically become
 acceleration or otherwise)."""
     for _ in lexnlp_tests.benchmark_extraction_func(get_amounts, text):
         continue
+
+
+def test_parse_amounts():
+    text = 'five hundred and 1/2 dollars, 3.5 million shares and 10,000 miles'
+    expected = [ant.value for ant in get_amount_annotations(text)]
+    assert expected == parse_amounts(text)
+    assert expected == list(get_amounts(text))
@@ -18,9 +18,15 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from lexnlp.extract.en.citations import get_citations
+import regex as re
+from reporters_db import EDITIONS
+
+from nose.tools import assert_equal
+
+from lexnlp.extract.en.citations import CITATION_PTN, CITATION_PTN_RE, get_citations
 from lexnlp.tests import lexnlp_tests
 from lexnlp.tests.dictionary_comparer import DictionaryComparer
+from lexnlp.utils.phrase_trie import get_alternation_pattern
 
 
 def test_get_citations():
@@ -66,3 +72,17 @@ def test_get_citations_as_dict():
     if errors:
         errors_str = '\n'.join(errors)
         raise Exception('Citations test has errors:\n' + errors_str)
+
+
+def test_reporters_trie():
+    # the reporters are compiled as a trie matching the same as the plain alternation
+    trie_reporters = get_alternation_pattern(list(EDITIONS), ignore_case=True)
+    flat_reporters = '|'.join([re.escape(i) for i in EDITIONS])
+    assert trie_reporters != flat_reporters
+    assert trie_reporters in CITATION_PTN
+
+    flat_re = re.compile(CITATION_PTN.replace(trie_reporters, flat_reporters), CITATION_PTN_RE.flags)
+    text = '5 A.L.R. 2d 7; 12 a.d.2d 34; 347 US 483; 1 F. 2 3; 410 U.S. 113, 116 (1973)'
+    expected = [m.groups() for m in flat_re.finditer(text)]
+    assert len(expected) > 3
+    assert_equal(expected, [m.groups() for m in CITATION_PTN_RE.finditer(text)])
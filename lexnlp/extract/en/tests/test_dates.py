@@ -30,7 +30,7 @@ import random
 import string
 
 from lexnlp.extract.en.dates import get_dates_list, get_date_features, \
-    get_raw_date_list, train_default_model
+    get_raw_date_list, train_default_model, get_date_annotations
 from lexnlp.tests import lexnlp_tests
 
 
@@ -94,6 +94,15 @@ class TestDates(TestCase):
             get_dates_list, strict=False,
             expected_data_converter=expected_data_converter)
 
+    def test_batch_size(self):
+        text = 'This letter agreement supersedes your offer letter dated January 28, 2008. ' \
+               'It was renewed on 2019-02-03, again on May 5, 2020 and expires on June 1, 2021.'
+        expected = [(a.coords, a.date, a.score) for a in get_date_annotations(text, batch_size=1)]
+        self.assertEqual(4, len(expected))
+        for batch_size in (None, 2, 100):
+            actual = [(a.coords, a.date, a.score) for a in get_date_annotations(text, batch_size=batch_size)]
+            self.assertEqual(expected, actual)
+
     def test_date_may(self):
         """
         Test that " may " alone does not parse.
@@ -13,12 +13,14 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+import os
+import tempfile
 from unittest import TestCase
 
 from lexnlp.extract.all_locales.languages import LANG_EN
 from lexnlp.extract.en.dict_entities import find_dict_entities, \
     normalize_text, prepare_alias_banlist_dict, alias_is_banlisted, DictionaryEntry, DictionaryEntryAlias, \
-    AliasBanRecord, normalize_text_with_map, reverse_src_to_dest_map
+    AliasBanRecord, normalize_text_with_map, reverse_src_to_dest_map, DictionaryIndex
 from lexnlp.tests import lexnlp_tests
 
 
@@ -49,6 +51,55 @@ class TestDictEntities(TestCase):
         _ent, alias = parsed_enitities[0].entity
         self.assertEqual('Some Entity One', alias.alias)
 
+    def test_search_with_alias_index(self):
+        entities = [DictionaryEntry(1, 'Some Entity', aliases=[DictionaryEntryAlias('Something')]),
+                    DictionaryEntry(2, 'Some Entity One', aliases=[DictionaryEntryAlias('SEO', is_abbreviation=True)]),
+                    DictionaryEntry(3, 'Entity One')]
+        index = DictionaryIndex(entities)
+        text = 'Some Entity One (SEO) and Something or Entity One, but not seo.'
+
+        def get_found(ents):
+            return [(e.coords, e.entity[0].id, e.entity[1].alias) for e in ents]
+
+        expected = get_found(find_dict_entities(text, entities, default_language=LANG_EN.code))
+        self.assertEqual([((0, 15), 2, 'Some Entity One'), ((17, 20), 2, 'SEO'),
+                          ((26, 35), 1, 'Something'), ((39, 49), 3, 'Entity One')], expected)
+        for _ in range(2):
+            actual = get_found(find_dict_entities(text, index, default_language=LANG_EN.code))
+            self.assertEqual(expected, actual)
+
+    def test_dictionary_index_filters_and_pickle(self):
+        entities = [DictionaryEntry(1, 'Island', aliases=[DictionaryEntryAlias('Ice', language='de'),
+                                                          DictionaryEntryAlias('IS', is_abbreviation=True)]),
+                    DictionaryEntry(2, 'Eis', aliases=[DictionaryEntryAlias('Ice', language='en')])]
+        ban_list = prepare_alias_banlist_dict([AliasBanRecord('IS', None, True)])
+        index = DictionaryIndex(entities, alias_ban_list=ban_list, min_alias_len=3)
+        self.assertEqual({'de', 'en', ''}, set(index.language_tries))
+
+        file_path = os.path.join(tempfile.gettempdir(), 'test_dictionary_index.pickle')
+        try:
+            index.save(file_path)
+            index = DictionaryIndex.load(file_path)
+        finally:
+            os.remove(file_path)
+
+        text = 'Ice, IS and Island'
+        found = [(e.coords, e.entity[0].id) for e in
+                 find_dict_entities(text, index, default_language=LANG_EN.code, text_languages=['en'])]
+        self.assertEqual([((0, 3), 2), ((12, 17), 1)], found)
+        found = [(e.coords, e.entity[0].id) for e in
+                 find_dict_entities(text, index, default_language=LANG_EN.code)]
+        self.assertEqual([((0, 3), 1), ((0, 3), 2), ((12, 17), 1)], found)
+        self.assertRaises(ValueError, list, find_dict_entities(text, index, default_language=LANG_EN.code,
+                                                              simplified_normalization=True))
+
+    def test_alias_index_repeated_alias(self):
+        entities = [DictionaryEntry(1, 'Go Go')]
+        text = 'go go go go go'
+        ents = list(find_dict_entities(text, DictionaryIndex(entities), default_language=LANG_EN.code))
+        # each occurrence starts after the previous one ends
+        self.assertEqual([(0, 5), (6, 11)], [e.coords for e in ents])
+
     def test_conflicts_equal_length_take_same_language(self):
         some_entity = DictionaryEntry(1, 'Some Entity', aliases=[DictionaryEntryAlias('Something')])
         some_entity1 = DictionaryEntry(2, 'Some Entity1',
@@ -14,7 +14,9 @@ import nltk
 import string
 import unicodedata
 from itertools import groupby
-from typing import Generator, List, Tuple
+from typing import Generator, List, Optional, Tuple
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.pos_tagging import pos_tag
 from lexnlp.utils.pos_adjustments import TokenPosTagAdjustment
 from lexnlp.extract.common.annotations.phrase_position_finder import PhrasePositionFinder
 
@@ -91,11 +93,14 @@ class NPExtractor:
                   if l[0][1] not in self.exception_pos or l[0][0] in self.exception_sym]
         return leaves
 
-    def get_np(self, text: str) -> Generator[str, None, None]:
+    def get_np(self, text: str, document_context: Optional[DocumentContext] = None) -> Generator[str, None, None]:
+        """
+        :param document_context: context of the document the text is part of, caches the POS tags
+        """
         text = self.replace(text)
         tokenizer_func = self.get_tokenizer()
         tokens = tokenizer_func(text)
-        pos_tokens = nltk.tag.pos_tag(tokens)
+        pos_tokens = pos_tag(tokens, document_context)
         for adjustment in self.token_pos_tag_adjustments:
             pos_tokens = [*map(adjustment, pos_tokens)]
         chunks = self.chunker.parse(pos_tokens)
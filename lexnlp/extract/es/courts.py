@@ -24,12 +24,19 @@ from lexnlp.extract.common.base_path import lexnlp_base_path
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
 from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id, DictionaryEntry, \
     DictionaryEntryAlias
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    PARSER_SOURCE_PATHS
+from lexnlp.extract.es import language_tokens
 from lexnlp.extract.es.language_tokens import EsLanguageTokens
+from lexnlp.utils.dictionary_cache import DICTIONARY_CACHE
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
+from lexnlp.utils.model_registry import get_module_getattr
 from lexnlp.extract.all_locales.languages import LANG_ES
 
 
+COURT_DATAFRAME_PATH = os.path.join(lexnlp_base_path, 'lexnlp/config/es/es_courts.csv')
+
+
 def _get_courts(
     text: str,
     court_config_list: List[DictionaryEntry],
@@ -55,7 +62,7 @@ def _get_courts(
 
 def setup_es_parser():
     ptrs = ParserInitParams()
-    ptrs.dataframe_paths = [os.path.join(lexnlp_base_path, 'lexnlp/config/es/es_courts.csv')]
+    ptrs.dataframe_paths = [COURT_DATAFRAME_PATH]
     ptrs.split_ptrs = LineSplitParams()
     ptrs.split_ptrs.line_breaks = {'\n', '.', ';', ','}.union(set(EsLanguageTokens.conjunctions))
     ptrs.split_ptrs.abbreviations = EsLanguageTokens.abbreviations
@@ -64,11 +71,17 @@ def setup_es_parser():
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_es_parser()
+# the parser is read from the dictionary cache or built on first use
+PARSER = DICTIONARY_CACHE.register(
+    'es.court_parser',
+    setup_es_parser,
+    [COURT_DATAFRAME_PATH] + PARSER_SOURCE_PATHS + [__file__, language_tokens.__file__])
+
+__getattr__ = get_module_getattr(__name__, {'parser': PARSER})
 
 
 def get_court_annotations(text: str, language: str = 'es') -> Generator[CourtAnnotation, None, None]:
-    yield from parser.parse(text, language)
+    yield from PARSER.get().parse(text, language)
 
 
 def get_court_annotation_list(text: str, language: str = 'es') -> List[CourtAnnotation]:
@@ -76,9 +89,9 @@ def get_court_annotation_list(text: str, language: str = 'es') -> List[CourtAnno
 
 
 def get_courts(text: str, language: str = 'es') -> Generator[dict, None, None]:
-    for court_annotation in parser.parse(text, language):
+    for court_annotation in PARSER.get().parse(text, language):
         yield court_annotation.to_dictionary()
 
 
 def get_court_list(text: str, language: str = 'es') -> List[CourtAnnotation]:
-    return list(parser.parse(text, language))
+    return list(PARSER.get().parse(text, language))
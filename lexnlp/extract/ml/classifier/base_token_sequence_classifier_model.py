@@ -10,7 +10,9 @@ import gzip
 import os
 import pickle
 from abc import abstractmethod
-from typing import Any, Tuple, Generator, List
+from typing import Any, Tuple, Generator, List, Optional
+
+import numpy
 
 from lexnlp.utils.unpickler import renamed_load
 
@@ -105,6 +107,101 @@ class BaseTokenSequenceClassifierModel:
     def get_feature_data(self, text: str, feature_mask: List[int] = None):
         raise NotImplementedError('get_feature_data() should be implemented in derived class')
 
+    @staticmethod
+    def get_text_chars(text: str) -> Tuple[List[str], numpy.ndarray]:
+        """
+        Get the text's distinct characters and the index of each text character in their list.
+        """
+        codes = numpy.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32)
+        unique_codes, char_ids = numpy.unique(codes, return_inverse=True)
+        return [chr(c) for c in unique_codes], char_ids
+
+    def get_char_feature_columns(self, c: str) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Get the columns of the "0_" features the character increments anywhere in a token,
+        as the token's first and as the token's last character.
+        """
+        if c in self.letter_set:
+            keys = ['char_' + c, 'lchar_' + c.lower()]
+        elif c in self.digit_set:
+            keys = ['digit_' + c]
+        elif c in self.punc_set:
+            keys = ['punc_' + c]
+        elif c in self.symbol_set:
+            keys = ['symbol_' + c]
+        else:
+            keys = ['char_other']
+        keys.append('cat_' + self.unicode_character_category_mapping.get(c, 'Cc'))
+        keys.append('tcat_' + self.unicode_character_top_category_mapping.get(c, 'C'))
+        index_map = self._feature_index_map
+        return [index_map['0_' + k] for k in keys], \
+            [index_map['0_first_' + k] for k in keys], \
+            [index_map['0_last_' + k] for k in keys]
+
+    def set_char_features(self,
+                          feature_data: numpy.ndarray,
+                          text: str,
+                          tokens: List[Tuple[int, int]],
+                          feature_mask: List[int] = None,
+                          text_chars: Optional[Tuple[List[str], numpy.ndarray]] = None) -> None:
+        """
+        Count the characters of each token ("0_char_a", "0_first_cat_Lu" ... features) and set
+        the token's "mask" feature to the maximum of feature_mask over the token's characters.
+        :param text_chars: get_text_chars(text) if already calculated
+        """
+        chars, char_ids = text_chars or self.get_text_chars(text)
+        num_tokens = len(tokens)
+        starts = numpy.array([t[0] for t in tokens], dtype=numpy.int64)
+        lengths = numpy.array([t[1] - t[0] for t in tokens], dtype=numpy.int64)
+        # token index and text position of each token character
+        token_index = numpy.repeat(numpy.arange(num_tokens), lengths)
+        offsets = numpy.cumsum(lengths) - lengths
+        positions = numpy.arange(len(token_index)) + numpy.repeat(starts - offsets, lengths)
+
+        if feature_mask:
+            mask = numpy.zeros(num_tokens, dtype=numpy.int64)
+            numpy.maximum.at(mask, token_index, numpy.asarray(feature_mask)[positions])
+            feature_data[:, self._feature_index_map['mask']] = mask
+
+        # column lookup arrays: 4 columns at most per character, -1 for none
+        token_char_ids = char_ids[positions]
+        column_arrays = [numpy.full((len(chars), 4), -1, dtype=numpy.int64) for _ in range(3)]
+        for char_id in numpy.unique(token_char_ids):
+            for column_array, columns in zip(column_arrays, self.get_char_feature_columns(chars[char_id])):
+                column_array[char_id, :len(columns)] = columns
+
+        not_empty = lengths > 0
+        first_chars = offsets[not_empty]
+        last_chars = first_chars + lengths[not_empty] - 1
+        rows, columns = [], []
+        for column_array, selected in zip(column_arrays, (slice(None), first_chars, last_chars)):
+            char_columns = column_array[token_char_ids[selected]]
+            char_rows = numpy.broadcast_to(token_index[selected][:, None], char_columns.shape)
+            found = char_columns >= 0
+            rows.append(char_rows[found])
+            columns.append(char_columns[found])
+        numpy.add.at(feature_data, (numpy.concatenate(rows), numpy.concatenate(columns)), 1)
+
+    def set_window_features(self, feature_data: numpy.ndarray) -> None:
+        """
+        Copy the "0_" features of the tokens within the window to the window's features ("-1_char_a" ...).
+        The features of the token post_window tokens ahead are copied only to the token
+        post_window tokens before the last one.
+        """
+        num_tokens = feature_data.shape[0]
+        index_map = self._feature_index_map
+        source_columns = [index_map['0_' + f] for f in self._base_feature_list]
+        # pylint: disable=invalid-unary-operand-type
+        for offset in range(-self.pre_window, self.post_window + 1):
+            if offset == 0:
+                continue
+            target_columns = [index_map[str(offset) + '_' + f] for f in self._base_feature_list]
+            start, end = max(0, -offset), min(num_tokens, num_tokens - offset)
+            if offset == self.post_window:
+                start = max(start, num_tokens - 1 - offset)
+            if start < end:
+                feature_data[start:end, target_columns] = feature_data[start + offset:end + offset][:, source_columns]
+
     def train_model(self, model, feature_data, target_data):
         """
         Train a model and set into class.
@@ -165,13 +165,6 @@ class SpacyTokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
         Get features based on character model.
         """
         # parse text with spacy
-        text_data = [(self.unicode_character_top_category_mapping[
-                          c] if c in self.unicode_character_top_category_mapping else "C",
-                      self.unicode_character_category_mapping[
-                          c] if c in self.unicode_character_category_mapping else "Cc",
-                      ord(c)
-                      ) for c in text]
-        text_lower = text.lower()
         doc = NLP_EN(text)
 
         # setup return structure
@@ -210,71 +203,12 @@ class SpacyTokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
             if str(token) in self.match_tokens:
                 feature_data[i, self._feature_index_map[o + "_token_" + str(token)]] = 1
 
-            start_pos = token.idx
-            end_pos = token.idx + len(token)
-            tokens.append((start_pos, end_pos))
-            for j in range(start_pos, end_pos):
-                c = text[j]
-                cl = text_lower[j]
-                if feature_mask:
-                    feature_data[i, self._feature_index_map['mask']] = max(
-                        feature_data[i, self._feature_index_map['mask']], feature_mask[j])
-
-                if c in self.letter_set:
-                    feature_data[i, self._feature_index_map[o + "_char_" + c]] += 1
-                    feature_data[i, self._feature_index_map[o + "_lchar_" + cl]] += 1
-                    if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_first_lchar_" + cl]] += 1
-                    if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_last_lchar_" + cl]] += 1
-                elif c in self.digit_set:
-                    feature_data[i, self._feature_index_map[o + "_digit_" + c]] += 1
-                    if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_digit_" + c]] += 1
-                    if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_digit_" + c]] += 1
-                elif c in self.punc_set:
-                    feature_data[i, self._feature_index_map[o + "_punc_" + c]] += 1
-                    if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_punc_" + c]] += 1
-                    if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_punc_" + c]] += 1
-                elif c in self.symbol_set:
-                    feature_data[i, self._feature_index_map[o + "_symbol_" + c]] += 1
-                    if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_symbol_" + c]] += 1
-                    if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_symbol_" + c]] += 1
-                else:
-                    feature_data[i, self._feature_index_map[o + "_char_other"]] += 1
-                    if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_char_other"]] += 1
-                    if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_other"]] += 1
-
-                feature_data[i, self._feature_index_map[o + "_cat_" + text_data[j][1]]] += 1
-                feature_data[i, self._feature_index_map[o + "_tcat_" + text_data[j][0]]] += 1
-
-                if j == start_pos:
-                    feature_data[i, self._feature_index_map[o + "_first_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_first_tcat_" + text_data[j][0]]] += 1
-                if j == end_pos - 1:
-                    feature_data[i, self._feature_index_map[o + "_last_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_last_tcat_" + text_data[j][0]]] += 1
+            tokens.append((token.idx, token.idx + len(token)))
+
+        self.set_char_features(feature_data, text, tokens, feature_mask)
 
         # handle window feature calculations
         if self.pre_window + self.post_window > 0:
-            for i in range(num_tokens):
-                j_start = (i - self.pre_window) if (i - self.pre_window >= 0) else 0
-                j_end = (i + self.post_window) if (i + self.post_window + 1 < num_tokens) else num_tokens
-                for j in range(j_start, j_end):
-                    if j == i:
-                        continue
-                    o = str(j - i)
-                    for f in self._base_feature_list:
-                        feature_data[i, self._feature_index_map[o + '_' + f]] = \
-                            feature_data[j, self._feature_index_map['0_' + f]]
+            self.set_window_features(feature_data)
 
         return feature_data, tokens
@@ -0,0 +1,53 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from unittest import TestCase
+
+import numpy as np
+
+from lexnlp.extract.ml.classifier.token_sequence_model import TokenSequenceClassifierModel
+
+
+class TestTokenSequenceClassifierModel(TestCase):
+    def get_features(self, model, features, rows):
+        return [[int(rows[i, model._feature_index_map[f]]) for f in features] for i in range(rows.shape[0])]
+
+    def test_tokens(self):
+        model = TokenSequenceClassifierModel(letter_set='ab')
+        self.assertEqual([(0, 3), (5, 6), (7, 8), (9, 9)], model.get_feature_data(' ab  b\tA ')[1])
+        self.assertEqual([(0, 0)], model.get_feature_data('')[1])
+        self.assertEqual([(0, 1)], model.get_feature_data('a')[1])
+
+    def test_char_features(self):
+        model = TokenSequenceClassifierModel(letter_set='abAB', digit_set='1', punc_set='.', match_tokens=['1.'],
+                                             string_checks=True)
+        feature_data, tokens = model.get_feature_data('Aba 1. a', feature_mask=[0, 1, 0, 0, 0, 2, 0, 0])
+        self.assertEqual(np.int8, feature_data.dtype)
+        self.assertEqual([(0, 3), (4, 6), (7, 8)], tokens)
+        features = ['position', 'length', 'mask', '0_is_start', '0_is_end', '0_is_title',
+                    '0_char_a', '0_lchar_a', '0_first_char_A', '0_last_lchar_a', '0_digit_1', '0_last_punc_.',
+                    '0_cat_Lu', '0_tcat_L', '0_first_tcat_P', '0_token_1.']
+        self.assertEqual([[0, 3, 1, 1, 0, 1, 1, 2, 1, 1, 0, 0, 1, 3, 0, 0],
+                          [1, 2, 2, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1],
+                          [2, 1, 0, 0, 1, 0, 1, 1, 0, 1, 0, 0, 0, 1, 0, 0]],
+                         self.get_features(model, features, feature_data))
+
+    def test_window_features(self):
+        model = TokenSequenceClassifierModel(letter_set='abcd', pre_window=1, post_window=1)
+        feature_data, _ = model.get_feature_data('a b c d')
+        # the token post_window tokens ahead is copied only to the token post_window tokens before the last one
+        self.assertEqual([[0, 0, 0, 0, 0], [1, 0, 0, 0, 0], [0, 1, 0, 0, 1], [0, 0, 1, 0, 0]],
+                         self.get_features(model, ['-1_char_a', '-1_char_b', '-1_char_c', '1_char_c', '1_char_d'],
+                                           feature_data))
+
+    def test_long_text(self):
+        model = TokenSequenceClassifierModel(letter_set='a')
+        feature_data, tokens = model.get_feature_data(' '.join(['a'] * 200))
+        self.assertEqual(200, len(tokens))
+        # int8 positions wrap around
+        self.assertEqual([127, -128, -57], list(feature_data[[127, 128, 199], model._feature_index_map['position']]))
@@ -6,7 +6,7 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy
 
@@ -128,6 +128,24 @@ class TokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
 
         return token_feature_list
 
+    @staticmethod
+    def get_token_offsets(is_space: numpy.ndarray) -> List[Tuple[int, int]]:
+        """
+        Split the text on the "space" (Z or C category) characters.
+        :param is_space: is_space[i] tells if the text's i-th character is a "space"
+        :return: (start, end) of the tokens, the last token ends at the text's end
+        """
+        text_len = len(is_space)
+        if text_len < 2:
+            return [(0, text_len)]
+        # the token ends before a space, the next token starts after the spaces following the end
+        # (the spaces before the first token but one are skipped)
+        ends = numpy.flatnonzero(~is_space[:-1] & is_space[1:])
+        space_pairs = numpy.concatenate(([0], numpy.cumsum(is_space[:-1] & is_space[1:])))
+        starts = numpy.concatenate(([0], ends + 2)) + \
+            space_pairs[numpy.append(ends, text_len - 1)] - space_pairs[numpy.concatenate(([0], ends + 1))]
+        return list(zip(starts.tolist(), numpy.append(ends + 1, text_len).tolist()))
+
     # TODO: add "hints" alongside with the text? areas with special
     def get_feature_data(self,
                          text: str,
@@ -136,111 +154,36 @@ class TokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
         Get features based on character model.
         feature_mask - array of numbers, has the same length as text
         """
-        # setup return data
-        text_len = len(text)
-        text_lower = [c.lower() for c in text]
-        text_data = [(self.unicode_character_top_category_mapping[
-                          c] if c in self.unicode_character_top_category_mapping else "C",
-                      self.unicode_character_category_mapping[
-                          c] if c in self.unicode_character_category_mapping else "Cc",
-                      ord(c)
-                      ) for c in text]
-
-        tokens = []
-        token_start = 0
-        # calculate token offsets
-        for i in range(text_len - 1):
-            if text_data[i][0] not in ['Z', 'C'] and text_data[i + 1][0] in ['Z', 'C']:
-                tokens.append((token_start, i + 1))
-                token_start = min(i + 2, text_len)
-            elif text_data[i][0] in ['Z', 'C'] and text_data[i + 1][0] in ['Z', 'C']:
-                token_start += 1
-        tokens.append((token_start, text_len))
+        chars, char_ids = self.get_text_chars(text)
+        is_space = numpy.array([self.unicode_character_top_category_mapping.get(c, 'C') in ('Z', 'C')
+                                for c in chars], dtype=bool)[char_ids]
+        tokens = self.get_token_offsets(is_space)
         num_tokens = len(tokens)
 
         # Setup return structure
         feature_data = numpy.zeros((num_tokens, len(self.feature_list)), dtype=numpy.int8)
-
-        for i in range(num_tokens):
-            o = str(0)
-            token_text = text[tokens[i][0]:tokens[i][1]]
-
-            feature_data[i, self._feature_index_map['position']] = i
-            feature_data[i, self._feature_index_map['length']] = tokens[i][1] - tokens[i][0]
-            feature_data[i, self._feature_index_map['mask']] = 0
-
-            feature_data[i, self._feature_index_map[o + "_is_start"]] = int(i == 0)
-            feature_data[i, self._feature_index_map[o + "_is_end"]] = int(i == num_tokens - 1)
-            if self.string_checks:
-                feature_data[i, self._feature_index_map[o + "_is_title"]] = int(token_text == token_text.title())
-                feature_data[i, self._feature_index_map[o + "_is_lower"]] = int(token_text == token_text.lower())
-                feature_data[i, self._feature_index_map[o + "_is_upper"]] = int(token_text == token_text.upper())
-
-            if token_text in self.match_tokens:
-                feature_data[i, self._feature_index_map[o + "_token_" + token_text]] = 1
-
-            for j in range(tokens[i][0], tokens[i][1]):
-                c = text[j]
-                cl = text_lower[j]
-                if feature_mask:
-                    feature_data[i, self._feature_index_map['mask']] = max(
-                        feature_data[i, self._feature_index_map['mask']], feature_mask[j])
-
-                if c in self.letter_set:
-                    feature_data[i, self._feature_index_map[o + "_char_" + c]] += 1
-                    feature_data[i, self._feature_index_map[o + "_lchar_" + cl]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_first_lchar_" + cl]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_last_lchar_" + cl]] += 1
-                elif c in self.digit_set:
-                    feature_data[i, self._feature_index_map[o + "_digit_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_digit_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_digit_" + c]] += 1
-                elif c in self.punc_set:
-                    feature_data[i, self._feature_index_map[o + "_punc_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_punc_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_punc_" + c]] += 1
-                elif c in self.symbol_set:
-                    feature_data[i, self._feature_index_map[o + "_symbol_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_symbol_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_symbol_" + c]] += 1
-                else:
-                    feature_data[i, self._feature_index_map[o + "_char_other"]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_char_other"]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_other"]] += 1
-
-                feature_data[i, self._feature_index_map[o + "_cat_" + text_data[j][1]]] += 1
-                feature_data[i, self._feature_index_map[o + "_tcat_" + text_data[j][0]]] += 1
-
-                if j == tokens[i][0]:
-                    feature_data[i, self._feature_index_map[o + "_first_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_first_tcat_" + text_data[j][0]]] += 1
-                if j == tokens[i][1] - 1:
-                    feature_data[i, self._feature_index_map[o + "_last_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_last_tcat_" + text_data[j][0]]] += 1
+        index_map = self._feature_index_map
+        # int8 columns: the positions and the lengths over 127 wrap around
+        feature_data[:, index_map['position']] = numpy.arange(num_tokens)
+        feature_data[:, index_map['length']] = numpy.array([end - start for start, end in tokens])
+        feature_data[0, index_map['0_is_start']] = 1
+        feature_data[num_tokens - 1, index_map['0_is_end']] = 1
+
+        if self.string_checks or self.match_tokens:
+            match_token_columns = {token: index_map['0_token_' + token] for token in self.match_tokens}
+            for i, (start, end) in enumerate(tokens):
+                token_text = text[start:end]
+                if self.string_checks:
+                    feature_data[i, index_map['0_is_title']] = int(token_text == token_text.title())
+                    feature_data[i, index_map['0_is_lower']] = int(token_text == token_text.lower())
+                    feature_data[i, index_map['0_is_upper']] = int(token_text == token_text.upper())
+                if token_text in match_token_columns:
+                    feature_data[i, match_token_columns[token_text]] = 1
+
+        self.set_char_features(feature_data, text, tokens, feature_mask, (chars, char_ids))
 
         # handle window feature calculations
         if self.pre_window + self.post_window > 0:
-            for i in range(num_tokens):
-                j_start = (i - self.pre_window) if (i - self.pre_window >= 0) else 0
-                j_end = (i + self.post_window) if (i + self.post_window + 1 < num_tokens) else num_tokens
-                for j in range(j_start, j_end):
-                    if j == i:
-                        continue
-                    o = str(j - i)
-                    for f in self._base_feature_list:
-                        feature_data[i, self._feature_index_map[o + '_' + f]] = \
-                            feature_data[j, self._feature_index_map['0_' + f]]
+            self.set_window_features(feature_data)
 
         return feature_data, tokens
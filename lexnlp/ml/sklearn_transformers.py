@@ -20,8 +20,8 @@ from lexnlp.nlp.en.segments.sentences import get_sentences
 
 # third-party imports
 from joblib import delayed, Parallel
-from scipy.sparse import issparse, vstack
-from numpy import ceil, concatenate, ndarray
+from scipy.sparse import csr_matrix, hstack, issparse, vstack
+from numpy import ceil, concatenate, empty, ndarray, stack
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
@@ -72,33 +72,55 @@ def parallel_estimator(
 class TransformerVectorizer(BaseEstimator, TransformerMixin):
     """
     """
-    def __init__(self, vectorizers: Iterable[Vectorizer]) -> None:
+    # default for the instances pickled before the parameter existed
+    sparse: bool = False
+
+    def __init__(self, vectorizers: Iterable[Vectorizer], sparse: bool = False) -> None:
         """
         Successively transforms X using each Vectorizer, concatenating their outputs.
 
         Args:
             vectorizers (Iterable[Vectorizer]):
                 An iterable of Vectorizers which will vectorize X.
+
+            sparse (bool=False):
+                Whether `transform` returns a sparse (CSR) matrix rather than a dense one.
         """
         self.vectorizers: Tuple[Vectorizer] = tuple(vectorizers)
+        self.sparse: bool = sparse
 
     # noinspection PyPep8Naming
     def fit(self, X, y: Optional = None) -> 'TransformerVectorizer':
         return self
 
     # noinspection PyPep8Naming
-    def transform(self, X, y: Optional = None) -> Tuple[ndarray, ...]:
+    def transform(self, X, y: Optional = None) -> Union[ndarray, csr_matrix]:
+        """
+        Returns:
+            A matrix with a row per document in X.
+        """
+        documents: List[List[str]] = [document.split() for document in X]  # type: str
+        if not documents:
+            return csr_matrix((0, 0)) if self.sparse else empty((0, 0))
+        if self.sparse:
+            return hstack(
+                [
+                    vstack([vectorizer.vectorize_sparse(tokens) for tokens in documents], format='csr')
+                    for vectorizer in self.vectorizers
+                ],
+                format='csr',
+            )
         vectors: List[ndarray] = []
-        for document in X:  # type: str
+        for tokens in documents:
             vector: ndarray = concatenate(
                 [
-                    vectorizer.vectorize(document.split())
+                    vectorizer.vectorize(tokens)
                     for vectorizer in self.vectorizers
                 ],
                 axis=0,
             )
             vectors.append(vector)
-        return tuple(vectors)
+        return stack(vectors)
 
 
 class TransformerPreprocessor(BaseEstimator, TransformerMixin):
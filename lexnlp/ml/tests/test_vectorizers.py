@@ -0,0 +1,52 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import pickle
+from unittest import TestCase
+
+from scipy.sparse import issparse
+
+from lexnlp.ml.sklearn_transformers import TransformerVectorizer
+from lexnlp.ml.vectorizers import VectorizerKeywordSearch
+
+
+class TestVectorizerKeywordSearch(TestCase):
+    KEYWORDS = [('d', 1.0, 0.0), ('f', 1.0, 0.0), ('a', 2.0, -1.0), ('f', 3.0, 0.5)]
+
+    def test_vectorize(self):
+        vectorizer = VectorizerKeywordSearch(self.KEYWORDS)
+        self.assertEqual([0.0, 1.0, 2.0, 3.0], vectorizer.vectorize(['a', 'b', 'c', 'e', 'f']).tolist())
+        self.assertEqual([0.0, 0.0, -1.0, 0.5], vectorizer.vectorize([]).tolist())
+
+        row = vectorizer.vectorize_sparse(['b', 'f', 'f'])
+        self.assertEqual((1, 4), row.shape)
+        self.assertEqual([[0.0, 1.0, -1.0, 3.0]], row.toarray().tolist())
+        self.assertEqual(3, row.nnz)
+
+    def test_pickle(self):
+        vectorizer = VectorizerKeywordSearch(self.KEYWORDS)
+        vectorizer.vectorize(['a'])
+        restored = pickle.loads(pickle.dumps(vectorizer))
+        self.assertNotIn('_index', restored.__dict__)
+        self.assertEqual([1.0, 0.0, -1.0, 0.5], restored.vectorize(['d']).tolist())
+
+
+class TestTransformerVectorizer(TestCase):
+    def test_transform(self):
+        vectorizers = [VectorizerKeywordSearch([('agreement', 1.0, -1.0)]),
+                       VectorizerKeywordSearch([('lease', 1.0, 0.0), ('term', 1.0, 0.0)])]
+        documents = ['this lease agreement', 'term of the lease', 'nothing']
+        expected = [[1.0, 1.0, 0.0], [-1.0, 1.0, 1.0], [-1.0, 0.0, 0.0]]
+
+        dense = TransformerVectorizer(vectorizers).transform(documents)
+        self.assertEqual(expected, dense.tolist())
+
+        sparse = TransformerVectorizer(vectorizers, sparse=True).transform(documents)
+        self.assertTrue(issparse(sparse))
+        self.assertEqual(expected, sparse.toarray().tolist())
+        self.assertEqual((0, 0), TransformerVectorizer(vectorizers, sparse=True).transform([]).shape)
@@ -12,10 +12,11 @@ __email__ = "support@contraxsuite.com"
 # standard library
 from os import PathLike
 from abc import ABC, abstractmethod
-from typing import Iterable, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 # third-party imports
-from numpy import fromiter, ndarray
+from numpy import array, fromiter, ndarray
+from scipy.sparse import csr_matrix
 from gensim.models.doc2vec import Doc2Vec
 
 
@@ -25,6 +26,15 @@ class Vectorizer(ABC):
     def vectorize(self, tokens) -> ndarray:
         raise NotImplementedError
 
+    def vectorize_sparse(self, tokens) -> csr_matrix:
+        """
+        Returns:
+            The vector as a sparse matrix of one row.
+        """
+        values: ndarray = self.vectorize(tokens)
+        columns: ndarray = values.nonzero()[0]
+        return csr_matrix((values[columns], columns, [0, len(columns)]), shape=(1, len(values)))
+
 
 class VectorizerKeywordSearch(Vectorizer):
     """
@@ -39,6 +49,9 @@ class VectorizerKeywordSearch(Vectorizer):
         keywords = [('d', 1.0, 0.0), ('f', 1.0, 0.0)]
 
         vectorize(tokens) => array([0.0, 1.0])
+
+    The keywords are indexed once, so vectorizing takes one pass over the tokens
+    regardless of the number of keywords.
     """
 
     def __init__(self, keywords: Iterable[Tuple[str, float, float]]) -> None:
@@ -50,15 +63,42 @@ class VectorizerKeywordSearch(Vectorizer):
         """
         self.keywords: Tuple[Tuple[str, float, float]] = tuple(keywords)
 
+    def __getstate__(self):
+        # the index is rebuilt on demand, also for the instances pickled before it existed
+        return {'keywords': self.keywords}
+
+    def _get_index(self) -> Tuple[Dict[str, List[int]], ndarray, ndarray]:
+        """
+        Returns:
+            The columns of each keyword, the values if present and the values if absent.
+        """
+        index = self.__dict__.get('_index')
+        if index is None:
+            keyword_columns: Dict[str, List[int]] = {}
+            for column, (keyword, _, _) in enumerate(self.keywords):
+                keyword_columns.setdefault(keyword, []).append(column)
+            index = (
+                keyword_columns,
+                fromiter((value_present for _, value_present, _ in self.keywords), dtype=float,
+                         count=len(self.keywords)),
+                fromiter((value_absent for _, _, value_absent in self.keywords), dtype=float,
+                         count=len(self.keywords)),
+            )
+            self._index = index
+        return index
+
     def vectorize(self, tokens: Iterable[str]) -> ndarray:
-        return fromiter(
-            iter=(
-                value_present if keyword in tokens else value_absent
-                for keyword, value_present, value_absent in self.keywords
-            ),
-            dtype=float,
-            count=len(self.keywords),
-        )
+        keyword_columns, values_present, values_absent = self._get_index()
+        columns: List[int] = [
+            column
+            for token in set(tokens)
+            for column in keyword_columns.get(token, ())
+        ]
+        vector: ndarray = values_absent.copy()
+        if columns:
+            columns: ndarray = array(columns)
+            vector[columns] = values_present[columns]
+        return vector
 
 
 class VectorizerDoc2Vec(Vectorizer):
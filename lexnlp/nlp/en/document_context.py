@@ -0,0 +1,177 @@
+"""Shared analysis of a single document
+
+DocumentContext lazily computes and caches the intermediate results (lines, sentences, tokens,
+character distributions) that the segmenters and extractors need for the same document.
+"""
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import string
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_document_line_distribution, \
+    get_unicode_top_category, LineStatistics
+
+
+class DocumentContext:
+    """
+    Lazily computed and cached analysis of one document.
+
+    Pass the same context to the get_* functions called on the document so that the text is
+    split into lines and sentences, tokenized and measured only once:
+
+        context = DocumentContext(text)
+        sentences = get_sentence_span_list(text, document_context=context)
+        paragraphs = get_paragraph_span_list(text, document_context=context)
+        companies = list(get_companies(text, document_context=context))
+
+    The cached values are shared: the functions copy the lists they return but don't copy
+    the values obtained from the context's properties, so the caller shouldn't modify them.
+    """
+
+    def __init__(self, text: str, pos_tagger: Optional[Any] = None):
+        """
+        :param pos_tagger: PosTagger tagging the document's tokens, pos_tagging.POS_TAGGER by default
+        """
+        self.text = text
+        self.pos_tagger = pos_tagger
+        self.cache = {}  # type: Dict[Hashable, Any]
+
+    def get_cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Get the value stored under the key, build and store the value on the first call.
+        """
+        try:
+            return self.cache[key]
+        except KeyError:
+            value = build()
+            self.cache[key] = value
+            return value
+
+    def check_text(self, text: str) -> None:
+        """
+        Make sure the context was created for the text being processed.
+        """
+        if text is not self.text and text != self.text:
+            raise ValueError('DocumentContext was created for another text')
+
+    def get_text_variant(self, name: str, transform: Callable[[str], str]) -> 'DocumentContext':
+        """
+        Get the context of the text transformed by the function, e.g. the text with newlines replaced.
+        The transformation is identified by the name and is applied once.
+        """
+        return self.get_cached(('text_variant', name),
+                               lambda: DocumentContext(transform(self.text), pos_tagger=self.pos_tagger))
+
+    @property
+    def text_lower(self) -> str:
+        return self.get_cached('text_lower', self.text.lower)
+
+    @property
+    def text_normalized(self) -> str:
+        """
+        The text with "not-quite unicode" symbols replaced (see sentences.normalize_text)
+        """
+        from lexnlp.nlp.en.segments.sentences import normalize_text
+        return self.get_cached('text_normalized', lambda: normalize_text(self.text))
+
+    @property
+    def lines(self) -> List[str]:
+        """
+        text.splitlines()
+        """
+        return self.get_cached('lines', self.text.splitlines)
+
+    @property
+    def lines_with_spans(self) -> Tuple[List[str], List[Tuple[int, int]]]:
+        """
+        Lines and their spans split on "\\n", "\\r", "\\r\\n" or "\\n\\r" (see paragraphs.splitlines_with_spans)
+        """
+        from lexnlp.nlp.en.segments.paragraphs import splitlines_with_spans
+        return self.get_cached('lines_with_spans', lambda: splitlines_with_spans(self.text))
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int, str]]:
+        """
+        (start, end, sentence) tuples (see sentences.get_sentence_span)
+        """
+        from lexnlp.nlp.en.segments.sentences import get_sentence_span
+        return self.get_cached('sentence_spans', lambda: [*get_sentence_span(self.text)])
+
+    @property
+    def sentences(self) -> List[str]:
+        return self.get_cached('sentences', lambda: [sentence for _, _, sentence in self.sentence_spans])
+
+    @property
+    def document_distribution(self) -> Dict[str, float]:
+        return self.get_cached('document_distribution', lambda: build_document_distribution(self.text))
+
+    @property
+    def document_line_distribution(self) -> Dict[str, float]:
+        return self.get_cached('document_line_distribution',
+                               lambda: build_document_line_distribution(self.text))
+
+    def get_tokens(self, lowercase: bool = False, stopword: bool = False, preserve_line: bool = True) -> List[str]:
+        """
+        Tokens of the whole text (see tokens.get_token_list)
+        """
+        from lexnlp.nlp.en.tokens import get_token_list
+        return self.get_cached(
+            ('tokens', lowercase, stopword, preserve_line),
+            lambda: get_token_list(self.text, lowercase=lowercase, stopword=stopword, preserve_line=preserve_line))
+
+    def get_sentence_tokens(self) -> List[List[str]]:
+        """
+        Tokens of each sentence (see tokens.get_token_list)
+        """
+        from lexnlp.nlp.en.tokens import get_token_list
+        return self.get_cached('sentence_tokens', lambda: [get_token_list(s) for s in self.sentences])
+
+    def get_line_statistics(self,
+                            lines_with_spans: bool = False,
+                            characters: str = string.printable,
+                            get_category: Callable[[str], Optional[str]] = get_unicode_top_category) \
+            -> LineStatistics:
+        """
+        Statistics of the lines (or the lines_with_spans) used by the segmenters' feature matrices.
+        """
+        return self.get_cached(
+            ('line_statistics', lines_with_spans, characters, get_category),
+            lambda: LineStatistics(self.lines_with_spans[0] if lines_with_spans else self.lines,
+                                   characters=characters, get_category=get_category))
+
+    def get_pos_tagger(self) -> Any:
+        if self.pos_tagger is None:
+            from lexnlp.nlp.en.pos_tagging import POS_TAGGER
+            self.pos_tagger = POS_TAGGER
+        return self.pos_tagger
+
+    def get_pos_tags(self, tokens: Sequence[str]) -> List[Tuple[str, str]]:
+        """
+        POS tags of the token list (nltk.pos_tag), tagged once per document.
+        """
+        return self.tag_token_lists([tokens])[0]
+
+    def tag_token_lists(self, token_lists: Sequence[Sequence[str]]) -> List[List[Tuple[str, str]]]:
+        """
+        POS tags of the token lists, the ones not tagged yet in one batch.
+        The tag lists returned are copies the caller may modify.
+        """
+        keys = [('pos_tags', tuple(tokens)) for tokens in token_lists]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.cache))
+        if missing:
+            for key, tags in zip(missing, self.get_pos_tagger().tag_sents([key[1] for key in missing])):
+                self.cache[key] = tags
+        return [list(self.cache[key]) for key in keys]
+
+    def get_sentence_pos_tags(self) -> List[List[Tuple[str, str]]]:
+        """
+        POS tags of each sentence's tokens (see get_sentence_tokens), all the sentences tagged in one batch.
+        """
+        return self.get_cached('sentence_pos_tags', lambda: self.tag_token_lists(self.get_sentence_tokens()))
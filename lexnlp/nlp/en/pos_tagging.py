@@ -0,0 +1,117 @@
+"""Part-of-speech tagging shared by the NLTK-based extractors
+
+The extractors tag the same sentences many times: the company, person and geopolitical entity
+detectors, the address tokenizer, the amount noun phrase chunker and the lemmatizing token functions.
+PosTagger tags each distinct token list once per document (see DocumentContext.get_pos_tags)
+and tags the sentences of a document in one batch (see DocumentContext.get_sentence_pos_tags).
+"""
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from nltk.tag.perceptron import PerceptronTagger
+
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.utils.lru_cache import LruCache
+from lexnlp.utils.model_registry import MODEL_REGISTRY
+
+
+# the tagger nltk.pos_tag uses for English
+PERCEPTRON_TAGGER = MODEL_REGISTRY.register('en.pos_tagger', PerceptronTagger)
+
+TaggedTokens = List[Tuple[str, str]]
+
+
+def tag_with_perceptron(sentences: List[List[str]]) -> List[TaggedTokens]:
+    """
+    nltk.pos_tag_sents(sentences)
+    """
+    tagger = PERCEPTRON_TAGGER.get()
+    return [tagger.tag(tokens) for tokens in sentences]
+
+
+class PosTagger:
+    """
+    Tags token lists, optionally keeping the tags of the last cache_size distinct token lists
+    so that the boilerplate sentences repeated across documents are tagged once:
+
+        POS_TAGGER.set_cache_size(10000)
+
+    The perceptron tags a token depending only on the tokens of the same list, so the cached tags
+    are the tags the list would get again. The tag lists returned are new lists the caller may modify.
+    """
+    def __init__(self,
+                 tag_sents: Callable[[List[List[str]]], List[TaggedTokens]] = tag_with_perceptron,
+                 cache_size: int = 0):
+        """
+        :param tag_sents: tags a batch of token lists, with the tagger of nltk.pos_tag by default
+        :param cache_size: the number of token lists whose tags are kept across the calls, 0 for none
+        """
+        self.tag_sents_func = tag_sents
+        # tuple of the tokens: tuple of their tags
+        self.cache = LruCache(cache_size)
+
+    @property
+    def cache_size(self) -> int:
+        return self.cache.max_size
+
+    @property
+    def hits(self) -> int:
+        return self.cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.cache.misses
+
+    def set_cache_size(self, cache_size: int) -> None:
+        self.cache.set_max_size(cache_size)
+
+    def clear_cache(self) -> None:
+        self.cache.clear()
+
+    def tag(self, tokens: Sequence[str]) -> TaggedTokens:
+        return self.tag_sents([tokens])[0]
+
+    def tag_sents(self, sentences: Sequence[Sequence[str]]) -> List[TaggedTokens]:
+        """
+        Tag the token lists, the ones not found in the cache in one batch.
+        A token list repeated in the batch is tagged once.
+        """
+        keys = [tuple(tokens) for tokens in sentences]
+        tagged = [None] * len(keys)  # type: List[Optional[Tuple[Tuple[str, str], ...]]]
+        missing = {}  # type: Dict[Tuple[str, ...], List[int]]
+        for i, key in enumerate(keys):
+            # a token list repeated in the batch is counted as one miss
+            tags = None if key in missing else self.cache.get(key)
+            if tags is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                tagged[i] = tags
+
+        if missing:
+            batch = list(missing)
+            for key, tags in zip(batch, self.tag_sents_func([list(key) for key in batch])):
+                tags = tuple(tags)
+                for i in missing[key]:
+                    tagged[i] = tags
+                self.cache.put(key, tags)
+        return [list(tags) for tags in tagged]
+
+
+POS_TAGGER = PosTagger()
+
+
+def pos_tag(tokens: Sequence[str], document_context: Optional[DocumentContext] = None) -> TaggedTokens:
+    """
+    nltk.pos_tag(tokens) tagging the token list once per document if the document's context is passed.
+    """
+    if document_context is not None:
+        return document_context.get_pos_tags(tokens)
+    return POS_TAGGER.tag(tokens)
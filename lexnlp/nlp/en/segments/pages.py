@@ -19,14 +19,17 @@ import os
 import string
 import unicodedata
 
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Packages
+import numpy
 import pandas
 import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.segments.utils import build_document_distribution, LineStatistics
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
 
 
 # Setup module path
@@ -34,8 +37,12 @@ from lexnlp.nlp.en.segments.utils import build_document_distribution
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-PAGE_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./page_segmenter.pickle"))
+# Segmenters are loaded on first use
+PAGE_SEGMENTER_PATH = os.path.join(MODULE_PATH, "./page_segmenter.pickle")
+PAGE_SEGMENTER = MODEL_REGISTRY.register(
+    'en.page_segmenter', lambda: joblib.load(PAGE_SEGMENTER_PATH), path=PAGE_SEGMENTER_PATH)
+
+__getattr__ = get_module_getattr(__name__, {'PAGE_SEGMENTER_MODEL': PAGE_SEGMENTER})
 
 
 def build_page_break_features(lines, 
@@ -152,31 +159,61 @@ def get_page_break_feature_names(lines_count: int,
     return feature_vector
 
 
-def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def build_page_break_feature_matrix(lines,
+                                    line_window_pre,
+                                    line_window_post,
+                                    characters=string.printable,
+                                    include_doc=None,
+                                    line_statistics: Optional[LineStatistics] = None) \
+        -> Tuple[List[str], numpy.ndarray]:
+    """
+    Build the feature matrix of all lines at once.
+    :param line_statistics: precalculated statistics of the lines
+    :return: sorted column names and the matrix equal to
+             DataFrame([build_page_break_features(...) for each line], columns=column_names).fillna(-1)
+    """
+    column_names = list(get_page_break_feature_names(len(lines), line_window_pre, line_window_post,
+                                                     characters=characters, include_doc=include_doc))
+    column_names.sort()
+    line_stats = line_statistics or LineStatistics(lines, characters=characters)
+    line_features = line_stats.get_contains_features(['page', 'PAGE', 'Page'])
+    line_features['sw_page'] = numpy.fromiter((line.strip().lower().startswith('page') for line in lines),
+                                              dtype=bool, count=len(lines))
+    line_features['sw_pg'] = numpy.fromiter((line.strip().lower().startswith('pg') for line in lines),
+                                            dtype=bool, count=len(lines))
+    feature_matrix = line_stats.get_feature_matrix(column_names, line_window_pre, line_window_post,
+                                                   line_features=line_features, include_doc=include_doc)
+    return column_names, feature_matrix
+
+
+def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5,
+              document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get pages from text.
     :param text:
     :param window_pre:
     :param window_post:
     :param score_threshold:
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
 
-    # Get document character distribution
-    doc_distribution = build_document_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_page_break_features(lines, line_id, window_pre, window_post,
-                                      include_doc=doc_distribution))
+    line_statistics = None
+    if document_context is not None:
+        document_context.check_text(text)
+        doc_distribution = document_context.document_distribution
+        lines = document_context.lines
+        line_statistics = document_context.get_line_statistics()
+    else:
+        # Get document character distribution
+        doc_distribution = build_document_distribution(text)
+        lines = text.splitlines()
+    _, test_feature_matrix = build_page_break_feature_matrix(lines, window_pre, window_post,
+                                                             include_doc=doc_distribution,
+                                                             line_statistics=line_statistics)
 
     # Predict page breaks
-    column_names = list(get_page_break_feature_names(len(lines), window_pre, window_post,
-                                                     include_doc=doc_distribution))
-    column_names.sort()
-    test_feature_df = pandas.DataFrame(test_feature_data, columns=column_names).fillna(-1)
-    test_predicted_lines = PAGE_SEGMENTER_MODEL.predict_proba(test_feature_df)
+    test_predicted_lines = PAGE_SEGMENTER.get().predict_proba(test_feature_matrix)
     predicted_df = pandas.DataFrame(test_predicted_lines, columns=['prob_false', 'prob_true'])
     page_breaks = predicted_df.loc[predicted_df['prob_true'] >= score_threshold, :].index.tolist()
 
@@ -24,10 +24,13 @@ from typing import Dict, Final, Generator, List, Set, Tuple, Union, Optional
 
 # third-party imports
 import joblib
+import numpy
 from pandas import DataFrame
 
 # LexNLP
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, LineStatistics
+from lexnlp.utils.model_registry import get_module_getattr, LazyModel, MODEL_REGISTRY
 
 
 # Setup module path
@@ -35,8 +38,12 @@ from lexnlp.nlp.en.segments.utils import build_document_line_distribution
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-PARAGRAPH_SEGMENTER_MODEL: Final = joblib.load(os.path.join(MODULE_PATH, "./paragraph_segmenter.pickle"))
+# Segmenters are loaded on first use
+PARAGRAPH_SEGMENTER_PATH: Final[str] = os.path.join(MODULE_PATH, "./paragraph_segmenter.pickle")
+PARAGRAPH_SEGMENTER: Final[LazyModel] = MODEL_REGISTRY.register(
+    'en.paragraph_segmenter', lambda: joblib.load(PARAGRAPH_SEGMENTER_PATH), path=PARAGRAPH_SEGMENTER_PATH)
+
+__getattr__ = get_module_getattr(__name__, {'PARAGRAPH_SEGMENTER_MODEL': PARAGRAPH_SEGMENTER})
 
 # regular expression for newlines
 RE_NEW_LINE: Final[Pattern] = re_compile(r'(?P<line>[^\r\n]*)((\r\n)|(\n\r)|\n|\r)')
@@ -156,6 +163,40 @@ def get_paragraph_break_feature_names(
     return feature_vector
 
 
+def build_paragraph_break_feature_matrix(
+    lines: List[str],
+    line_window_pre: int,
+    line_window_post: int,
+    characters=string.printable,
+    include_doc=None,
+    line_statistics: Optional[LineStatistics] = None,
+) -> Tuple[List[str], numpy.ndarray]:
+    """
+    Build the feature matrix of all lines at once.
+    :param line_statistics: precalculated statistics of the lines
+    :return: sorted column names and the matrix equal to
+             DataFrame([build_paragraph_break_features(...) for each line], columns=column_names)
+             .fillna(-1).astype(int)
+    """
+    column_names = list(
+        get_paragraph_break_feature_names(
+            lines_count=len(lines),
+            line_window_pre=line_window_pre,
+            line_window_post=line_window_post,
+            characters=characters,
+            include_doc=include_doc)
+    )
+    column_names.sort()
+    line_stats = line_statistics or LineStatistics(lines, characters=characters)
+    feature_matrix = line_stats.get_feature_matrix(
+        columns=column_names,
+        line_window_pre=line_window_pre,
+        line_window_post=line_window_post,
+        include_doc=include_doc,
+    )
+    return column_names, feature_matrix.astype(int)
+
+
 def splitlines_with_spans(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
     lines: List[str] = []
     spans: List[Tuple[int, int]] = []
@@ -196,6 +237,7 @@ def get_paragraph_spans(
     window_pre=3,
     window_post=3,
     score_threshold=0.5,
+    document_context: Optional[DocumentContext] = None,
 ) -> Generator[Tuple[int, int, str], None, None]:
     """
     Get paragraph spans (start, end, paragraph) from text.
@@ -213,34 +255,31 @@ def get_paragraph_spans(
         score_threshold (float=0.5):
             The minimum probability a predicted paragraph break must meet in order
             to be considered a valid paragraph break.
-    """
-    # Get document character distribution
-    doc_distribution: Dict[str, float] = build_document_line_distribution(text)
-    lines, line_spans = splitlines_with_spans(text)
-    feature_data: List[Dict] = [
-        build_paragraph_break_features(
-            lines=lines,
-            line_id=line_id,
-            line_window_pre=window_pre,
-            line_window_post=window_post,
-            include_doc=doc_distribution,
-        )
-        for line_id in range(len(lines))
-    ]
 
-    # Predict page breaks
-    column_names = list(
-        get_paragraph_break_feature_names(
-            lines_count=len(lines),
-            line_window_pre=window_pre,
-            line_window_post=window_post,
-            include_doc=doc_distribution)
+        document_context (DocumentContext=None):
+            Cached analysis of the text shared with other get_* functions.
+    """
+    line_statistics: Optional[LineStatistics] = None
+    if document_context is not None:
+        document_context.check_text(text)
+        doc_distribution: Dict[str, float] = document_context.document_line_distribution
+        lines, line_spans = document_context.lines_with_spans
+        line_statistics = document_context.get_line_statistics(lines_with_spans=True)
+    else:
+        # Get document character distribution
+        doc_distribution: Dict[str, float] = build_document_line_distribution(text)
+        lines, line_spans = splitlines_with_spans(text)
+    _, feature_matrix = build_paragraph_break_feature_matrix(
+        lines=lines,
+        line_window_pre=window_pre,
+        line_window_post=window_post,
+        include_doc=doc_distribution,
+        line_statistics=line_statistics,
     )
-    column_names.sort()
-    feature_df: DataFrame = DataFrame(feature_data, columns=column_names).fillna(-1).astype(int)
 
+    # Predict page breaks
     try:
-        predicted_lines = PARAGRAPH_SEGMENTER_MODEL.predict_proba(feature_df)
+        predicted_lines = PARAGRAPH_SEGMENTER.get().predict_proba(feature_matrix)
         predicted_df: DataFrame = DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
         paragraph_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
 
@@ -283,6 +322,7 @@ def get_paragraph_span_list(
     window_pre=3,
     window_post=3,
     score_threshold=0.5,
+    document_context: Optional[DocumentContext] = None,
 ) -> List[Tuple[int, int, str]]:
     """
     Get a list of paragraph spans (start, end, paragraph) from text.
@@ -300,6 +340,9 @@ def get_paragraph_span_list(
         score_threshold (float=0.5):
             The minimum probability a predicted paragraph break must meet in order
             to be considered a valid paragraph break.
+
+        document_context (DocumentContext=None):
+            Cached analysis of the text shared with other get_* functions.
     """
     return list(
         get_paragraph_spans(
@@ -307,6 +350,7 @@ def get_paragraph_span_list(
             window_pre=window_pre,
             window_post=window_post,
             score_threshold=score_threshold,
+            document_context=document_context,
         )
     )
 
@@ -316,6 +360,7 @@ def get_paragraphs(
     window_pre=3,
     window_post=3,
     score_threshold=0.5,
+    document_context: Optional[DocumentContext] = None,
 ) -> Generator[str, None, None]:
     """
     Get paragraphs from text.
@@ -333,12 +378,16 @@ def get_paragraphs(
         score_threshold (float=0.5):
             The minimum probability a predicted paragraph break must meet in order
             to be considered a valid paragraph break.
+
+        document_context (DocumentContext=None):
+            Cached analysis of the text shared with other get_* functions.
     """
     for _, _, paragraph in get_paragraph_spans(
         text=text,
         window_pre=window_pre,
         window_post=window_post,
         score_threshold=score_threshold,
+        document_context=document_context,
     ):
         yield paragraph
 
@@ -348,6 +397,7 @@ def get_paragraph_list(
     window_pre=3,
     window_post=3,
     score_threshold=0.5,
+    document_context: Optional[DocumentContext] = None,
 ) -> List[str]:
     """
     Get a list of paragraphs from text.
@@ -365,6 +415,9 @@ def get_paragraph_list(
         score_threshold (float=0.5):
             The minimum probability a predicted paragraph break must meet in order
             to be considered a valid paragraph break.
+
+        document_context (DocumentContext=None):
+            Cached analysis of the text shared with other get_* functions.
     """
     return list(
         get_paragraphs(
@@ -372,5 +425,6 @@ def get_paragraph_list(
             window_pre=window_pre,
             window_post=window_post,
             score_threshold=score_threshold,
+            document_context=document_context,
         )
     )
@@ -22,13 +22,16 @@ import unicodedata
 from typing import Generator, List, Optional, Tuple, Any, Union
 
 # Packages
+import numpy
 import pandas
 import regex as re
 import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, LineStatistics
 from lexnlp.utils.map import Map
+from lexnlp.utils.model_registry import MODEL_REGISTRY
 from lexnlp.utils.decorators import safe_failure
 from lexnlp.nlp.en.segments.heading_heuristics import HeadingHeuristics
 
@@ -38,9 +41,13 @@ from lexnlp.nlp.en.segments.heading_heuristics import HeadingHeuristics
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
+SECTION_SEGMENTER_PATH = os.path.join(MODULE_PATH, "./section_segmenter.pickle")
+
 
 class SectionSegmenterModel:
-    SECTION_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./section_segmenter.pickle"))
+    # loaded on first use, assign the class attribute to replace the model
+    SECTION_SEGMENTER_MODEL = MODEL_REGISTRY.register(
+        'en.section_segmenter', lambda: joblib.load(SECTION_SEGMENTER_PATH), path=SECTION_SEGMENTER_PATH)
     FEATURE_NAMES = []
 
 
@@ -200,9 +207,38 @@ def get_section_feature_names(
     return feature_vector
 
 
+def build_section_break_feature_matrix(
+        lines,
+        line_window_pre,
+        line_window_post,
+        characters=string.printable,
+        include_doc=None,
+        line_statistics: Optional[LineStatistics] = None) -> Tuple[List[str], numpy.ndarray]:
+    """
+    Build the feature matrix of all lines at once.
+    :param line_statistics: precalculated statistics of the lines
+    :return: sorted column names and the matrix equal to
+             DataFrame([build_section_break_features(...) for each line], columns=columns).fillna(-1)
+    """
+    columns = list(get_section_feature_names(len(lines), line_window_pre, line_window_post,
+                                             characters=characters, include_doc=include_doc))
+    columns.sort()
+    line_stats = line_statistics or LineStatistics(lines, characters=characters)
+    line_features = line_stats.get_contains_features(
+        ['section', 'SECTION', 'Section', 'article', 'ARTICLE', 'Article'])
+    line_features['sw_section'] = numpy.fromiter((line.strip().lower().startswith('section') for line in lines),
+                                                 dtype=bool, count=len(lines))
+    line_features['sw_article'] = numpy.fromiter((line.strip().lower().startswith('article') for line in lines),
+                                                 dtype=bool, count=len(lines))
+    feature_matrix = line_stats.get_feature_matrix(columns, line_window_pre, line_window_post,
+                                                   line_features=line_features, include_doc=include_doc)
+    return columns, feature_matrix
+
+
 # TODO: we let errors arise silently
 @safe_failure
-def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5,
+                 document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get sections from text.
     NLP-based detection of sections.
@@ -210,22 +246,26 @@ def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5) -> Gene
     :param window_pre:
     :param window_post:
     :param score_threshold:
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
 
-    # Get document character distribution
-    doc_distribution = build_document_line_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_section_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    line_statistics = None
+    if document_context is not None:
+        document_context.check_text(text)
+        doc_distribution = document_context.document_line_distribution
+        lines = document_context.lines
+        line_statistics = document_context.get_line_statistics()
+    else:
+        # Get document character distribution
+        doc_distribution = build_document_line_distribution(text)
+        lines = text.splitlines()
+    _, test_feature_matrix = build_section_break_feature_matrix(lines, window_pre, window_post,
+                                                                include_doc=doc_distribution,
+                                                                line_statistics=line_statistics)
 
     # Predict page breaks
-    columns = list(get_section_feature_names(len(lines), window_pre, window_post, include_doc=doc_distribution))
-    columns.sort()
-    test_feature_df = pandas.DataFrame(test_feature_data, columns=columns).fillna(-1)
-    test_predicted_lines = SectionSegmenterModel.SECTION_SEGMENTER_MODEL.predict_proba(test_feature_df)
+    test_predicted_lines = SectionSegmenterModel.SECTION_SEGMENTER_MODEL.predict_proba(test_feature_matrix)
     predicted_df = pandas.DataFrame(test_predicted_lines, columns=["prob_false", "prob_true"])
     section_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
 
@@ -297,7 +337,8 @@ def get_section_spans(text: str,
                       use_ml=True,
                       return_text=True,
                       skip_empty_headers=False,
-                      sections_hierarchy: Optional[List[Any]] = None) -> \
+                      sections_hierarchy: Optional[List[Any]] = None,
+                      document_context: Optional[DocumentContext] = None) -> \
         Generator[DocumentSection, None, None]:
     """
     Get sections from text.
@@ -307,14 +348,15 @@ def get_section_spans(text: str,
     :param return_text: bool - return section text
     :param skip_empty_headers: bool - return results containing headers only
     :param sections_hierarchy: list of regexes
+    :param document_context: cached analysis of the text shared with other get_* functions (use_ml only)
     :return: Generator of dictionaries
     """
 
     _start_index_counter = 0
     level_parser = SectionLevelParser(sections_hierarchy=sections_hierarchy)
-    sections_detector = get_sections if use_ml else get_sections_re
+    sections = get_sections(text, document_context=document_context) if use_ml else get_sections_re(text)
 
-    for section in sections_detector(text):
+    for section in sections:
         start_index = _start_index_counter + text[_start_index_counter:].index(section)
         end_index = start_index + len(section)
         _start_index_counter = end_index
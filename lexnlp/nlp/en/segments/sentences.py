@@ -19,25 +19,44 @@ __email__ = "support@contraxsuite.com"
 
 import os
 import re
-from typing import Tuple, List, Generator, Any, Union
+from typing import Tuple, List, Generator, Any, Optional, Union
 
 # Packages
 from nltk.tokenize.punkt import PunktTrainer, PunktSentenceTokenizer
 import joblib
 
+from lexnlp.extract.en import en_language_tokens
 from lexnlp.extract.en.en_language_tokens import EnLanguageTokens
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
 
 # Setup module path
 
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-SENTENCE_SEGMENTER_MODEL: PunktSentenceTokenizer = \
-    joblib.load(os.path.join(MODULE_PATH, "./sentence_segmenter.pickle"))
 extra_abbreviations = [a.rstrip('.') for a in EnLanguageTokens.abbreviations]
-SENTENCE_SEGMENTER_MODEL._params.abbrev_types.update(extra_abbreviations)
-SENTENCE_SEGMENTER_MODEL._params.abbrev_types.update(['no', 'l'])
+
+
+SENTENCE_SEGMENTER_PATH = os.path.join(MODULE_PATH, "./sentence_segmenter.pickle")
+
+
+def load_sentence_segmenter() -> PunktSentenceTokenizer:
+    model: PunktSentenceTokenizer = joblib.load(SENTENCE_SEGMENTER_PATH)
+    model._params.abbrev_types.update(extra_abbreviations)
+    model._params.abbrev_types.update(['no', 'l'])
+    return model
+
+
+# Segmenters are loaded on first use
+# the model depends on the abbreviations the loader adds: en_language_tokens' ones and this module's own
+SENTENCE_SEGMENTER = MODEL_REGISTRY.register(
+    'en.sentence_segmenter', load_sentence_segmenter, path=SENTENCE_SEGMENTER_PATH,
+    source_paths=[__file__,
+                  en_language_tokens.__file__,
+                  os.path.join(os.path.dirname(en_language_tokens.__file__), 'data/abbreviations.txt')])
+
+__getattr__ = get_module_getattr(__name__, {'SENTENCE_SEGMENTER_MODEL': SENTENCE_SEGMENTER})
 
 
 PRE_PROCESS_TEXT_REMOVE = re.compile(
@@ -148,38 +167,44 @@ def normalize_text(text: str) -> str:
     return text
 
 
-def get_sentence_span(text: str) -> Generator[Tuple[int, int, str], Any, Any]:
+def get_sentence_span(text: str,
+                      document_context: Optional[DocumentContext] = None) -> Generator[Tuple[int, int, str], Any, Any]:
     """
     Given a text, returns a list of the (start, end) spans of sentences
     in the text.
     """
+    if document_context is not None:
+        document_context.check_text(text)
+        yield from document_context.sentence_spans
+        return
     text_unified = normalize_text(text)
-    for span in SENTENCE_SEGMENTER_MODEL.span_tokenize(text_unified, realign_boundaries=True):
+    for span in SENTENCE_SEGMENTER.get().span_tokenize(text_unified, realign_boundaries=True):
         for start, end in post_process_sentence(text, span):
             substring = text[start:end]  # we take fragments from original text
             yield start, end, substring
 
 
-def get_sentence_span_list(text) -> List[Tuple[int, int, str]]:
+def get_sentence_span_list(text, document_context: Optional[DocumentContext] = None) -> List[Tuple[int, int, str]]:
     """
     Given a text, generates (start, end) spans of sentences
     in the text.
     """
-    return [*get_sentence_span(text)]
+    return [*get_sentence_span(text, document_context=document_context)]
 
 
-def get_sentences(text: str) -> Generator[str, None, None]:
-    for _, _, sentence_span in get_sentence_span(text):
+def get_sentences(text: str, document_context: Optional[DocumentContext] = None) -> Generator[str, None, None]:
+    for _, _, sentence_span in get_sentence_span(text, document_context=document_context):
         yield sentence_span
 
 
-def get_sentence_list(text: str) -> List[str]:
+def get_sentence_list(text: str, document_context: Optional[DocumentContext] = None) -> List[str]:
     """
     Get sentences from text.
     :param text:
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
-    return [*get_sentences(text)]
+    return [*get_sentences(text, document_context=document_context)]
 
 
 def build_sentence_model(text, extra_abbrevs=None):
@@ -14,7 +14,7 @@ __email__ = "support@contraxsuite.com"
 
 import os
 import string
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Packages
 import joblib
@@ -24,8 +24,10 @@ import requests
 import sklearn.ensemble
 
 # Project
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, LineStatistics
 from lexnlp.utils.decorators import safe_failure
+from lexnlp.utils.model_registry import get_module_getattr, MODEL_REGISTRY
 from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING
 
 
@@ -34,8 +36,12 @@ from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPIN
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-SECTION_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./title_locator.pickle"))
+# Segmenters are loaded on first use
+TITLE_LOCATOR_PATH = os.path.join(MODULE_PATH, "./title_locator.pickle")
+TITLE_LOCATOR = MODEL_REGISTRY.register(
+    'en.title_locator', lambda: joblib.load(TITLE_LOCATOR_PATH), path=TITLE_LOCATOR_PATH)
+
+__getattr__ = get_module_getattr(__name__, {'SECTION_SEGMENTER_MODEL': TITLE_LOCATOR})
 
 
 def build_title_features(lines, line_id, line_window_pre, line_window_post, characters=string.printable,
@@ -127,29 +133,70 @@ def build_title_features(lines, line_id, line_window_pre, line_window_post, char
     return feature_vector
 
 
-def build_document_title_features(text: str, window_pre=3, window_post=3):
+def build_document_title_feature_matrix(text: str, window_pre=3, window_post=3,
+                                        characters=string.printable,
+                                        document_context: Optional[DocumentContext] = None) \
+        -> Tuple[List[str], numpy.ndarray]:
     """
-    Get a document title given file text.
+    Build the title features of all document lines at once.
+    :return: sorted column names and the matrix equal to
+             DataFrame([build_title_features(...) for each line]).fillna(-1).astype(int)
     """
-    # Get document character distribution
-    doc_distribution = build_document_line_distribution(text)
+    if document_context is not None:
+        document_context.check_text(text)
+        doc_distribution = document_context.document_line_distribution
+        lines = document_context.lines
+    else:
+        # Get document character distribution
+        doc_distribution = build_document_line_distribution(text)
+        lines = text.splitlines()
 
-    # Parse all lines
-    lines = text.splitlines()
-    feature_data = []
+    if not lines:
+        return [], numpy.zeros((0, 0), dtype=int)
+    if document_context is not None:
+        line_stats = document_context.get_line_statistics(
+            characters=characters, get_category=UNICODE_CHAR_TOP_CATEGORY_MAPPING.get)
+    else:
+        line_stats = LineStatistics(lines, characters=characters,
+                                    get_category=UNICODE_CHAR_TOP_CATEGORY_MAPPING.get)
+    if line_stats.has_unknown_category.any():
+        # build_title_features fails on the characters missing in the mapping
+        unknown_lines = line_stats.has_unknown_category & line_stats.get_window_line_mask(window_pre, window_post)
+        if unknown_lines.any():
+            line = lines[unknown_lines.argmax()]
+            raise KeyError(next(c for c in line if c not in UNICODE_CHAR_TOP_CATEGORY_MAPPING))
+
+    # the columns are the features found in any line's feature vector
+    columns = {'agreement', 'Agreement', 'AGREEMENT', 'contract', 'Contract', 'CONTRACT',
+               'amendment', 'Amendment', 'AMENDMENT', 'ew_agreement', 'sw_amendment'}
+    for offset in line_stats.get_window_offsets(window_pre, window_post):
+        columns.update(f'{feature}_{offset}' for feature in
+                       ['line_len', 'line_lenstrip', 'line_title_case', 'line_upper_case',
+                        'line_n_alpha', 'line_n_number', 'line_n_punct', 'line_n_whitespace'])
+    columns.update(f'char_{character}' for character in characters)
+    columns.update(doc_distribution)
+    columns = sorted(columns)
+
+    line_features = line_stats.get_contains_features(
+        ['agreement', 'Agreement', 'AGREEMENT', 'contract', 'Contract', 'CONTRACT',
+         'amendment', 'Amendment', 'AMENDMENT'])
+    line_features['ew_agreement'] = numpy.fromiter((line.strip().lower().endswith('agreement') for line in lines),
+                                                   dtype=bool, count=len(lines))
+    line_features['sw_amendment'] = numpy.fromiter((line.strip().lower().startswith('amendment') for line in lines),
+                                                   dtype=bool, count=len(lines))
+    feature_matrix = line_stats.get_feature_matrix(columns, window_pre, window_post,
+                                                   line_features=line_features,
+                                                   window_features={'line_upper_case': line_stats.is_upper},
+                                                   include_doc=doc_distribution)
+    return columns, feature_matrix.astype(int)
 
-    for line_id in range(len(lines)):
-        feature_data.append(build_title_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
 
-    # Get feature DF
-    data_keys = set()
-    for row in feature_data:
-        for key in row:
-            data_keys.add(key)
-    columns = list(data_keys)
-    columns.sort()
-    feature_df = pandas.DataFrame(feature_data, columns=columns).fillna(-1).astype(int)
-    return feature_df
+def build_document_title_features(text: str, window_pre=3, window_post=3):
+    """
+    Get a document title given file text.
+    """
+    columns, feature_matrix = build_document_title_feature_matrix(text, window_pre, window_post)
+    return pandas.DataFrame(feature_matrix, columns=columns)
 
 
 def build_model(training_file_path):
@@ -215,28 +262,31 @@ def build_model(training_file_path):
 
 
 @safe_failure
-def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5,
+               document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get titles from text.
     :param text:
     :param window_pre:
     :param window_post:
     :param score_threshold:
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
 
     # Get features and target for model
-    feature_data = build_document_title_features(text, window_pre, window_post)
+    _, feature_matrix = build_document_title_feature_matrix(text, window_pre, window_post,
+                                                            document_context=document_context)
 
     # Predict title lines
-    predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(feature_data)
+    predicted_lines = TITLE_LOCATOR.get().predict_proba(feature_matrix)
     predicted_df = pandas.DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
     title_lines = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
 
     # Check if results
     if len(title_lines) > 0:
         # Get lines
-        lines = text.splitlines()
+        lines = document_context.lines if document_context is not None else text.splitlines()
 
         # Iterate through lines
         title = ""
@@ -13,7 +13,11 @@ __email__ = "support@contraxsuite.com"
 
 
 import string
-from typing import Dict, Union
+import unicodedata
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy
+
 from lexnlp.utils.decorators import handle_invalid_text
 
 
@@ -85,3 +89,183 @@ def build_document_line_distribution(
                 feature_vector[character] = feature_vector[character] / total_startchar if total_startchar != 0.0 else 0.0
 
     return feature_vector
+
+
+def get_unicode_top_category(char: str) -> str:
+    return unicodedata.category(char)[0]
+
+
+class LineStatistics:
+    """
+    Per-line statistics of a document's lines computed once per line.
+
+    The build_*_features functions of the page, paragraph, section and title segmenters
+    recalculate the stats of each line for every window the line belongs to and then
+    the dicts are converted into a DataFrame. LineStatistics keeps the stats in NumPy arrays
+    (one item per line) and get_feature_matrix() shifts them to build the windowed
+    feature matrix the segmenter model expects.
+    """
+
+    # top unicode categories counted by the line_n_* features
+    CATEGORY_FEATURES = [('L', 'line_n_alpha'), ('N', 'line_n_number'),
+                         ('P', 'line_n_punct'), ('Z', 'line_n_whitespace')]
+
+    def __init__(self,
+                 lines: List[str],
+                 characters: str = string.printable,
+                 get_category: Callable[[str], Optional[str]] = get_unicode_top_category):
+        """
+        :param lines: document lines
+        :param characters: characters counted by the char_* features
+        :param get_category: returns the top unicode category ("L", "N", ...) of the character
+                             or None if the category is unknown
+        """
+        self.lines = lines
+        self.line_count = len(lines)
+        self.characters = characters
+
+        lengths = numpy.fromiter(map(len, lines), dtype=numpy.int64, count=self.line_count)
+        stripped_lines = [line.strip() for line in lines]
+        self.window_features = {
+            'line_len': lengths,
+            'line_lenstrip': numpy.fromiter(map(len, stripped_lines), dtype=numpy.int64, count=self.line_count),
+            'line_title_case': numpy.fromiter((line == line.title() for line in lines),
+                                              dtype=bool, count=self.line_count),
+            'line_upper_case': numpy.fromiter((line == line.upper() for line in lines),
+                                              dtype=bool, count=self.line_count),
+        }  # type: Dict[str, numpy.ndarray]
+        self.is_upper = numpy.fromiter((line.isupper() for line in lines), dtype=bool, count=self.line_count)
+
+        # characters of all lines with the line index of each character
+        codes = numpy.frombuffer(''.join(lines).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        char_line_ids = numpy.repeat(numpy.arange(self.line_count), lengths)
+        unique_codes, char_code_ids = numpy.unique(codes, return_inverse=True)
+        unique_chars = [chr(code) for code in unique_codes]
+
+        # the last category column counts the other and the unknown categories
+        category_columns = {category: i for i, (category, _) in enumerate(self.CATEGORY_FEATURES)}
+        unique_categories = [get_category(char) for char in unique_chars]
+        unique_category_ids = numpy.array(
+            [category_columns.get(category, len(category_columns)) for category in unique_categories],
+            dtype=numpy.int64)
+        category_counts = self._count_by_line(char_line_ids, unique_category_ids[char_code_ids],
+                                              len(category_columns) + 1)
+        for i, (_, feature) in enumerate(self.CATEGORY_FEATURES):
+            self.window_features[feature] = category_counts[:, i]
+        unknown_category_ids = numpy.array([category is None for category in unique_categories], dtype=bool)
+        self.has_unknown_category = numpy.zeros(self.line_count, dtype=bool)
+        self.has_unknown_category[char_line_ids[unknown_category_ids[char_code_ids]]] = True
+
+        # counts of the given characters, the last column counts the rest
+        unique_char_columns = {char: i for i, char in enumerate(dict.fromkeys(characters))}
+        unique_char_ids = numpy.array(
+            [unique_char_columns.get(char, len(unique_char_columns)) for char in unique_chars], dtype=numpy.int64)
+        char_counts = self._count_by_line(char_line_ids, unique_char_ids[char_code_ids],
+                                          len(unique_char_columns) + 1)
+        self.char_counts = {char: char_counts[:, i] for char, i in unique_char_columns.items()}
+
+        first_chars = [line[0] if line else '' for line in stripped_lines]
+        last_chars = [line[-1] if line else '' for line in stripped_lines]
+        self.line_features = {
+            'first_char_punct': self._chars_in(first_chars, string.punctuation),
+            'last_char_punct': self._chars_in(last_chars, string.punctuation),
+            'first_char_number': self._chars_in(first_chars, string.digits),
+            'last_char_number': self._chars_in(last_chars, string.digits),
+        }  # type: Dict[str, numpy.ndarray]
+        for char, counts in self.char_counts.items():
+            self.line_features[f'char_{char}'] = counts
+
+    def _count_by_line(self, char_line_ids: numpy.ndarray, char_column_ids: numpy.ndarray,
+                       column_count: int) -> numpy.ndarray:
+        counts = numpy.bincount(char_line_ids * column_count + char_column_ids,
+                                minlength=self.line_count * column_count)
+        return counts.reshape((self.line_count, column_count))
+
+    def _chars_in(self, chars: List[str], char_set: str) -> numpy.ndarray:
+        return numpy.fromiter((bool(c) and c in char_set for c in chars), dtype=bool, count=self.line_count)
+
+    def get_contains_features(self, substrings: List[str]) -> Dict[str, numpy.ndarray]:
+        """
+        Features like {"page": 1 if "page" in line else 0}
+        """
+        return {s: numpy.fromiter((s in line for line in self.lines), dtype=bool, count=self.line_count)
+                for s in substrings}
+
+    def get_window_bounds(self, line_window_pre: int, line_window_post: int):
+        """
+        Window offsets (from, to) of each line. The offsets are calculated the same
+        way the build_*_features functions do, including the final offset quirk.
+        """
+        line_ids = numpy.arange(self.line_count)
+        window_pre = -numpy.minimum(line_window_pre, line_ids)
+        window_post = numpy.where(line_ids + line_window_post >= self.line_count,
+                                  self.line_count - line_window_post - 1, line_window_post)
+        # the lines after the document end are skipped
+        window_post = numpy.minimum(window_post, self.line_count - line_ids - 1)
+        return window_pre, window_post
+
+    def get_window_offsets(self, line_window_pre: int, line_window_post: int) -> List[int]:
+        """
+        Offsets present in the window of at least one line.
+        """
+        window_pre, window_post = self.get_window_bounds(line_window_pre, line_window_post)
+        return [offset for offset in range(-line_window_pre, line_window_post + 1)
+                if ((window_pre <= offset) & (offset <= window_post)).any()]
+
+    def get_window_line_mask(self, line_window_pre: int, line_window_post: int) -> numpy.ndarray:
+        """
+        Lines that are included in the window of at least one line.
+        """
+        window_pre, window_post = self.get_window_bounds(line_window_pre, line_window_post)
+        line_ids = numpy.arange(self.line_count)
+        mask = numpy.zeros(self.line_count, dtype=bool)
+        for offset in range(-line_window_pre, line_window_post + 1):
+            valid = (window_pre <= offset) & (offset <= window_post)
+            mask[line_ids[valid] + offset] = True
+        return mask
+
+    def get_feature_matrix(self,
+                           columns: List[str],
+                           line_window_pre: int,
+                           line_window_post: int,
+                           line_features: Optional[Dict[str, numpy.ndarray]] = None,
+                           window_features: Optional[Dict[str, numpy.ndarray]] = None,
+                           include_doc: Optional[Dict[str, float]] = None,
+                           missing_value: float = -1) -> numpy.ndarray:
+        """
+        Build the feature matrix, one row per line, in the order of the columns given.
+        The result equals DataFrame([build_*_features(...) for each line], columns=columns).fillna(-1).
+
+        :param columns: feature names: "line_len_-1", "char_a", "doc_char_a", ...
+        :param line_features: features of the line itself besides the ones LineStatistics builds
+        :param window_features: per-line features (to be shifted by the window offset)
+                                that replace or extend LineStatistics.window_features
+        :param include_doc: document features, the same for all lines
+        :param missing_value: value of the features that are absent for the line
+        """
+        all_line_features = dict(self.line_features)
+        all_line_features.update(line_features or {})
+        all_window_features = dict(self.window_features)
+        all_window_features.update(window_features or {})
+        include_doc = include_doc or {}
+
+        matrix = numpy.full((self.line_count, len(columns)), missing_value, dtype=numpy.float64)
+        window_pre, window_post = self.get_window_bounds(line_window_pre, line_window_post)
+        line_ids = numpy.arange(self.line_count)
+
+        for column_id, column in enumerate(columns):
+            if column in include_doc:
+                matrix[:, column_id] = include_doc[column]
+                continue
+            values = all_line_features.get(column)
+            if values is not None:
+                matrix[:, column_id] = values
+                continue
+            feature, _, offset = column.rpartition('_')
+            values = all_window_features.get(feature)
+            if values is None or not offset.lstrip('-').isdigit():
+                continue
+            offset = int(offset)
+            valid = (window_pre <= offset) & (offset <= window_post)
+            matrix[valid, column_id] = values[line_ids[valid] + offset]
+        return matrix
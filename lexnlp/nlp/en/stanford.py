@@ -22,7 +22,7 @@ from nltk.tokenize.stanford import StanfordTokenizer
 
 # Project imports
 from lexnlp import is_stanford_enabled
-from lexnlp.nlp.en.tokens import STOPWORDS, get_lemma_list
+from lexnlp.nlp.en.tokens import STOPWORD_SET, get_lemma_list
 from lexnlp.config.stanford import STANFORD_POS_PATH
 
 
@@ -73,8 +73,9 @@ def get_tokens(text, lowercase=False, stopword=False) -> Generator:
     check_stanford()
 
     if stopword:
+        stopwords = STOPWORD_SET.get()
         for token in STANFORD_TOKENIZER.tokenize(text):
-            if token.lower() in STOPWORDS:
+            if token.lower() in stopwords:
                 continue
             if lowercase:
                 yield token.lower()
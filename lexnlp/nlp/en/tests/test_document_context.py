@@ -0,0 +1,74 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from unittest import TestCase
+
+from lexnlp.extract.en.entities.nltk_maxent import get_companies
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.segments.pages import get_pages
+from lexnlp.nlp.en.segments.paragraphs import get_paragraph_span_list
+from lexnlp.nlp.en.segments.sections import get_sections
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.segments.titles import get_titles
+from lexnlp.nlp.en.tokens import get_token_list
+
+
+class TestDocumentContext(TestCase):
+    TEXT = '''SERVICES AGREEMENT
+
+This Services Agreement is made by and between Acme Widgets, Inc. and Beta Holdings LLC.
+
+ARTICLE I
+DEFINITIONS
+
+1.1 "Services" means the services described in Exhibit A.
+1.2 "Term" means the period of twelve (12) months.
+
+Page 1 of 2
+
+ARTICLE II
+PAYMENT
+
+2.1 The Client shall pay the fees within thirty days.
+'''
+
+    def test_same_results(self):
+        context = DocumentContext(self.TEXT)
+        self.assertEqual(get_sentence_span_list(self.TEXT),
+                         get_sentence_span_list(self.TEXT, document_context=context))
+        self.assertEqual(get_paragraph_span_list(self.TEXT),
+                         get_paragraph_span_list(self.TEXT, document_context=context))
+        self.assertEqual(list(get_sections(self.TEXT)),
+                         list(get_sections(self.TEXT, document_context=context)))
+        self.assertEqual(list(get_pages(self.TEXT)),
+                         list(get_pages(self.TEXT, document_context=context)))
+        self.assertEqual(list(get_titles(self.TEXT)),
+                         list(get_titles(self.TEXT, document_context=context)))
+        self.assertEqual(get_token_list(self.TEXT, lowercase=True),
+                         get_token_list(self.TEXT, lowercase=True, document_context=context))
+
+    def test_same_companies(self):
+        context = DocumentContext(self.TEXT)
+        self.assertEqual(list(get_companies(self.TEXT)),
+                         list(get_companies(self.TEXT, document_context=context)))
+        self.assertIn(('text_variant', 'newlines_replaced'), context.cache)
+
+    def test_values_cached(self):
+        context = DocumentContext(self.TEXT)
+        self.assertIs(context.sentence_spans, context.sentence_spans)
+        self.assertIs(context.get_line_statistics(), context.get_line_statistics())
+        self.assertIsNot(context.get_line_statistics(), context.get_line_statistics(lines_with_spans=True))
+
+        spans = get_sentence_span_list(self.TEXT, document_context=context)
+        spans.clear()
+        self.assertTrue(context.sentence_spans)
+
+    def test_other_text(self):
+        context = DocumentContext(self.TEXT)
+        with self.assertRaises(ValueError):
+            get_sentence_span_list('Another text.', document_context=context)
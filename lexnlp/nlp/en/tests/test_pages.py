@@ -12,8 +12,13 @@ __email__ = "support@contraxsuite.com"
 import os
 from unittest import TestCase
 
+import numpy
+import pandas
+
 from lexnlp.extract.common.base_path import lexnlp_test_path
-from lexnlp.nlp.en.segments.pages import get_pages
+from lexnlp.nlp.en.segments.pages import build_page_break_feature_matrix, build_page_break_features, \
+    get_page_break_feature_names, get_pages
+from lexnlp.nlp.en.segments.utils import build_document_distribution
 from lexnlp.tests import lexnlp_tests
 
 
@@ -33,3 +38,21 @@ class TestPages(TestCase):
             clean_result = [remove_blankspace(p) for p in expected]
             for page in page_list:
                 assert remove_blankspace(page) in clean_result
+
+    def test_page_break_feature_matrix(self):
+        text = 'Page 1 of 2\nTERMS AND CONDITIONS\n\n1. Term. This Agreement - 12 months.\n' \
+               'Page 2 of 2\nPG 2\n\u00a0 \u20ac 100'
+        lines = text.splitlines()
+        doc_distribution = build_document_distribution(text)
+        for window_pre, window_post in [(3, 3), (1, 6), (0, 0)]:
+            feature_data = [build_page_break_features(lines, line_id, window_pre, window_post,
+                                                      include_doc=doc_distribution)
+                            for line_id in range(len(lines))]
+            column_names = sorted(get_page_break_feature_names(len(lines), window_pre, window_post,
+                                                               include_doc=doc_distribution))
+            expected = pandas.DataFrame(feature_data, columns=column_names).fillna(-1)
+
+            columns, matrix = build_page_break_feature_matrix(lines, window_pre, window_post,
+                                                              include_doc=doc_distribution)
+            self.assertEqual(column_names, columns)
+            self.assertTrue(numpy.array_equal(expected.to_numpy(dtype=float), matrix))
@@ -15,11 +15,13 @@ from unittest import TestCase
 
 # Test imports
 from nose.tools import assert_dict_equal, assert_list_equal
+from pandas import DataFrame
 
 # Project imports
 from lexnlp.extract.common.base_path import lexnlp_test_path
-from lexnlp.nlp.en.segments.paragraphs import get_paragraph_list, get_paragraph_span_list, splitlines_with_spans
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.segments.paragraphs import get_paragraph_list, get_paragraph_span_list, splitlines_with_spans, \
+    build_paragraph_break_feature_matrix, build_paragraph_break_features, get_paragraph_break_feature_names
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_document_line_distribution
 from lexnlp.tests import lexnlp_tests
 
 
@@ -182,6 +184,22 @@ class TestParagraphs(TestCase):
         ps = get_paragraph_list(text=text)
         self.assertEqual(text, ps[0])
 
+    def test_paragraph_break_feature_matrix(self):
+        # two short documents check the window offsets at the document start and end
+        for text in ['ARTICLE I\n\nDefinitions.\r\n"Term" means 12 (twelve) months;\nSection 1.1 Title',
+                     'Short\ntext']:
+            lines, _ = splitlines_with_spans(text)
+            doc_distribution = build_document_line_distribution(text)
+            feature_data = [build_paragraph_break_features(lines, line_id, 3, 3, include_doc=doc_distribution)
+                            for line_id in range(len(lines))]
+            column_names = sorted(get_paragraph_break_feature_names(len(lines), 3, 3,
+                                                                    include_doc=doc_distribution))
+            expected = DataFrame(feature_data, columns=column_names).fillna(-1).astype(int)
+
+            columns, matrix = build_paragraph_break_feature_matrix(lines, 3, 3, include_doc=doc_distribution)
+            self.assertEqual(column_names, columns)
+            self.assertEqual(expected.to_numpy().tolist(), matrix.tolist())
+
     def test_paragraph_examples(self):
         file_path = os.path.join(self.TEST_PATH, 'test_paragraph_examples.csv')
         for (_i, text, _input_args, expected) in lexnlp_tests.iter_test_data_text_and_tuple(
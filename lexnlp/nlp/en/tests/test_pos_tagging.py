@@ -0,0 +1,58 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from unittest import TestCase
+
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.pos_tagging import PosTagger, pos_tag
+
+
+class TestPosTagger(TestCase):
+    def setUp(self):
+        self.batches = []
+
+        def tag_sents(sentences):
+            self.batches.append(sentences)
+            return [[(token, 'NNP' if token.istitle() else 'NN') for token in tokens] for tokens in sentences]
+
+        self.tag_sents = tag_sents
+
+    def test_batch(self):
+        tagger = PosTagger(self.tag_sents)
+        tags = tagger.tag_sents([['Acme', 'shares'], ['the', 'Buyer'], ['Acme', 'shares']])
+        self.assertEqual([[('Acme', 'NNP'), ('shares', 'NN')], [('the', 'NN'), ('Buyer', 'NNP')],
+                          [('Acme', 'NNP'), ('shares', 'NN')]], tags)
+        self.assertEqual([[['Acme', 'shares'], ['the', 'Buyer']]], self.batches)
+        # no cache across the calls by default
+        tagger.tag(['the', 'Buyer'])
+        self.assertEqual(2, len(self.batches))
+
+    def test_lru_cache(self):
+        tagger = PosTagger(self.tag_sents, cache_size=2)
+        tagger.tag(['a'])
+        tagger.tag(['b'])
+        tags = tagger.tag(['a'])
+        tags.append(('modified', 'NN'))
+        self.assertEqual([('a', 'NN')], tagger.tag(['a']))
+        tagger.tag(['c'])  # evicts ['b']
+        self.assertEqual([('a',), ('c',)], list(tagger.cache.items))
+        self.assertEqual(3, len(self.batches))
+        self.assertEqual((2, 3), (tagger.hits, tagger.misses))
+
+        tagger.set_cache_size(1)
+        self.assertEqual([('c',)], list(tagger.cache.items))
+
+    def test_document_context(self):
+        tagger = PosTagger(self.tag_sents)
+        context = DocumentContext('Acme shares. The Buyer.', pos_tagger=tagger)
+        tags = context.tag_token_lists([['Acme', 'shares', '.'], ['The', 'Buyer', '.']])
+        self.assertEqual([('The', 'NNP'), ('Buyer', 'NNP'), ('.', 'NN')], tags[1])
+        self.assertEqual(tags[0], pos_tag(['Acme', 'shares', '.'], context))
+        variant = context.get_text_variant('upper', str.upper)
+        variant.get_pos_tags(['ACME'])
+        self.assertEqual([[['Acme', 'shares', '.'], ['The', 'Buyer', '.']], [['ACME']]], self.batches)
@@ -16,23 +16,44 @@ __email__ = "support@contraxsuite.com"
 import os
 import pickle
 import regex as re
-from typing import Any, Generator, List
+from typing import Any, Generator, List, Optional, Tuple
 
 # NLTK imports
 import nltk
 from nltk.corpus import wordnet
 
+from lexnlp.nlp.en.document_context import DocumentContext
+from lexnlp.nlp.en.pos_tagging import pos_tag
+from lexnlp.utils.model_registry import get_module_getattr, LazyModel, MODEL_REGISTRY
+
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Stopwords
-STOPWORDS = pickle.load(open(os.path.join(MODULE_PATH, "stopwords.pickle"), "rb"))
 
-# Collocations
+
+def _register_pickle(name: str, file_name: str) -> LazyModel:
+    path = os.path.join(MODULE_PATH, file_name)
+
+    def load():
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return MODEL_REGISTRY.register(name, load, path=path)
+
+
+# Stopwords, loaded on first use
+STOPWORD_SET = _register_pickle('en.stopwords', "stopwords.pickle")
+
+# Collocations, loaded on first use
 COLLOCATION_SIZE = 10000
-BIGRAM_COLLOCATIONS = pickle.load(
-    open(os.path.join(MODULE_PATH, "collocation_bigrams_{0}.pickle".format(COLLOCATION_SIZE)), "rb"))
-TRIGRAM_COLLOCATIONS = pickle.load(
-    open(os.path.join(MODULE_PATH, "collocation_trigrams_{0}.pickle".format(COLLOCATION_SIZE)), "rb"))
+BIGRAM_COLLOCATION_LIST = _register_pickle(
+    'en.bigram_collocations', "collocation_bigrams_{0}.pickle".format(COLLOCATION_SIZE))
+TRIGRAM_COLLOCATION_LIST = _register_pickle(
+    'en.trigram_collocations', "collocation_trigrams_{0}.pickle".format(COLLOCATION_SIZE))
+
+__getattr__ = get_module_getattr(__name__, {
+    'STOPWORDS': STOPWORD_SET,
+    'BIGRAM_COLLOCATIONS': BIGRAM_COLLOCATION_LIST,
+    'TRIGRAM_COLLOCATIONS': TRIGRAM_COLLOCATION_LIST,
+})
 
 # Setup default stemmer for English
 DEFAULT_STEMMER = nltk.stem.snowball.EnglishStemmer()
@@ -77,18 +98,24 @@ def get_tokens_by_regex(text: str,
         yield wrd
 
 
-def get_tokens(text: str, lowercase=False, stopword=False, preserve_line=True) -> Generator[str, Any, Any]:
+def get_tokens(text: str, lowercase=False, stopword=False, preserve_line=True,
+               document_context: Optional[DocumentContext] = None) -> Generator[str, Any, Any]:
     """
     Get token generator from text.
     :param text:
     :param lowercase:
     :param stopword:
     :param preserve_line: keep the preserve the sentence and not sentence tokenize it.
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
-    if stopword:
+    if document_context is not None:
+        document_context.check_text(text)
+        yield from document_context.get_tokens(lowercase=lowercase, stopword=stopword, preserve_line=preserve_line)
+    elif stopword:
+        stopwords = STOPWORD_SET.get()
         for token in nltk.word_tokenize(text, preserve_line=preserve_line):
-            if token.lower() in STOPWORDS:
+            if token.lower() in stopwords:
                 continue
             if lowercase:
                 yield token.lower()
@@ -103,17 +130,18 @@ def get_tokens(text: str, lowercase=False, stopword=False, preserve_line=True) -
 
 
 def get_token_list(text: str, lowercase: bool = False, stopword: bool = False,
-                   preserve_line: bool = True) -> List:
+                   preserve_line: bool = True, document_context: Optional[DocumentContext] = None) -> List:
     """
     Get token list from text.
     :param text:
     :param lowercase:
     :param stopword:
     :param preserve_line: keep the preserve the sentence and not sentence tokenize it.
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
     return list(get_tokens(text, lowercase=lowercase, stopword=stopword,
-                           preserve_line=preserve_line))
+                           preserve_line=preserve_line, document_context=document_context))
 
 
 def get_stems(text, lowercase=False, stopword=False, stemmer=DEFAULT_STEMMER) -> Generator:
@@ -144,107 +172,91 @@ def get_stem_list(text, lowercase=False, stopword=False, stemmer=DEFAULT_STEMMER
     return list(get_stems(text, lowercase=lowercase, stopword=stopword, stemmer=stemmer))
 
 
-def get_lemmas(text, lowercase=False, stopword=False, lemmatizer=DEFAULT_LEMMATIZER) -> Generator:
+def get_lemmas(text, lowercase=False, stopword=False, lemmatizer=DEFAULT_LEMMATIZER,
+               document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get lemmas from text.
     :param text:
     :param lowercase:
     :param stopword:
     :param lemmatizer:
+    :param document_context: cached analysis of the text shared with other get_* functions
     :return:
     """
-    tokens = get_token_list(text, lowercase=False, stopword=False)
-    pos = nltk.pos_tag(tokens)
-
-    if stopword:
-        for i in range(len(tokens)):
-            token = pos[i][0]
-            wn_pos = get_wordnet_pos(pos[i][1])
-
-            if token.lower() in STOPWORDS:
-                continue
+    tokens = get_token_list(text, lowercase=False, stopword=False, document_context=document_context)
+    pos = pos_tag(tokens, document_context)
+    yield from lemmatize_pos(pos, lowercase=lowercase, stopword=stopword, lemmatizer=lemmatizer)
 
-            if lowercase:
-                yield lemmatizer.lemmatize(token, wn_pos).lower() if wn_pos else lemmatizer.lemmatize(token).lower()
-            else:
-                yield lemmatizer.lemmatize(token, wn_pos) if wn_pos else lemmatizer.lemmatize(token)
-    else:
-        for i in range(len(tokens)):
-            token = pos[i][0]
-            wn_pos = get_wordnet_pos(pos[i][1])
 
-            if lowercase:
-                yield lemmatizer.lemmatize(token, wn_pos).lower() if wn_pos else lemmatizer.lemmatize(token).lower()
-            else:
-                yield lemmatizer.lemmatize(token, wn_pos) if wn_pos else lemmatizer.lemmatize(token)
+def lemmatize_pos(pos: List[Tuple[str, str]], lowercase=False, stopword=False,
+                  lemmatizer=DEFAULT_LEMMATIZER) -> Generator:
+    """
+    Get lemmas of the POS-tagged tokens.
+    """
+    stopwords = STOPWORD_SET.get() if stopword else None
+    for token, tag in pos:
+        if stopwords is not None and token.lower() in stopwords:
+            continue
+        wn_pos = get_wordnet_pos(tag)
+        if lowercase:
+            yield lemmatizer.lemmatize(token, wn_pos).lower() if wn_pos else lemmatizer.lemmatize(token).lower()
+        else:
+            yield lemmatizer.lemmatize(token, wn_pos) if wn_pos else lemmatizer.lemmatize(token)
 
 
-def get_lemma_list(text, lowercase=False, stopword=False, lemmatizer=DEFAULT_LEMMATIZER) -> List:
+def get_lemma_list(text, lowercase=False, stopword=False, lemmatizer=DEFAULT_LEMMATIZER,
+                   document_context: Optional[DocumentContext] = None) -> List:
     """
     Get lemmas materialized from text.
     """
-    return list(get_lemmas(text, lowercase=lowercase, stopword=stopword, lemmatizer=lemmatizer))
+    return list(get_lemmas(text, lowercase=lowercase, stopword=stopword, lemmatizer=lemmatizer,
+                           document_context=document_context))
 
 
-def get_verbs(text, lowercase=False, lemmatize=False) -> Generator:
+def get_pos_tokens(text, pos_prefix: str, lowercase=False, lemmatize=False,
+                   document_context: Optional[DocumentContext] = None) -> Generator:
     """
-    Get only verbs from text.
+    Get the tokens (or their lemmas) whose POS tags start with the prefix.
     """
-    tokens = get_token_list(text)
-    pos = nltk.pos_tag(tokens)
-    verb_index = [i for i in range(len(pos)) if pos[i][1].startswith("V")]
+    tokens = get_token_list(text, document_context=document_context)
+    pos = pos_tag(tokens, document_context)
+    pos_index = [i for i in range(len(pos)) if pos[i][1].startswith(pos_prefix)]
     if lemmatize:
-        lemmas = get_lemma_list(text, lowercase=lowercase)
-        for j in verb_index:
+        lemmas = list(lemmatize_pos(pos, lowercase=lowercase))
+        for j in pos_index:
             yield lemmas[j]
     else:
-        for j in verb_index:
+        for j in pos_index:
             yield tokens[j].lower() if lowercase else tokens[j]
 
 
-def get_nouns(text, lowercase=False, lemmatize=False) -> Generator:
+def get_verbs(text, lowercase=False, lemmatize=False,
+              document_context: Optional[DocumentContext] = None) -> Generator:
+    """
+    Get only verbs from text.
+    """
+    yield from get_pos_tokens(text, "V", lowercase, lemmatize, document_context)
+
+
+def get_nouns(text, lowercase=False, lemmatize=False,
+              document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get only nouns from text.
     """
-    tokens = get_token_list(text)
-    pos = nltk.pos_tag(tokens)
-    noun_index = [i for i in range(len(pos)) if pos[i][1].startswith("N")]
-    if lemmatize:
-        lemmas = get_lemma_list(text, lowercase=lowercase)
-        for j in noun_index:
-            yield lemmas[j]
-    else:
-        for j in noun_index:
-            yield tokens[j].lower() if lowercase else tokens[j]
+    yield from get_pos_tokens(text, "N", lowercase, lemmatize, document_context)
 
 
-def get_adverbs(text, lowercase=False, lemmatize=False) -> Generator:
+def get_adverbs(text, lowercase=False, lemmatize=False,
+                document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get only adverbs from text.
     """
-    tokens = get_token_list(text)
-    pos = nltk.pos_tag(tokens)
-    adverb_index = [i for i in range(len(pos)) if pos[i][1].startswith("RB")]
-    if lemmatize:
-        lemmas = get_lemma_list(text, lowercase=lowercase)
-        for j in adverb_index:
-            yield lemmas[j]
-    else:
-        for j in adverb_index:
-            yield tokens[j].lower() if lowercase else tokens[j]
+    yield from get_pos_tokens(text, "RB", lowercase, lemmatize, document_context)
 
 
-def get_adjectives(text, lowercase=False, lemmatize=False) -> Generator:
+def get_adjectives(text, lowercase=False, lemmatize=False,
+                   document_context: Optional[DocumentContext] = None) -> Generator:
     """
     Get only adjectives from text.
     """
-    tokens = get_token_list(text)
-    pos = nltk.pos_tag(tokens)
-    adj_index = [i for i in range(len(pos)) if pos[i][1].startswith("JJ")]
-    if lemmatize:
-        lemmas = get_lemma_list(text, lowercase=lowercase)
-        for j in adj_index:
-            yield lemmas[j]
-    else:
-        for j in adj_index:
-            yield tokens[j].lower() if lowercase else tokens[j]
+    yield from get_pos_tokens(text, "JJ", lowercase, lemmatize, document_context)
@@ -0,0 +1,49 @@
+"""Directories of the files lexnlp unpickles after writing them itself
+
+Unpickling a file runs the code the file tells it to, so these files are read only from
+the directories no other user could have written to.
+"""
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import os
+import stat
+
+
+def get_user_cache_dir(name: str) -> str:
+    """
+    The current user's cache directory: $XDG_CACHE_HOME/lexnlp/<name> or ~/.cache/lexnlp/<name>.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'lexnlp', name)
+
+
+def make_private_dir(path: str) -> None:
+    """
+    Create the directory readable and writable by the current user only (if it doesn't exist)
+    and check that no other user can write to it.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    check_private_path(path)
+
+
+def check_private_path(path: str) -> None:
+    """
+    Raise PermissionError unless the file or directory belongs to the current user
+    and is not writable by the group or the other users.
+    Raise FileNotFoundError if there is no such file.
+    """
+    path_stat = os.stat(path)
+    # no owners to compare on Windows
+    if not hasattr(os, 'getuid'):
+        return
+    if path_stat.st_uid != os.getuid():
+        raise PermissionError(f'{path} belongs to another user')
+    if path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f'{path} is writable by other users')
@@ -0,0 +1,164 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from lexnlp import __version__ as lexnlp_version
+from lexnlp.utils.cache_dirs import check_private_path, make_private_dir
+from lexnlp.utils.model_registry import LazyModel, ModelRegistry, MODEL_REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+# the libraries whose objects the dictionaries are pickled with
+DICTIONARY_LIBRARIES = ['pandas', 'regex']
+
+
+class DictionaryCache:
+    """
+    Keeps the dictionaries built from CSV files (e.g. the court parsers with their phrase indexes)
+    in pickle files so that the next processes read them in milliseconds instead of building them again:
+
+        COURT_PARSER = DICTIONARY_CACHE.register('en.court_parser', setup_en_parser, [csv_path, __file__])
+        COURT_PARSER.get().parse(text)
+
+    The dictionaries are loaded on first use like the other models of the registry.
+    The files are kept only if a directory is given: cache_dir or LEXNLP_DICTIONARY_CACHE_DIR,
+    otherwise every process builds the dictionaries. The directory is created readable by its owner
+    only, and the files are read only if they and the directory belong to the current user and
+    are not writable by other users: unpickling a file runs any code the file's author wanted.
+
+    A file is used only if it was built from the source files with the same checksums (the CSV files
+    and the code building the dictionary), by the same lexnlp, Python and library versions,
+    otherwise the dictionary is built and the file is written again. Build the files beforehand,
+    e.g. while building a Docker image, for the workers not to build them on start:
+
+        import lexnlp.extract.en.courts
+        DICTIONARY_CACHE.build()
+    """
+    # version of the files' layout: the files written with another version are ignored
+    FORMAT_VERSION = 1
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 registry: ModelRegistry = MODEL_REGISTRY):
+        """
+        :param cache_dir: directory of the files, LEXNLP_DICTIONARY_CACHE_DIR by default,
+                          the dictionaries are not kept in files if neither is set
+        """
+        self.cache_dir = cache_dir or os.environ.get('LEXNLP_DICTIONARY_CACHE_DIR') or None
+        self.registry = registry
+        self.builders = {}  # type: Dict[str, Callable[[], Any]]
+        self.source_paths = {}  # type: Dict[str, List[str]]
+
+    def register(self, name: str, build: Callable[[], Any], source_paths: Iterable[str]) -> LazyModel:
+        """
+        Register the dictionary in the registry, loaded from its file or built on first use.
+        :param build: builds the dictionary, the built object should be picklable
+        :param source_paths: the files the dictionary is built from, the code building it included
+        """
+        self.builders[name] = build
+        self.source_paths[name] = list(source_paths)
+        return self.registry.register(name, lambda: self.load(name))
+
+    def load(self, name: str) -> Any:
+        """
+        Read the dictionary from its file or build it if the file is missing or outdated.
+        """
+        if not self.cache_dir:
+            return self.builders[name]()
+        header = self.get_header(name)
+        path = self.get_cache_path(name)
+        try:
+            check_private_path(self.cache_dir)
+            check_private_path(path)
+            with open(path, 'rb') as f:
+                # the header is pickled separately to not read the rest of an outdated file
+                if pickle.load(f) == header:
+                    return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f'Cannot read dictionary "{name}" from {path}: {e}')
+        return self.build_dictionary(name, header)
+
+    def build(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Build the dictionaries (all registered dictionaries by default) and write their files.
+        :return: the paths of the files
+        """
+        if not self.cache_dir:
+            raise ValueError('Set cache_dir or LEXNLP_DICTIONARY_CACHE_DIR to write the dictionaries')
+        names = list(self.builders) if names is None else list(names)
+        for name in names:
+            self.registry[name].set(self.build_dictionary(name, self.get_header(name)))
+        return [self.get_cache_path(name) for name in names]
+
+    def build_dictionary(self, name: str, header: Dict[str, Any]) -> Any:
+        obj = self.builders[name]()
+        path = self.get_cache_path(name)
+        try:
+            make_private_dir(self.cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError as e:
+            logger.warning(f'Cannot write dictionary "{name}" to {path}: {e}')
+            return obj
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # other processes either see the complete file or don't see it
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return obj
+
+    def get_header(self, name: str) -> Dict[str, Any]:
+        """
+        What the dictionary's file should have been built from.
+        """
+        libraries = {}
+        for library in DICTIONARY_LIBRARIES:
+            try:
+                libraries[library] = metadata.version(library)
+            except metadata.PackageNotFoundError:
+                pass
+        return {
+            'format': self.FORMAT_VERSION,
+            'lexnlp': lexnlp_version,
+            'python': sys.version,
+            'libraries': libraries,
+            'checksums': [self.get_checksum(path) for path in self.source_paths[name]],
+        }
+
+    @staticmethod
+    def get_checksum(path: str) -> Optional[str]:
+        """
+        SHA1 of the file's content, None if there is no such file (e.g. an optional data file).
+        """
+        if not os.path.isfile(path):
+            return None
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_cache_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f'{name}.pickle')
+
+
+DICTIONARY_CACHE = DictionaryCache()
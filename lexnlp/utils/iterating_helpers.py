@@ -10,7 +10,7 @@ try:
     from collections import Iterable
 except ImportError:
     from collections.abc import Iterable
-from typing import Callable, Any
+from typing import Callable, Any, Generator, List, Optional, Tuple
 
 
 def collapse_sequence(sequence: Iterable,
@@ -25,3 +25,31 @@ def count_sequence_matches(sequence: Iterable,
                            predicate: Callable[[Any], bool]) -> int:
     return collapse_sequence(sequence,
                              lambda i, a: a + 1 if predicate(i) else a, 0)
+
+
+def chunk_sequence(sequence: Iterable,
+                   chunk_size: Optional[int] = None) -> Generator[List[Any], None, None]:
+    """
+    Split the sequence into lists of chunk_size items (the last one may be shorter).
+    If chunk_size is not set the whole sequence is returned as a single list.
+    Empty sequences produce no chunks.
+    """
+    chunk = []
+    for item in sequence:
+        chunk.append(item)
+        if chunk_size and len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def with_previous(sequence: Iterable) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    Yield (previous item, item) pairs, the previous item of the first one is None.
+    Unlike zip(sequence, sequence[1:]) the sequence may be a generator.
+    """
+    previous = None
+    for item in sequence:
+        yield previous, item
+        previous = item
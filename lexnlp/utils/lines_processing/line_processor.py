@@ -6,7 +6,7 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-from typing import List, Generator, Tuple
+from typing import Dict, FrozenSet, List, Generator, Pattern, Tuple
 import regex as re
 
 
@@ -76,6 +76,8 @@ class LineProcessor:
                                LineProcessor.line_tail_percent / 100)
         self.line_split_params = line_split_params or self.default_split_params
         self.allow_breaks_in_phrase = allow_breaks_in_phrase
+        # line break characters: compiled pattern of their sequences
+        self.reg_line_breaks = {}  # type: Dict[FrozenSet[str], Pattern]
 
         if self.line_split_params.abbreviations:
             tokens = self.line_split_params.abbreviations
@@ -127,22 +129,62 @@ class LineProcessor:
                                         text: str,
                                         line_split_ptrs: LineSplitParams = None) -> \
             Generator[LineOrPhrase, None, None]:
+        for start, end, ending_end in self.split_text_on_line_offsets(text, line_split_ptrs):
+            line = LineOrPhrase(text[start:end], start)
+            line.ending = text[end:ending_end]
+            yield line
+
+    # split text on lines or phrases, returning (start, end, ending end) offsets
+    # of the phrases: the phrase is text[start:end] and its ending is text[end:ending end]
+    def split_text_on_line_offsets(self,
+                                   text: str,
+                                   line_split_ptrs: LineSplitParams = None) -> \
+            Generator[Tuple[int, int, int], None, None]:
+        phrase = None  # (start, end) of the last phrase found
+        last_end = 0
+        for break_start, break_end in self.get_line_breaks_in_text(text, line_split_ptrs):
+            if break_start > last_end:
+                if phrase:
+                    yield phrase[0], phrase[1], last_end
+                phrase = (last_end, break_start)
+            last_end = break_end
+
+        if len(text) > last_end:
+            if phrase:
+                yield phrase[0], phrase[1], last_end
+            phrase = (last_end, len(text))
+            last_end = len(text)
+        if phrase:
+            yield phrase[0], phrase[1], last_end
+
+    # find (start, end) of the line break sequences
+    # except the line break characters within the abbreviations
+    def get_line_breaks_in_text(self,
+                                text: str,
+                                line_split_ptrs: LineSplitParams = None) -> \
+            Generator[Tuple[int, int], None, None]:
         ptrs = line_split_ptrs or self.line_split_params
-        line = None
-        text_ended = False
-        i = -1
+        break_chars = frozenset(c for c in ptrs.line_breaks if len(c) == 1)
+        if not break_chars:
+            return
+        reg_breaks = self.reg_line_breaks.get(break_chars)
+        if reg_breaks is None:
+            reg_breaks = re.compile('[' + ''.join(re.escape(c) for c in sorted(break_chars)) + ']+')
+            self.reg_line_breaks[break_chars] = reg_breaks
 
         # mark text with abbreviations:
         # - we doesn't split the text if we are within an abbreviation
         abr_coords = self.get_abbreviations_in_text(text)
         coord_index = 0 if abr_coords else -1
 
-        for ch in text:
-            i += 1
-
-            # should we break the line?
-            if ch in ptrs.line_breaks:
+        for match in reg_breaks.finditer(text):
+            # the sequence ends before the current abbreviation
+            if coord_index < 0 or match.end() <= abr_coords[coord_index][0]:
+                yield match.span()
+                continue
 
+            break_start = -1
+            for i in range(match.start(), match.end()):
                 # are we inside abbreviation?
                 inside_abr = False
                 while coord_index >= 0:
@@ -154,27 +196,14 @@ class LineProcessor:
                             continue
                     inside_abr = i >= coords[0]
                     break
-                if not inside_abr:
-                    if line is not None:
-                        text_ended = True
-                        line.ending += ch
-                    continue
-
-            if line is None:
-                line = LineOrPhrase(ch, i)
-                continue
-
-            if text_ended:
-                new_line = LineOrPhrase(ch, i)
-                yield line
-                line = new_line
-                text_ended = False
-            else:
-                line.text += ch
-
-        if line is not None:
-            if len(line.text) > 0:
-                yield line
+                if inside_abr:
+                    if break_start >= 0:
+                        yield break_start, i
+                        break_start = -1
+                elif break_start < 0:
+                    break_start = i
+            if break_start >= 0:
+                yield break_start, match.end()
 
     def get_abbreviations_in_text(self,
                                   text: str) -> List[Tuple[int, int]]:
@@ -7,32 +7,175 @@ __email__ = "support@contraxsuite.com"
 
 
 import re
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Mapping, Optional, Pattern, Tuple
+
+from lexnlp.utils.phrase_trie import get_alternation_pattern
 
 
 PhraseMatch = Tuple[str, int, int]
 
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+# inline flags, e.g. "(?i)", change how the whole regex matches its words
+INLINE_FLAGS_RE = re.compile(r'\(\?[aiLmsux-]')
+# a part of the phrase of word characters and the ASCII punctuation marks matching only themselves
+LITERAL_PART_RE = re.compile(r'(?:\w|[!"#%&\',/:;<=>@`~-])+', re.UNICODE)
+
+
+class CompiledPatterns(Mapping):
+    """
+    The phrases' regexes {phrase: re.compile(pattern, flags)}, each compiled on first use.
+    Pickled without the compiled regexes, so that unpickling doesn't compile them all.
+    """
+    def __init__(self, patterns: Dict[str, str], flags: int):
+        self.patterns = patterns
+        self.flags = flags
+        self.compiled = {}  # type: Dict[str, Pattern]
+
+    def __getitem__(self, phrase: str) -> Pattern:
+        regex = self.compiled.get(phrase)
+        if regex is None:
+            regex = re.compile(self.patterns[phrase], self.flags)
+            self.compiled[phrase] = regex
+        return regex
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __getstate__(self):
+        return {'patterns': self.patterns, 'flags': self.flags, 'compiled': {}}
+
+
+class PhraseAnchorIndex:
+    """
+    The phrases' anchors (see PhraseFinder) found in a text with one regex: the alternation
+    of the anchors compiled as a trie (see get_alternation_pattern). The regex engine matches
+    the anchors ignoring case the same way it matches the phrases' regexes.
+    The regex is compiled on first use and is not pickled.
+    """
+    def __init__(self, phrases: List[str], anchors: List[Optional[str]], flags: int):
+        """
+        :param anchors: the anchor of each phrase, None for the phrases without anchor
+        """
+        self.phrases = phrases
+        self.flags = flags
+        self.ignore_case = bool(flags & re.IGNORECASE)
+        if self.ignore_case:
+            # the lowercase form of "İ" is "i̇" (two characters) that doesn't match "İ" any more
+            anchors = [None if anchor is None or len(anchor.lower()) != len(anchor) else anchor
+                       for anchor in anchors]
+        self.unanchored = [i for i, anchor in enumerate(anchors) if anchor is None]
+        # anchor (lowercase if ignoring case): indexes of its phrases
+        self.anchor_phrases = {}  # type: Dict[str, List[int]]
+        for i, anchor in enumerate(anchors):
+            if anchor is not None:
+                self.anchor_phrases.setdefault(self.get_key(anchor), []).append(i)
+        self.keys_by_length = {}  # type: Dict[int, List[str]]
+        for key in self.anchor_phrases:
+            self.keys_by_length.setdefault(len(key), []).append(key)
+        # anchor: the other anchors the regex engine matches as the same word (e.g. "ſtadt" and "stadt")
+        self.equivalent_keys = self.find_equivalent_keys() if self.ignore_case else {}
+        self.pattern = r'\b(?:' + get_alternation_pattern(sorted(self.anchor_phrases), self.ignore_case) + r')\b' \
+            if self.anchor_phrases else None
+        self.regex = None  # type: Optional[Pattern]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['regex'] = None
+        return state
+
+    def get_key(self, word: str) -> str:
+        return word.lower() if self.ignore_case else word
+
+    def find_equivalent_keys(self) -> Dict[str, List[str]]:
+        # the ASCII words are equal ignoring case only if their lowercase forms are equal, so
+        # only the anchors having other characters are compared with the anchors of the same length
+        equivalent_keys = {}
+        for key in self.anchor_phrases:
+            if key.isascii():
+                continue
+            key_regex = re.compile(re.escape(key), self.flags)
+            for other_key in self.keys_by_length[len(key)]:
+                if other_key != key and key_regex.fullmatch(other_key):
+                    equivalent_keys.setdefault(key, set()).add(other_key)
+                    equivalent_keys.setdefault(other_key, set()).add(key)
+        return {key: sorted(other_keys) for key, other_keys in equivalent_keys.items()}
+
+    def get_candidate_phrases(self, text: str) -> List[str]:
+        """
+        Get the phrases which regexes may match the text, in the order they were passed to the finder.
+        """
+        if not self.anchor_phrases:
+            return list(self.phrases)
+        if self.regex is None:
+            self.regex = re.compile(self.pattern, self.flags)
+        phrase_indexes = list(self.unanchored)
+        found_keys = set()
+        for word in {match.group() for match in self.regex.finditer(text)}:
+            for key in self.get_word_keys(word):
+                if key not in found_keys:
+                    found_keys.add(key)
+                    phrase_indexes.extend(self.anchor_phrases[key])
+        phrase_indexes.sort()
+        return [self.phrases[i] for i in phrase_indexes]
+
+    def get_word_keys(self, word: str) -> List[str]:
+        """
+        The anchors the word of the text was matched as.
+        """
+        key = self.get_key(word)
+        if key in self.anchor_phrases:
+            return [key] + self.equivalent_keys.get(key, [])
+        # the word's lowercase form differs from the anchor's one, e.g. "İSTANBUL" matched as "istanbul"
+        return [key for key in self.keys_by_length.get(len(word), [])
+                if re.fullmatch(re.escape(key), word, self.flags)]
+
 
 class PhraseFinder:
     """
     The class contains a collection of short string (usually 1 or 2 or 3 words)
     PhraseFinder searches for these strings (phrases) in the text given, either
     ignoring or regarding the case
+
+    Each phrase is a regular expression but the finder doesn't run all of them over the text.
+    A phrase usually contains a whole word literally (e.g. "Stuttgart" in
+    "Amtsgericht Stuttgart"), this word is the phrase's anchor. The finder finds the anchors
+    of the text in one pass and runs only the regexes whose anchors are among them
+    (plus the few regexes that have no anchor at all). The regexes are compiled on first use.
     """
 
+    # what the phrase's regex matches before and after the phrase
+    PHRASE_BORDER = '(\\b|\\s)'
+    # what the phrase's regex matches for a space of the phrase
+    SPACE_PATTERN = r'[\s]+'
+
     def __init__(self, phrase_set: List[str], extra_format_function=None):
         self.extra_format_function = extra_format_function
-        self.word_re_ig = dict((v, self.word_to_regex(v, True)) for v in phrase_set)
-        self.word_re_cs = dict((v, self.word_to_regex(v, False)) for v in phrase_set)
+        subphrases = dict((v, self.word_to_subphrase(v)) for v in phrase_set)
+        patterns = {v: self.PHRASE_BORDER + subphrase + self.PHRASE_BORDER for v, subphrase in subphrases.items()}
+        self.word_re_ig = CompiledPatterns(patterns, re.IGNORECASE | re.UNICODE)
+        self.word_re_cs = CompiledPatterns(patterns, re.UNICODE)
+        anchors = [self.get_phrase_anchor(subphrase) for subphrase in subphrases.values()]
+        self.anchors_ig = PhraseAnchorIndex(list(patterns), anchors, re.IGNORECASE | re.UNICODE)
+        self.anchors_cs = PhraseAnchorIndex(list(patterns), anchors, re.UNICODE)
 
-    def word_to_regex(self, word: str, ignore_case: bool) -> str:
-        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
-        subphrase = word.replace(r'\t', ' ').strip(' ').replace('  ', ' ').replace(' ', r'[\s]+')
+    def word_to_subphrase(self, word: str) -> str:
+        # " Amtsgericht Stuttgart" ->  "Amtsgericht[\s]+Stuttgart"
+        subphrase = word.replace(r'\t', ' ').strip(' ').replace('  ', ' ').replace(' ', self.SPACE_PATTERN)
         if self.extra_format_function is not None:
             subphrase = self.extra_format_function(subphrase)
-        sps = '(\\b|\\s)'
-        return re.compile(sps + subphrase + sps, re.IGNORECASE | re.UNICODE) if ignore_case else \
-            re.compile(sps + subphrase + sps, re.UNICODE)
+        return subphrase
+
+    def word_to_pattern(self, word: str) -> str:
+        # " Amtsgericht Stuttgart" ->  "(\b|\s)Amtsgericht[\s]+Stuttgart(\b|\s)"
+        return self.PHRASE_BORDER + self.word_to_subphrase(word) + self.PHRASE_BORDER
+
+    def word_to_regex(self, word: str, ignore_case: bool) -> Pattern:
+        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
+        return re.compile(self.word_to_pattern(word), re.IGNORECASE | re.UNICODE) if ignore_case else \
+            re.compile(self.word_to_pattern(word), re.UNICODE)
 
     def find_word(self, phrase: str, ignore_case: bool = True) -> List[PhraseMatch]:
         """
@@ -45,8 +188,68 @@ class PhraseFinder:
         """
         matches = []
         match_dict = self.word_re_ig if ignore_case else self.word_re_cs
+        anchor_index = self.anchors_ig if ignore_case else self.anchors_cs
 
-        for k, v in match_dict.items():
-            for match in v.finditer(phrase):
+        for k in anchor_index.get_candidate_phrases(phrase):
+            for match in match_dict[k].finditer(phrase):
                 matches.append((k, match.start(), match.end()))
         return matches
+
+    @classmethod
+    def get_phrase_anchor(cls, subphrase: str) -> Optional[str]:
+        """
+        Find the longest word the phrase's regex always matches as a whole word of the text:
+        "C.D.[\\s]+Illinois" -> "Illinois", "Court[s]?" -> None.
+        The words are taken from the parts of the phrase between its spaces that match only
+        themselves: "Baden-Württemberg" -> "Baden", "Württemberg".
+        """
+        # an alternative or an inline flag may skip or change any word
+        if '|' in subphrase or INLINE_FLAGS_RE.search(subphrase):
+            return None
+        anchor = None
+        for part in cls.split_on_spaces(subphrase):
+            if not LITERAL_PART_RE.fullmatch(part):
+                continue
+            for word in WORD_RE.findall(part):
+                if anchor is None or len(word) > len(anchor):
+                    anchor = word
+        return anchor
+
+    @classmethod
+    def split_on_spaces(cls, subphrase: str) -> List[str]:
+        """
+        Split the phrase on its spaces (SPACE_PATTERN) except the ones within groups, sets or escapes.
+        :return: [] if the groups or the sets are not closed
+        """
+        parts = []
+        depth = 0
+        part_start = i = 0
+        while i < len(subphrase):
+            if depth == 0 and subphrase.startswith(cls.SPACE_PATTERN, i):
+                parts.append(subphrase[part_start:i])
+                i += len(cls.SPACE_PATTERN)
+                part_start = i
+                continue
+            char = subphrase[i]
+            if char == '\\':
+                i += 2
+                continue
+            if char == '[':
+                # a set's "]" goes after its first character ("[]a]") or after an escape
+                i += 2 if subphrase.startswith('[^', i) else 1
+                i += 1
+                while i < len(subphrase) and subphrase[i] != ']':
+                    i += 2 if subphrase[i] == '\\' else 1
+                if i >= len(subphrase):
+                    return []
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth < 0:
+                    return []
+            i += 1
+        if depth:
+            return []
+        parts.append(subphrase[part_start:])
+        return parts
@@ -0,0 +1,84 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+# the value get() returns for a missing key when None is a cached value
+_MISSING = object()
+
+
+class LruCache:
+    """
+    Thread-safe cache of the last max_size distinct keys' values, e.g. the parsed values of
+    the strings repeated across the documents processed by the same process:
+
+        cache = LruCache(10000)
+        value = cache.get_or_compute(key, lambda: parse(text))
+        print(cache.hits, cache.misses)
+
+    None is cached as any other value. The exceptions raised by the function computing the value
+    are not cached. Unlike functools.lru_cache the cache can be resized or turned off (max_size = 0).
+    get() and put() let the caller compute the missing values in batches.
+    """
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self.items = OrderedDict()  # type: OrderedDict[Hashable, Any]
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the key's cached value or compute and cache the value.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the key's cached value or default, counting the hit or the miss.
+        """
+        with self._lock:
+            if key in self.items:
+                self.hits += 1
+                self.items.move_to_end(key)
+                return self.items[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value evicting the least recently used one if the cache is full.
+        """
+        if not self.max_size:
+            return
+        with self._lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            if len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def set_max_size(self, max_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            while len(self.items) > max_size:
+                self.items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.items.clear()
+            self.hits = self.misses = 0
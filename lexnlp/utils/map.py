@@ -30,6 +30,9 @@ class Map(dict):
                 a_dict[key] = Map(val)
 
     def __getattr__(self, attr):
+        # special methods (e.g. pickle's __setstate__) are not dictionary keys
+        if attr.startswith('__') and attr.endswith('__'):
+            raise AttributeError(attr)
         return self.get(attr)
 
     def __setattr__(self, key, value):
@@ -0,0 +1,248 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class ModelLoadInfo:
+    """
+    Time and memory spent loading a model.
+    memory_bytes is the size of the Python (and NumPy) allocations made during the load that were
+    still alive when the load finished, None if the memory wasn't tracked.
+    """
+    def __init__(self, name: str, load_seconds: float, memory_bytes: Optional[int]):
+        self.name = name
+        self.load_seconds = load_seconds
+        self.memory_bytes = memory_bytes
+
+    def __repr__(self):
+        memory = 'n/a' if self.memory_bytes is None else f'{self.memory_bytes / 1024 / 1024:.1f} MB'
+        return f'{self.name}: {self.load_seconds:.3f} s, {memory}'
+
+
+class LazyModel:
+    """
+    A model (or any other data) loaded on first use.
+
+        PAGE_SEGMENTER = MODEL_REGISTRY.register('en.page_segmenter', lambda: joblib.load(path))
+        PAGE_SEGMENTER.get().predict_proba(...)
+
+    The attributes of the model are available through the LazyModel object as well
+    (PAGE_SEGMENTER.predict_proba(...)). Being a class attribute LazyModel returns the model itself:
+
+        class SectionSegmenterModel:
+            SECTION_SEGMENTER_MODEL = MODEL_REGISTRY.register(...)
+
+        SectionSegmenterModel.SECTION_SEGMENTER_MODEL  # the loaded model
+    """
+    def __init__(self,
+                 name: str,
+                 loader: Callable[[], Any],
+                 registry: 'ModelRegistry',
+                 path: Optional[str] = None,
+                 source_paths: Optional[Iterable[str]] = None):
+        """
+        :param path: the file the loader reads the model from, if any
+        :param source_paths: other files the loaded model depends on, e.g. a word list the loader adds to it
+        """
+        self.name = name
+        self.loader = loader
+        self.registry = registry
+        self.path = path
+        self.source_paths = list(source_paths or [])
+        self.load_info = None  # type: Optional[ModelLoadInfo]
+        self._model = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def get(self) -> Any:
+        if self._loaded:
+            return self._model
+        with self._lock:
+            if not self._loaded:
+                self._model, self.load_info = self.registry.load(self.name, self.loader)
+                self._loaded = True
+        return self._model
+
+    def load(self, loader: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        (Re)load the model with its own loader or with the given one, e.g. from another file format.
+        """
+        with self._lock:
+            self._model, self.load_info = self.registry.load(self.name, loader or self.loader)
+            self._loaded = True
+        return self._model
+
+    def set(self, model: Any) -> None:
+        """
+        Replace the model, e.g. with a retrained one.
+        """
+        with self._lock:
+            self._model = model
+            self._loaded = True
+
+    def unload(self) -> None:
+        """
+        Drop the model so that it is loaded again on the next use.
+        """
+        with self._lock:
+            self._model = None
+            self._loaded = False
+            self.load_info = None
+
+    def __getattr__(self, item):
+        # called for the attributes LazyModel doesn't have: delegate to the model
+        if item.startswith('__') or item in ('_model', '_loaded', '_lock', 'loader', 'registry', 'path', 'source_paths'):
+            raise AttributeError(item)
+        return getattr(self.get(), item)
+
+    def __get__(self, instance, owner):
+        return self.get()
+
+    def __repr__(self):
+        return f'LazyModel({self.name}, {"loaded" if self._loaded else "not loaded"})'
+
+
+class ModelRegistry:
+    """
+    The registry of the models lexnlp loads from its pickled files.
+
+    The models are loaded on first use, so importing a module doesn't cost its models' load time
+    and memory. A process that forks workers can load the models beforehand to share them
+    between the workers:
+
+        MODEL_REGISTRY.preload()  # or MODEL_REGISTRY.preload(['en.sentence_segmenter'])
+        print(MODEL_REGISTRY.get_load_info())
+
+    Only the load time is measured by default. Set track_memory to measure the memory as well:
+    tracemalloc slows down every allocation while a model is loaded.
+    """
+    def __init__(self, track_memory: bool = False):
+        """
+        :param track_memory: measure the memory allocated by the models' loaders with tracemalloc
+        """
+        self.track_memory = track_memory
+        self.models = {}  # type: Dict[str, LazyModel]
+        # the loads tracing the memory: tracemalloc is started by the first one and stopped by the last one
+        self._tracing_loads = 0
+        self._tracing_lock = threading.Lock()
+
+    def register(self,
+                 name: str,
+                 loader: Callable[[], Any],
+                 path: Optional[str] = None,
+                 source_paths: Optional[Iterable[str]] = None) -> LazyModel:
+        """
+        Register the model's loader. Registering the same name twice returns the same LazyModel.
+        :param path: the file the loader reads the model from, if any
+        :param source_paths: other files the loaded model depends on, e.g. a word list the loader adds to it
+        """
+        model = self.models.get(name)
+        if model is None:
+            model = LazyModel(name, loader, self, path=path, source_paths=source_paths)
+            self.models[name] = model
+        return model
+
+    def get(self, name: str) -> Any:
+        return self[name].get()
+
+    def __getitem__(self, name: str) -> LazyModel:
+        try:
+            return self.models[name]
+        except KeyError:
+            raise KeyError(f'Model "{name}" is not registered. Registered models are: ' +
+                           ', '.join(sorted(self.models))) from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.models
+
+    def get_names(self) -> List[str]:
+        return list(self.models)
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> List[ModelLoadInfo]:
+        """
+        Load the models (all registered models by default) that are not loaded yet.
+        The models registered by the modules that are not imported yet aren't known to the registry:
+        import the modules first.
+        :return: load info of the models
+        """
+        names = self.get_names() if names is None else list(names)
+        for name in names:
+            self[name].get()
+        return [self[name].load_info for name in names if self[name].load_info]
+
+    def unload(self, names: Optional[Iterable[str]] = None) -> None:
+        for name in self.get_names() if names is None else names:
+            self[name].unload()
+
+    def get_load_info(self) -> List[ModelLoadInfo]:
+        """
+        Load time and memory of the models loaded so far.
+        """
+        return [model.load_info for model in self.models.values() if model.load_info]
+
+    def load(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        Call the loader measuring the time and memory it takes.
+        The memory of the models loaded by several threads at once includes each other's allocations.
+        :return: (model, ModelLoadInfo)
+        """
+        track_memory = self.track_memory
+        if track_memory:
+            self._start_tracing()
+        try:
+            memory_before = tracemalloc.get_traced_memory()[0] if track_memory else 0
+            start = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - start
+            memory_bytes = max(0, tracemalloc.get_traced_memory()[0] - memory_before) if track_memory else None
+        finally:
+            if track_memory:
+                self._stop_tracing()
+        return model, ModelLoadInfo(name, load_seconds, memory_bytes)
+
+    def _start_tracing(self) -> None:
+        with self._tracing_lock:
+            # tracing started by someone else is left as it is
+            if self._tracing_loads == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing_loads = 1
+            elif self._tracing_loads:
+                self._tracing_loads += 1
+
+    def _stop_tracing(self) -> None:
+        with self._tracing_lock:
+            if self._tracing_loads:
+                self._tracing_loads -= 1
+                if self._tracing_loads == 0:
+                    tracemalloc.stop()
+
+
+MODEL_REGISTRY = ModelRegistry()
+
+
+def get_module_getattr(module_name: str, lazy_attributes: Dict[str, LazyModel]) -> Callable[[str], Any]:
+    """
+    Build the module's __getattr__ (PEP 562) that returns the loaded models
+    under the module-level names they had before they became lazy:
+
+        __getattr__ = get_module_getattr(__name__, {'PAGE_SEGMENTER_MODEL': PAGE_SEGMENTER})
+    """
+    def __getattr__(name: str) -> Any:
+        model = lazy_attributes.get(name)
+        if model is None:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        return model.get()
+    return __getattr__
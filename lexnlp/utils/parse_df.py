@@ -7,11 +7,13 @@ __email__ = "support@contraxsuite.com"
 
 
 import re
-from typing import Generator, List, Union, Tuple
+from typing import Dict, Generator, List, Union, Tuple
 
+import numpy as np
 import pandas as pd
 
 from lexnlp.utils.lines_processing.line_processor import LineProcessor
+from lexnlp.utils.phrase_trie import get_alternation_pattern
 
 
 class DataframeEntityParser:
@@ -74,6 +76,13 @@ class DataframeEntityParser:
         self.collection_patterns = {
                 c[0]: c[1] for c in collection_patterns if c[1]
             }
+        self.row_indices = {col_name: self.get_row_indices(self.dataframe[col_name].values)
+                            for col_name in self.collection_patterns}
+        self.result_values = {col_name: self.dataframe[col_name].values
+                              for col_name in self.result_columns}
+
+    def split_cell_values(self, cell) -> List[str]:
+        return [v for v in cell.split(self.cell_values_separator) if v] if cell else []
 
     def get_collection_ptn(self, collection):
         """
@@ -81,14 +90,36 @@ class DataframeEntityParser:
         :param collection: list of entities to search in
         :return: compilled regex pattern
         """
-        collection = [c for c in collection if c]
+        collection = [j for i in collection for j in self.split_cell_values(i)]
         if not collection:
             return None
 
-        ptn = self.SEARCH_PTN.format(
-            '|'.join(re.escape(j) for i in collection for j in i.split(self.cell_values_separator) if i))
+        ptn = self.SEARCH_PTN.format(get_alternation_pattern(collection))
         return re.compile(ptn)
 
+    def get_row_indices(self, collection) -> Dict[str, List[int]]:
+        """
+        Map each value of the column's cells to the positions of the rows containing the value,
+        ordered by priority_sort_column if the column values are unique (the first row is the result)
+        :param collection: column values
+        :return: {value: [row position, ...]}
+        """
+        row_order = range(len(collection))
+        if self.priority_sort_column and self.unique_column_values:
+            # the rows of equal priority keep their order as in DataFrame.sort_values
+            priorities = self.dataframe[self.priority_sort_column].values
+            if self.priority_sort_ascending:
+                row_order = np.argsort(priorities, kind='stable')
+            else:
+                row_order = len(priorities) - 1 - np.argsort(priorities[::-1], kind='stable')[::-1]
+        row_indices = {}  # type: Dict[str, List[int]]
+        for position in row_order:
+            for value in self.split_cell_values(collection[position]):
+                positions = row_indices.setdefault(value, [])
+                if not positions or positions[-1] != position:
+                    positions.append(int(position))
+        return row_indices
+
     def get_single_result(self, rows):
         """
         By default we mean that all values we filter by in dataframe are UNIQUE, so just take 1st
@@ -114,17 +145,21 @@ class DataframeEntityParser:
             'source': matched_str
         }
         if self.result_columns:
-            matched_rows = self.dataframe[self.dataframe[col_name].str.contains(r'(?:^|;){}(?:$|;)'.format(matched_str), regex=True)]
+            positions = self.row_indices[col_name][matched_str]
             if self.unique_column_values:
-                matched_row = self.get_single_result(matched_rows)
-                for _col_name, new_col_name in self.result_columns.items():
-                    formed_entity[new_col_name] = matched_row[_col_name]
+                if type(self).get_single_result is not DataframeEntityParser.get_single_result:
+                    matched_row = self.get_single_result(self.dataframe.iloc[sorted(positions)])
+                    for _col_name, new_col_name in self.result_columns.items():
+                        formed_entity[new_col_name] = matched_row[_col_name]
+                else:
+                    for _col_name, new_col_name in self.result_columns.items():
+                        formed_entity[new_col_name] = self.result_values[_col_name][positions[0]]
             else:
                 formed_entity["entities"] = []
-                for _, matched_row in matched_rows.iterrows():
+                for position in positions:
                     sub_entity = {}
                     for _col_name, new_col_name in self.result_columns.items():
-                        sub_entity[new_col_name] = matched_row[_col_name]
+                        sub_entity[new_col_name] = self.result_values[_col_name][position]
                     formed_entity["entities"].append(sub_entity)
 
         formed_entity.update(self.preformed_entity)
@@ -0,0 +1,132 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple
+
+import regex as re
+
+
+class PhraseTrie:
+    """
+    Character trie for finding all occurrences of many phrases in one pass over the text.
+
+    Example:
+    trie = PhraseTrie()
+    trie.add(' new york ', 1)
+    trie.add(' york ', 2)
+    list(trie.find_all(' new york city '))  # [(0, 10, [1]), (4, 10, [2])]
+
+    Unlike the consecutive str.find calls per phrase the search time depends on the text length
+    (and the depth of the partial matches) rather than on the number of phrases.
+    The trie consists of plain dicts so it can be pickled with the objects that hold it.
+    """
+    # key of the node's value list, never clashes with a single character key
+    VALUES_KEY = ''
+
+    def __init__(self):
+        self.root = {}  # type: Dict[str, Any]
+        self.phrases_count = 0
+
+    def add(self, phrase: str, value: Any) -> None:
+        """
+        Add the value to the phrase's node. The same phrase may store several values.
+        """
+        if not phrase:
+            raise ValueError('Empty phrase can not be added to PhraseTrie')
+        node = self.root
+        for char in phrase:
+            child = node.get(char)
+            if child is None:
+                child = {}
+                node[char] = child
+            node = child
+        values = node.get(self.VALUES_KEY)
+        if values is None:
+            values = []
+            node[self.VALUES_KEY] = values
+            self.phrases_count += 1
+        values.append(value)
+
+    def get(self, phrase: str) -> List[Any]:
+        """
+        Get the values stored for the exact phrase.
+        """
+        node = self.root
+        for char in phrase:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(self.VALUES_KEY, []) if phrase else []
+
+    def find_all(self, text: str) -> Generator[Tuple[int, int, List[Any]], None, None]:
+        """
+        Find all (including overlapping) occurrences of the phrases in the text.
+        :return: (start, end, values) tuples ordered by start, then by end
+        """
+        root = self.root
+        values_key = self.VALUES_KEY
+        text_len = len(text)
+        for start, char in enumerate(text):
+            node = root.get(char)
+            end = start + 1
+            while node is not None:
+                values = node.get(values_key)
+                if values is not None:
+                    yield start, end, values
+                if end == text_len:
+                    break
+                node = node.get(text[end])
+                end += 1
+
+    def __len__(self):
+        return self.phrases_count
+
+
+def get_alternation_pattern(phrases: Sequence[str], ignore_case: bool = False) -> str:
+    """
+    Build the regex matching the same as '|'.join(re.escape(p) for p in phrases), compiled as a character trie:
+    get_alternation_pattern(['A.', 'A.2d', 'B.']) == '(?:A\\.(?:|2d)|B\\.)'.
+
+    At each position the regex engine tries the phrases sharing a prefix within one branch instead of
+    trying every phrase. The trie tries the phrases in the alternation's order if every phrase goes
+    before the phrases it is a prefix of (compared case-insensitively if ignore_case), as in sorted lists.
+    Otherwise the plain alternation is returned.
+    """
+    trie = PhraseTrie()
+    for index, phrase in enumerate(phrases):
+        trie.add(phrase.lower() if ignore_case else phrase, index)
+    pattern = _get_node_pattern(trie.root)[0] if trie.root else None
+    if pattern is None:
+        return '|'.join(re.escape(p) for p in phrases)
+    return pattern
+
+
+def _get_node_pattern(node: Dict[str, Any]) -> Tuple[Optional[str], int]:
+    """
+    :return: the pattern of the node's suffixes (None if the trie can't keep the phrases' order)
+             and the first index of the node's phrases
+    """
+    options = []  # type: List[Tuple[int, str]]
+    for char, child in node.items():
+        if char == PhraseTrie.VALUES_KEY:
+            continue
+        child_pattern, child_index = _get_node_pattern(child)
+        if child_pattern is None:
+            return None, 0
+        options.append((child_index, re.escape(char) + child_pattern))
+    options.sort()
+    values = node.get(PhraseTrie.VALUES_KEY)
+    if values:
+        index = min(values)
+        # the phrase ending here is tried before its continuations
+        if options and options[0][0] < index:
+            return None, 0
+        options.insert(0, (index, ''))
+    if len(options) == 1:
+        return options[0][1], options[0][0]
+    return '(?:' + '|'.join(p for _, p in options) + ')', options[0][0]
@@ -0,0 +1,190 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import gc
+import hashlib
+import os
+import sys
+import tempfile
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import joblib
+
+from lexnlp.utils.cache_dirs import check_private_path, get_user_cache_dir, make_private_dir
+from lexnlp.utils.model_registry import LazyModel, ModelLoadInfo, ModelRegistry, MODEL_REGISTRY
+
+
+# the libraries the pickled models depend on: a model converted by another version is converted again
+MODEL_LIBRARIES = ['joblib', 'numpy', 'scikit-learn', 'nltk']
+
+
+class MemoryUsage:
+    """
+    Memory of the process (or of some of its mappings) in bytes, read from /proc/<pid>/smaps.
+    shared is the resident memory shared with other processes, e.g. the models' pages shared
+    by the forked workers; pss counts each shared page divided by the number of the processes sharing it.
+    """
+    def __init__(self, rss: int = 0, pss: int = 0, shared: int = 0, private: int = 0):
+        self.rss = rss
+        self.pss = pss
+        self.shared = shared
+        self.private = private
+
+    def __repr__(self):
+        return ', '.join(f'{key}: {value / 1024 / 1024:.1f} MB' for key, value in self.__dict__.items())
+
+
+def read_memory_usage(pid: Optional[int] = None,
+                      mapping_filter: Optional[Callable[[str], bool]] = None) -> Optional[MemoryUsage]:
+    """
+    Sum the memory of the process' mappings (those whose path passes mapping_filter if specified).
+    :return: None where /proc/<pid>/smaps is not available (not Linux)
+    """
+    smaps_path = f'/proc/{pid or "self"}/smaps'
+    if not os.path.exists(smaps_path):
+        return None
+    usage = MemoryUsage()
+    counted = mapping_filter is None
+    with open(smaps_path, 'r') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if ' ' in key:
+                # mapping header: "address perms offset dev inode [path]"
+                if mapping_filter is not None:
+                    fields = line.split(maxsplit=5)
+                    counted = len(fields) == 6 and mapping_filter(fields[5].rstrip('\n'))
+                continue
+            if not counted:
+                continue
+            if key == 'Rss':
+                usage.rss += int(value.split()[0]) * 1024
+            elif key == 'Pss':
+                usage.pss += int(value.split()[0]) * 1024
+            elif key in ('Shared_Clean', 'Shared_Dirty'):
+                usage.shared += int(value.split()[0]) * 1024
+            elif key in ('Private_Clean', 'Private_Dirty'):
+                usage.private += int(value.split()[0]) * 1024
+    return usage
+
+
+class SharedModelStore:
+    """
+    Loads the registry's models once, in the parent process, so that the forked worker processes
+    (Celery or gunicorn prefork) share them instead of making private copies.
+
+        # in the master process before the workers are forked, e.g. gunicorn's on_starting hook
+        import lexnlp.extract.en.dates
+        import lexnlp.nlp.en.segments.sentences
+        store = SharedModelStore('/var/cache/lexnlp/models')
+        store.prepare()
+
+        # in a worker
+        print(store.get_memory_usage(), store.get_mapped_memory_usage())
+
+    The models read from files are converted once to uncompressed joblib files in cache_dir
+    and loaded with mmap_mode, so their NumPy arrays are read-only pages of the mapped files
+    that all the processes share through the page cache. cache_dir is created readable by its
+    owner only, and the files are loaded only if they and cache_dir belong to the current user
+    and are not writable by other users: joblib.load unpickles them. Note that some estimators
+    (e.g. sklearn trees) copy the arrays to their own buffers while being unpickled.
+    gc.freeze() then moves the objects loaded so far to the permanent generation: the workers'
+    garbage collector doesn't visit them and doesn't dirty their copy-on-write pages.
+    """
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 registry: ModelRegistry = MODEL_REGISTRY,
+                 mmap_mode: Optional[str] = 'r'):
+        """
+        :param cache_dir: directory of the converted models, the user's ~/.cache/lexnlp/models by default
+        :param mmap_mode: joblib's mmap_mode, "r" (read-only) or "c" (copy-on-write) arrays
+        """
+        self.cache_dir = cache_dir or get_user_cache_dir('models')
+        self.registry = registry
+        self.mmap_mode = mmap_mode
+
+    def prepare(self, names: Optional[Iterable[str]] = None, freeze: bool = True) -> List[ModelLoadInfo]:
+        """
+        Load the models (all registered models by default), memory mapping the ones read from files.
+        :param freeze: call gc.freeze() after the models are loaded
+        :return: load info of the models
+        """
+        names = self.registry.get_names() if names is None else list(names)
+        for name in names:
+            model = self.registry[name]
+            if model.path:
+                self.load_mapped(model)
+            else:
+                model.get()
+        if freeze:
+            gc.collect()
+            gc.freeze()
+        return [self.registry[name].load_info for name in names if self.registry[name].load_info]
+
+    def load_mapped(self, model: LazyModel) -> Any:
+        """
+        Load the model from its converted file, converting the model first if needed.
+        Raise PermissionError if another user could have written cache_dir or the file.
+        """
+        make_private_dir(self.cache_dir)
+        cache_path = self.get_cache_path(model)
+        if not os.path.exists(cache_path):
+            self.convert(model, cache_path)
+        check_private_path(cache_path)
+        return model.load(lambda: joblib.load(cache_path, mmap_mode=self.mmap_mode))
+
+    def convert(self, model: LazyModel, cache_path: str) -> None:
+        make_private_dir(self.cache_dir)
+        # the model as its loader returns it (not the model possibly replaced with LazyModel.set)
+        obj = model.loader()
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            joblib.dump(obj, tmp_path)
+            # other processes either see the complete file or don't see it
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get_cache_path(self, model: LazyModel) -> str:
+        """
+        The converted file depends on the size and modification time of the source file and of
+        the other files the model depends on (model.source_paths), and on the versions of Python
+        and the libraries the models are pickled with.
+        """
+        key = [sys.version]
+        for path in [model.path] + model.source_paths:
+            key.append(os.path.abspath(path))
+            if os.path.exists(path):
+                stat = os.stat(path)
+                key += [str(stat.st_size), str(stat.st_mtime_ns)]
+        for library in MODEL_LIBRARIES:
+            try:
+                key.append(f'{library}={metadata.version(library)}')
+            except metadata.PackageNotFoundError:
+                pass
+        digest = hashlib.sha1('\n'.join(key).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f'{model.name}.{digest}.joblib')
+
+    def get_cache_paths(self) -> Dict[str, str]:
+        return {name: self.get_cache_path(model) for name, model in self.registry.models.items() if model.path}
+
+    @staticmethod
+    def get_memory_usage(pid: Optional[int] = None) -> Optional[MemoryUsage]:
+        """
+        Memory of the whole process: compare the shared and the private memory of a worker.
+        """
+        return read_memory_usage(pid)
+
+    def get_mapped_memory_usage(self, pid: Optional[int] = None) -> Optional[MemoryUsage]:
+        """
+        Memory of the process' mappings of the converted model files.
+        """
+        cache_dir = os.path.join(os.path.realpath(self.cache_dir), '')
+        return read_memory_usage(pid, lambda path: path.startswith(cache_dir))
@@ -0,0 +1,96 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from lexnlp.utils.dictionary_cache import DictionaryCache
+from lexnlp.utils.model_registry import ModelRegistry
+
+
+class TestDictionaryCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, 'names.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write('name\nAcme\n')
+        self.builds = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_names(self):
+        with open(self.csv_path) as f:
+            names = f.read().split()[1:]
+        self.builds.append(names)
+        return names
+
+    def register(self) -> DictionaryCache:
+        cache = DictionaryCache(os.path.join(self.temp_dir.name, 'cache'), ModelRegistry())
+        cache.register('test.names', self.build_names, [self.csv_path, self.csv_path + '.missing'])
+        return cache
+
+    def test_load(self):
+        cache = self.register()
+        self.assertEqual([], self.builds)
+        self.assertEqual(['Acme'], cache.registry.get('test.names'))
+        self.assertTrue(os.path.isfile(cache.get_cache_path('test.names')))
+
+        # another process reads the file
+        self.assertEqual(['Acme'], self.register().registry.get('test.names'))
+        self.assertEqual(1, len(self.builds))
+
+        # the source file is changed
+        with open(self.csv_path, 'a') as f:
+            f.write('Globex\n')
+        self.assertEqual(['Acme', 'Globex'], self.register().registry.get('test.names'))
+        self.assertEqual(2, len(self.builds))
+
+    def test_corrupt_file(self):
+        cache = self.register()
+        os.makedirs(cache.cache_dir)
+        with open(cache.get_cache_path('test.names'), 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertEqual(['Acme'], cache.registry.get('test.names'))
+        with open(cache.get_cache_path('test.names'), 'rb') as f:
+            self.assertEqual(cache.get_header('test.names'), pickle.load(f))
+
+    def test_build(self):
+        cache = self.register()
+        self.assertEqual([cache.get_cache_path('test.names')], cache.build())
+        self.assertTrue(cache.registry['test.names'].is_loaded)
+        self.assertEqual(['Acme'], self.register().registry.get('test.names'))
+        self.assertEqual(1, len(self.builds))
+
+    def test_no_cache_dir(self):
+        cache = self.register()
+        cache.cache_dir = None
+        self.assertEqual(['Acme'], cache.registry.get('test.names'))
+        self.assertEqual(['Acme'], cache.load('test.names'))
+        self.assertEqual(2, len(self.builds))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, 'cache')))
+        self.assertRaises(ValueError, cache.build)
+
+    def test_writable_by_others(self):
+        cache = self.register()
+        cache.build()
+        path = cache.get_cache_path('test.names')
+        # a file someone else could have replaced is not unpickled
+        with open(path, 'wb') as f:
+            pickle.dump(cache.get_header('test.names'), f)
+            pickle.dump(['Replaced'], f)
+        os.chmod(path, 0o666)
+        self.assertEqual(['Acme'], self.register().registry.get('test.names'))
+        self.assertEqual(2, len(self.builds))
+        self.assertEqual(0o600, os.stat(path).st_mode & 0o777)
+
+        os.chmod(cache.cache_dir, 0o777)
+        self.assertEqual(['Acme'], self.register().registry.get('test.names'))
+        self.assertEqual(3, len(self.builds))
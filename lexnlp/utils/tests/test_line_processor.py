@@ -113,3 +113,17 @@ As of some one gently rapping, rapping at my chamber door."""
         text = '1000 A.d. und drang'
         sents = list(proc.split_text_on_line_with_endings(text))
         self.assertGreater(len(sents), 1)
+
+    def test_line_offsets(self):
+        split_params = LineSplitParams()
+        split_params.line_breaks = {'\n', '.', ';'}
+        split_params.abbreviations = {'nr.'}
+        text = '.Article nr. 2;\n see p. 3.'
+        proc = LineProcessor(line_split_params=split_params)
+        offsets = list(proc.split_text_on_line_offsets(text))
+        self.assertEqual([(1, 14, 16), (16, 22, 23), (23, 25, 26)], offsets)
+
+        lines = list(proc.split_text_on_line_with_endings(text))
+        self.assertEqual(['Article nr. 2', ' see p', ' 3'], [line.text for line in lines])
+        self.assertEqual([';\n', '.', '.'], [line.ending for line in lines])
+        self.assertEqual([1, 16, 23], [line.start for line in lines])
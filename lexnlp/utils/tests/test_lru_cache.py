@@ -0,0 +1,57 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+from unittest import TestCase
+
+from lexnlp.utils.lru_cache import LruCache
+
+
+class TestLruCache(TestCase):
+    def test_lru(self):
+        cache = LruCache(2)
+        calls = []
+
+        def compute(key):
+            calls.append(key)
+            return None if key == 'b' else key.upper()
+
+        self.assertEqual('A', cache.get_or_compute('a', lambda: compute('a')))
+        self.assertIsNone(cache.get_or_compute('b', lambda: compute('b')))
+        self.assertIsNone(cache.get_or_compute('b', lambda: compute('b')))
+        self.assertEqual('A', cache.get_or_compute('a', lambda: compute('a')))
+        cache.get_or_compute('c', lambda: compute('c'))  # evicts 'b'
+        self.assertEqual(['a', 'c'], list(cache.items))
+        self.assertEqual(['a', 'b', 'c'], calls)
+        self.assertEqual((2, 3), (cache.hits, cache.misses))
+
+        cache.set_max_size(1)
+        self.assertEqual(['c'], list(cache.items))
+        cache.set_max_size(0)
+        cache.get_or_compute('d', lambda: compute('d'))
+        self.assertEqual(0, len(cache))
+
+    def test_get_put(self):
+        cache = LruCache(2)
+        self.assertEqual('default', cache.get('a', 'default'))
+        cache.put('a', None)
+        cache.put('b', 'B')
+        self.assertIsNone(cache.get('a', 'default'))
+        cache.put('c', 'C')  # evicts 'b'
+        self.assertEqual(['a', 'c'], list(cache.items))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        LruCache(0).put('a', 'A')
+
+    def test_exception(self):
+        cache = LruCache(2)
+
+        def compute():
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute('a', compute)
+        self.assertEqual(0, len(cache))
@@ -6,6 +6,7 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+import pickle
 from unittest import TestCase
 from lexnlp.utils.map import Map
 
@@ -23,3 +24,10 @@ class TestMap(TestCase):
         m.name.specie = Map()
         m.name.specie.legal = 'xXx'
         self.assertEqual('xXx', m.name.specie.legal)
+
+    def test_pickle(self):
+        m = Map({'name': {'company': 'Siemens'}, 'age': 108})
+        restored = pickle.loads(pickle.dumps(m))
+        self.assertEqual(m, restored)
+        self.assertEqual('Siemens', restored.name.company)
+        self.assertIsNone(restored.missing)
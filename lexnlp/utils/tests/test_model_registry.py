@@ -0,0 +1,91 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import threading
+import tracemalloc
+from unittest import TestCase
+from lexnlp.utils.model_registry import ModelRegistry, MODEL_REGISTRY
+
+
+class TestModelRegistry(TestCase):
+    def test_lazy_load(self):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {'a': list(range(1000))}
+
+        registry = ModelRegistry(track_memory=True)
+        model = registry.register('test.model', load)
+        self.assertIs(model, registry.register('test.model', load))
+        self.assertFalse(model.is_loaded)
+        self.assertEqual([], calls)
+
+        self.assertEqual(list(range(1000)), model.get()['a'])
+        self.assertIs(model.get(), registry.get('test.model'))
+        self.assertEqual(['a'], list(model.keys()))
+        self.assertEqual(1, len(calls))
+
+        load_info = registry.get_load_info()
+        self.assertEqual(['test.model'], [i.name for i in load_info])
+        self.assertGreater(load_info[0].memory_bytes, 0)
+        self.assertGreaterEqual(load_info[0].load_seconds, 0)
+
+        registry.unload()
+        self.assertFalse(model.is_loaded)
+        registry.preload()
+        self.assertEqual(2, len(calls))
+
+    def test_concurrent_loads(self):
+        registry = ModelRegistry(track_memory=True)
+        first_started, second_loaded = threading.Event(), threading.Event()
+
+        def load_first():
+            first_started.set()
+            second_loaded.wait(10)
+            return list(range(100000))
+
+        def load_second():
+            first_started.wait(10)
+            return 'small'
+
+        first = registry.register('test.first', load_first)
+        second = registry.register('test.second', load_second)
+        thread = threading.Thread(target=first.get)
+        thread.start()
+        second.get()
+        # the second load doesn't stop tracing the first one
+        self.assertTrue(tracemalloc.is_tracing())
+        second_loaded.set()
+        thread.join()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(first.load_info.memory_bytes, 800000)
+
+    def test_class_attribute(self):
+        registry = ModelRegistry()
+
+        class Holder:
+            MODEL = registry.register('test.model', lambda: 'model')
+
+        self.assertEqual('model', Holder.MODEL)
+        self.assertEqual('model', Holder().MODEL)
+        self.assertIsNone(registry['test.model'].load_info.memory_bytes)
+        Holder.MODEL = 'retrained'
+        self.assertEqual('retrained', Holder.MODEL)
+
+    def test_not_registered(self):
+        with self.assertRaises(KeyError):
+            ModelRegistry().get('test.model')
+
+    def test_lexnlp_models(self):
+        from lexnlp.nlp.en import tokens
+        self.assertIn('en.stopwords', MODEL_REGISTRY)
+        self.assertIs(tokens.STOPWORD_SET.get(), tokens.STOPWORDS)
+        self.assertIn('the', tokens.STOPWORDS)
+        with self.assertRaises(AttributeError):
+            _ = tokens.NOT_A_MODEL
@@ -42,3 +42,21 @@ class TestParseDataframe(TestCase):
         parser = DataframeEntityParser(dataframe=entity_df,
                                        parse_columns=columns)
         return list(parser.get_entities(text))
+
+    def test_result_columns(self):
+        df = pd.DataFrame({'name': ['Peppa', 'George (Pig)', 'Peppa;Pep', 'Suzy'],
+                           'rank': [2, 1, 1, 3]})
+        text = 'Pep, Peppa si George (Pig) merg la plimbare.'
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['name'],
+                                       result_columns={'rank': 'rank'}, priority_sort_column='rank')
+        ents = parser.get_entity_list(text)
+        self.assertEqual([('Pep', 1), ('Peppa', 1), ('George (Pig)', 1)],
+                         [(e['source'], e['rank']) for e in ents])
+
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['name'], result_columns={'rank': 'rank'},
+                                       priority_sort_column='rank', priority_sort_ascending=False)
+        self.assertEqual(2, parser.get_entity_list(text)[1]['rank'])
+
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['name'],
+                                       result_columns={'rank': 'rank'}, unique_column_values=False)
+        self.assertEqual([{'rank': 2}, {'rank': 1}], parser.get_entity_list(text)[1]['entities'])
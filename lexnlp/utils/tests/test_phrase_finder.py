@@ -6,6 +6,7 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+import pickle
 from unittest import TestCase
 
 from lexnlp.utils.lines_processing.phrase_finder import PhraseFinder
@@ -21,3 +22,51 @@ class TestPhraseFinder(TestCase):
         finder = PhraseFinder(['C.D. Ill.', 'sh', 'should', 'find'])
         rst = finder.find_word(text, True)
         self.assertEqual(3, len(rst))
+
+    def test_phrase_order_preserved(self):
+        text = 'The Court of Appeals and the court of appeals. Courts of Illinois'
+        finder = PhraseFinder(['Illinois', 'court of appeals', 'Court[s]?'])
+        rst = finder.find_word(text, True)
+        self.assertEqual([('Illinois', 56, 65),
+                          ('court of appeals', 3, 20),
+                          ('court of appeals', 28, 45),
+                          ('Court[s]?', 3, 9),
+                          ('Court[s]?', 28, 34),
+                          ('Court[s]?', 46, 53)], rst)
+
+        rst = finder.find_word(text, False)
+        self.assertEqual([('Illinois', 56, 65),
+                          ('court of appeals', 28, 45),
+                          ('Court[s]?', 3, 9),
+                          ('Court[s]?', 46, 53)], rst)
+
+    def test_phrase_anchor(self):
+        finder = PhraseFinder(['C.D. Illinois', 'Court[s]?', 'Amtsgericht  Stuttgart',
+                               'Baden-Württemberg', 'Court (of )?Appeals', 'Court|Tribunal'])
+        anchors = [finder.get_phrase_anchor(finder.word_to_subphrase(p)) for p in finder.word_re_ig]
+        self.assertEqual(['Illinois', None, 'Amtsgericht', 'Württemberg', 'Court', None], anchors)
+
+    def test_ignore_case_special_chars(self):
+        finder = PhraseFinder(['istanbul court', 'strasse'])
+        rst = finder.find_word('İSTANBUL Court, ſtrasse', True)
+        self.assertEqual([('istanbul court', 0, 14), ('strasse', 15, 23)], rst)
+
+        finder = PhraseFinder(['İstanbul'])
+        self.assertEqual([('İstanbul', 0, 8)], finder.find_word('İstanbul court', True))
+        self.assertEqual([('İstanbul', 0, 8)], finder.find_word('İSTANBUL court', True))
+        self.assertEqual([('İstanbul', 0, 8)], finder.find_word('İstanbul court', False))
+
+        # the anchors "ſtadt" and "stadt" are the same word ignoring case
+        finder = PhraseFinder(['ſtadt', 'STADT', 'kiel'])
+        rst = finder.find_word('Stadt \u212aIEL', True)
+        self.assertEqual([('ſtadt', 0, 5), ('STADT', 0, 5), ('kiel', 5, 10)], rst)
+        self.assertEqual([], finder.find_word('Stadt \u212aIEL', False))
+
+    def test_pickle(self):
+        finder = PhraseFinder(['Supreme Court', 'Court of Appeals'])
+        finder.find_word('The Supreme Court', True)
+        # the regexes are compiled again on first use, not on unpickling
+        finder = pickle.loads(pickle.dumps(finder))
+        self.assertEqual({}, finder.word_re_ig.compiled)
+        self.assertEqual([('Court of Appeals', 3, 20)],
+                         finder.find_word('The Court of Appeals', True))
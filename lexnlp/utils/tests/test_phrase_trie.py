@@ -0,0 +1,58 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import pickle
+from unittest import TestCase
+import regex as re
+
+from lexnlp.utils.phrase_trie import PhraseTrie, get_alternation_pattern
+
+
+class TestPhraseTrie(TestCase):
+    def test_find_all(self):
+        trie = PhraseTrie()
+        trie.add(' new york ', 1)
+        trie.add(' york ', 2)
+        trie.add(' new ', 3)
+        trie.add(' new york ', 4)
+        self.assertEqual(3, len(trie))
+
+        found = list(trie.find_all(' new york and new york city '))
+        self.assertEqual([(0, 5, [3]), (0, 10, [1, 4]), (4, 10, [2]),
+                          (13, 18, [3]), (13, 23, [1, 4]), (17, 23, [2])], found)
+
+    def test_overlapping(self):
+        trie = PhraseTrie()
+        trie.add('aa', 'aa')
+        self.assertEqual([0, 1, 2], [s for s, _e, _v in trie.find_all('aaaa')])
+        self.assertEqual([], list(trie.find_all('')))
+
+    def test_get_and_pickle(self):
+        trie = PhraseTrie()
+        trie.add('abc', 1)
+        trie = pickle.loads(pickle.dumps(trie))
+        self.assertEqual([1], trie.get('abc'))
+        self.assertEqual([], trie.get('ab'))
+        self.assertEqual([], trie.get(''))
+        self.assertRaises(ValueError, trie.add, '', 2)
+
+
+class TestAlternationPattern(TestCase):
+    def test_trie_pattern(self):
+        phrases = ['A.', 'A.2d', 'A.D.', 'a.d. 2d', 'B. (Rep.)']
+        pattern = get_alternation_pattern(phrases, ignore_case=True)
+        self.assertEqual(r'(?:a\.(?:|2d|d\.(?:|\ 2d))|b\.\ \(rep\.\))', pattern)
+
+        flat_re = re.compile(r'\d+ (' + '|'.join(re.escape(p) for p in phrases) + r') \d+', re.IGNORECASE)
+        trie_re = re.compile(r'\d+ (' + pattern + r') \d+', re.IGNORECASE)
+        text = '1 A.2d 3, 4 a. 5, 6 A.D. 2d 7, 8 A.D. 9, 10 b. (REP.) 11, 12 B. 13'
+        self.assertEqual([m.span(1) for m in flat_re.finditer(text)], [m.span(1) for m in trie_re.finditer(text)])
+
+    def test_order_not_kept(self):
+        # the longer phrase goes first: the trie would try "a" first
+        self.assertEqual('ab|a', get_alternation_pattern(['ab', 'a']))
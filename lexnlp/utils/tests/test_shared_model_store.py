@@ -0,0 +1,99 @@
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2021, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/2.3.0/LICENSE"
+__version__ = "2.3.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+import os
+import pickle
+import sys
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from lexnlp.utils.model_registry import ModelRegistry
+from lexnlp.utils.shared_model_store import SharedModelStore
+
+
+class TestSharedModelStore(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_path = os.path.join(self.temp_dir.name, 'model.pickle')
+        with open(self.model_path, 'wb') as f:
+            pickle.dump({'weights': np.arange(100000, dtype=np.float64), 'name': 'model'}, f)
+        self.calls = []
+
+        def load():
+            self.calls.append(1)
+            with open(self.model_path, 'rb') as f:
+                return pickle.load(f)
+
+        self.registry = ModelRegistry()
+        self.model = self.registry.register('test.model', load, path=self.model_path)
+        self.registry.register('test.derived', lambda: self.model.get()['name'].upper())
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_prepare(self):
+        store = SharedModelStore(self.cache_dir, registry=self.registry)
+        load_info = store.prepare(freeze=False)
+        self.assertEqual(['test.model', 'test.derived'], [i.name for i in load_info])
+        self.assertEqual([store.get_cache_path(self.model)], list(store.get_cache_paths().values()))
+        self.assertTrue(os.path.exists(store.get_cache_path(self.model)))
+
+        weights = self.model.get()['weights']
+        self.assertIsInstance(weights, np.memmap)
+        self.assertFalse(weights.flags.writeable)
+        self.assertEqual(4999950000, weights.sum())
+        self.assertEqual('MODEL', self.registry.get('test.derived'))
+
+        # the converted file is reused
+        self.registry.unload()
+        store.prepare(freeze=False)
+        self.assertEqual(1, len(self.calls))
+        self.assertIsInstance(self.model.get()['weights'], np.memmap)
+
+    def test_source_changed(self):
+        store = SharedModelStore(self.cache_dir, registry=self.registry)
+        cache_path = store.get_cache_path(self.model)
+        with open(self.model_path, 'ab') as f:
+            f.write(b'\n')
+        self.assertNotEqual(cache_path, store.get_cache_path(self.model))
+
+    def test_source_paths_changed(self):
+        words_path = os.path.join(self.temp_dir.name, 'words.txt')
+        with open(words_path, 'w') as f:
+            f.write('no\n')
+        model = self.registry.register('test.words', lambda: {}, path=self.model_path, source_paths=[words_path])
+        store = SharedModelStore(self.cache_dir, registry=self.registry)
+        cache_path = store.get_cache_path(model)
+        with open(words_path, 'a') as f:
+            f.write('inc\n')
+        self.assertNotEqual(cache_path, store.get_cache_path(model))
+
+    def test_writable_by_others(self):
+        store = SharedModelStore(self.cache_dir, registry=self.registry)
+        store.prepare(freeze=False)
+        self.assertEqual(0o700, os.stat(self.cache_dir).st_mode & 0o777)
+        os.chmod(store.get_cache_path(self.model), 0o666)
+        self.assertRaises(PermissionError, store.load_mapped, self.model)
+
+        os.chmod(store.get_cache_path(self.model), 0o600)
+        os.chmod(self.cache_dir, 0o777)
+        self.assertRaises(PermissionError, store.load_mapped, self.model)
+
+    def test_memory_usage(self):
+        store = SharedModelStore(self.cache_dir, registry=self.registry)
+        store.prepare(freeze=False)
+        if not sys.platform.startswith('linux'):
+            self.assertIsNone(store.get_memory_usage())
+            return
+        self.assertGreater(store.get_memory_usage().rss, 0)
+        # the weights are read from the mapped file
+        self.model.get()['weights'].sum()
+        self.assertGreaterEqual(store.get_mapped_memory_usage().rss, 800000 - 4096)